@@ -0,0 +1,176 @@
+"""Day 1. Report Repair: the entries in an expense report that add up to 2020."""
+
+from collections import Counter
+from itertools import combinations
+from math import prod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
+
+@fixture
+def example() -> List[str]:
+    return """1721
+979
+366
+299
+675
+1456""".splitlines()
+
+
+TARGET = 2020
+
+
+def useful(values: Sequence[int], target: int, k: int) -> List[int]:
+    """The values that could be in a sum of k of them to target.
+
+    With none negative, a value over target can't be in the sum and no value
+    can be in it more than k times, which leaves at most k * (target + 1)
+    values after this one pass, however long the report is. With negative
+    values nothing can be ruled out and every value is kept.
+    """
+    if not values or min(values) < 0:
+        return list(values)
+    counts = Counter(values)
+    return [i for i, n in counts.items() if i <= target for _ in range(min(n, k))]
+
+
+def two_sum(values: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    seen = set()
+    for value in values:
+        if target - value in seen:
+            return target - value, value
+        seen.add(value)
+    return None
+
+
+def three_sum(values: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    """Each value in turn, with two pointers closing in on the rest."""
+    ordered = sorted(values)
+    for i in range(len(ordered) - 2):
+        if i and ordered[i] == ordered[i - 1]:
+            continue
+        low, high = i + 1, len(ordered) - 1
+        while low < high:
+            total = ordered[i] + ordered[low] + ordered[high]
+            if total == target:
+                return ordered[i], ordered[low], ordered[high]
+            if total < target:
+                low += 1
+            else:
+                high -= 1
+    return None
+
+
+def split_sum(values: Sequence[int], target: int, k: int) -> Optional[Tuple[int, ...]]:
+    """Meet in the middle: k // 2 values from the left of the rest from the right.
+
+    For each sum of k // 2 values, keep the combination that ends earliest.
+    Then each combination of the other values, in order, only needs a left
+    half that ends before it starts.
+    """
+    half = k // 2
+    ends: Dict[int, Tuple[int, ...]] = {}
+    for left in combinations(range(len(values)), half):
+        total = sum(values[i] for i in left)
+        if total not in ends or left[-1] < ends[total][-1]:
+            ends[total] = left
+    for right in combinations(range(len(values)), k - half):
+        left = ends.get(target - sum(values[i] for i in right))
+        if left is not None and left[-1] < right[0]:
+            return tuple(values[i] for i in left + right)
+    return None
+
+
+def k_sum(values: Sequence[int], target: int, k: int) -> Optional[Tuple[int, ...]]:
+    """k of the values (at different places in them) adding up to target, or None.
+
+    For n values left by useful(), that is O(n) for k = 2, O(n^2) for k = 3
+    and O(n^ceil(k/2)) beyond, on top of the O(n) pass of useful() itself.
+    """
+    if k < 1:
+        raise ValueError(f"can't sum {k} values")
+    values = useful(values, target, k)
+    if k == 1:
+        return (target,) if target in values else None
+    if k == 2:
+        return two_sum(values, target)
+    if k == 3:
+        return three_sum(values, target)
+    return split_sum(values, target, k)
+
+
+def test_k_sum() -> None:
+    values = [1721, 979, 366, 299, 675, 1456]
+    assert sorted(k_sum(values, TARGET, 2)) == [299, 1721]
+    assert sorted(k_sum(values, TARGET, 3)) == [366, 675, 979]
+    assert k_sum([1010, 3], TARGET, 2) is None
+    assert k_sum([1010, 3, 1010], TARGET, 2) == (1010, 1010)
+    assert sorted(k_sum([5, -2, 9, 4, 1], 12, 4)) == [-2, 1, 4, 9]
+    assert k_sum([5, 5, 5, 5, 5], 25, 5) == (5, 5, 5, 5, 5)
+    assert k_sum([5, 5, 5, 5], 25, 5) is None
+    assert k_sum([3, 4], 4, 1) == (4,)
+
+
+def test_useful() -> None:
+    assert sorted(useful([7] * 1000 + [3, 50], 10, 2)) == [3, 7, 7]
+    assert useful([-1, 50], 10, 2) == [-1, 50]
+
+
+def test_long_report() -> None:
+    values = [1500 + i % 500 for i in range(1_000_000)] + [600, 700, 720]
+    assert sorted(k_sum(values, TARGET, 3)) == [600, 700, 720]
+    assert k_sum(values, TARGET, 2) is None
+
+
+def entries_product(inputs: List[str], k: int) -> int:
+    found = k_sum([int(i) for i in inputs], TARGET, k)
+    if found is None:
+        raise ValueError(f"no {k} entries sum to {TARGET}")
+    return prod(found)
+
+
+def part1(inputs: List[str]) -> int:
+    return entries_product(inputs, 2)
+
+
+def test_example(example: List[str]) -> None:
+    assert part1(example) == 514579
+    assert part2(example) == 241861950
+    import pytest
+
+    with pytest.raises(ValueError, match="no 2 entries sum to 2020"):
+        part1(["1000", "1019"])
+
+
+def test_part1() -> None:
+    inputs = get_inputs()
+    assert part1(inputs) == 357504
+
+
+def part2(inputs: List[str]) -> int:
+    return entries_product(inputs, 3)
+
+
+def test_part2() -> None:
+    inputs = get_inputs()
+    assert part2(inputs) == 12747392
+
+
+def get_inputs() -> List[str]:
+    return read_lines(__file__)
+
+
+def test_get_inputs() -> None:
+    inputs = get_inputs()
+    assert len(inputs) > 0
+
+
+if __name__ == "__main__":
+    test_get_inputs()
+    inputs = get_inputs()
+    print(part1(inputs))
+    test_part1()
+    print(part2(inputs))
+    test_part2()
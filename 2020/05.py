@@ -1,4 +1,4 @@
-"""Day 5 : Binary Boarding --- 
+"""Day 5 : Binary Boarding ---
 
 You board your plane only to discover a new problem: you dropped your boarding
 pass! You aren't sure which seat is yours, and all of the flight attendants are
@@ -55,41 +55,68 @@ As a sanity check, look through your list of boarding passes. What is the highes
 
 """
 
-import os
-from typing import List, Tuple
+import re
+from typing import List
+
+import numpy as np
+
+from aoc.loader import parsed, read_lines
+
+SEATS = 1024
+SEAT = re.compile("[FB]{7}[LR]{3}")
+# Each letter's bit in a seat ID, first letter highest.
+BIT_VALUES = 1 << np.arange(9, -1, -1, dtype=np.int16)
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
-
-
-def decode_seat_num(in_str: str) -> Tuple[int, int, int]:
-    assert len(in_str) == 10
-    row = in_str[0:7]
-    assert len(row) == 7
-    seat = in_str[7:10]
-    assert len(seat) == 3
-    row_bits = ["1" if i == "B" else "0" for i in row]
-    seat_bits = ["1" if i == "R" else "0" for i in seat]
-    total = ["1" if i in ["B", "R"] else "0" for i in in_str]
-    return (
-        int("".join(row_bits), base=2),
-        int("".join(seat_bits), base=2),
-        int("".join(total), base=2),
-    )
-
-
-def test_decode_seat_num() -> None:
-    assert decode_seat_num("BFFFBBFRRR") == (70, 7, 567)
-    assert decode_seat_num("FFFBBBFRRR") == (14, 7, 119)
-    assert decode_seat_num("BBFFBBFRLL") == (102, 4, 820)
+    return read_lines(__file__)
+
+
+def seat_ids(passes: List[str]) -> np.ndarray:
+    """Every pass's seat ID, decoded in one go as rows of 10 letters."""
+    # Anything but ASCII becomes one "?" byte, which the letter check rejects.
+    letters = np.frombuffer("".join(passes).encode("ascii", "replace"), np.uint8)
+    if letters.size != 10 * len(passes):
+        raise bad_pass(passes)
+    letters = letters.reshape(-1, 10)
+    high = np.where(np.arange(10) < 7, ord("B"), ord("R"))
+    low = np.where(np.arange(10) < 7, ord("F"), ord("L"))
+    if ((letters != high) & (letters != low)).any():
+        raise bad_pass(passes)
+    return (letters == high) @ BIT_VALUES
+
+
+def bad_pass(passes: List[str]) -> ValueError:
+    """The error to raise for the first pass that isn't a seat."""
+    for number, boarding_pass in enumerate(passes, 1):
+        if len(boarding_pass) != 10:
+            return ValueError(f"pass {number}: {boarding_pass!r} isn't 10 letters")
+        if not SEAT.fullmatch(boarding_pass):
+            return ValueError(
+                f"pass {number}: {boarding_pass!r} isn't 7 of F/B then 3 of L/R"
+            )
+    return ValueError("every pass is a seat")
+
+
+def test_seat_ids() -> None:
+    passes = ["BFFFBBFRRR", "FFFBBBFRRR", "BBFFBBFRLL"]
+    ids = seat_ids(passes)
+    assert ids.tolist() == [567, 119, 820]
+    assert (ids >> 3).tolist() == [70, 14, 102]
+    assert (ids & 7).tolist() == [7, 7, 4]
+    import pytest
+
+    with pytest.raises(ValueError, match="pass 2: 'FFFBBBFRR' isn't 10 letters"):
+        seat_ids(["BFFFBBFRRR", "FFFBBBFRR", "BBFFBBFRLLL"])
+    with pytest.raises(ValueError, match="pass 1: 'BFFFBBFRR' isn't 10 letters"):
+        seat_ids(["BFFFBBFRR", "FFFBBBFRRRL"])
+    for bad in ("BFFFBBFRRX", "BFFLBBFRRR", "BFFFBBFRBR", "BFFFBBFRR\u00e9"):
+        with pytest.raises(ValueError, match=f"pass 2: '{bad}' isn't 7 of F/B"):
+            seat_ids(["BFFFBBFRRR", bad])
 
 
 def part1(inputs) -> int:
-    return max(decode_seat_num(i)[2] for i in inputs)
+    return int(parsed(inputs, seat_ids).max())
 
 
 def test_part1() -> None:
@@ -112,13 +139,26 @@ def test_part1() -> None:
 #
 
 
+def find_seat(ids: np.ndarray) -> int:
+    """The empty seat with both neighbours taken, from a map of every seat."""
+    taken = np.zeros(SEATS, dtype=bool)
+    taken[ids] = True
+    gaps = np.flatnonzero(taken[:-2] & ~taken[1:-1] & taken[2:])
+    if len(gaps) != 1:
+        raise ValueError(f"{len(gaps)} seats could be yours")
+    return int(gaps[0]) + 1
+
+
+def test_find_seat() -> None:
+    assert find_seat(np.array([10, 13, 11, 12, 15])) == 14
+    import pytest
+
+    with pytest.raises(ValueError, match="2 seats could be yours"):
+        find_seat(np.array([10, 12, 14]))
+
+
 def part2(inputs) -> int:
-    all_seats = sorted(decode_seat_num(i)[2] for i in inputs)
-    for i, seat_num in enumerate(all_seats):
-        if i > 8:
-            if seat_num - all_seats[i - 1] == 2:
-                return seat_num - 1
-    return 0
+    return find_seat(parsed(inputs, seat_ids))
 
 
 def test_part2() -> None:
@@ -52,12 +52,20 @@ For each group, count the number of questions to which anyone answered "yes". Wh
 
 """
 
-import os
-import pytest
-from typing import List, Iterable, MutableSet
+from string import ascii_lowercase
+from typing import Iterable, Iterator, List, Tuple
 
+from aoc.loader import iter_lines, read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+# Each question's bit, looked up by the byte of its letter.
+QUESTION_BITS = [0] * 256
+for bit, letter in enumerate(ascii_lowercase):
+    QUESTION_BITS[ord(letter)] = 1 << bit
+ALL_QUESTIONS = (1 << len(ascii_lowercase)) - 1
+
+
+@fixture
 def example() -> List[str]:
     example_data = """abc
 
@@ -79,13 +87,14 @@ b
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
+
+
+def stream_inputs() -> Iterator[str]:
+    return iter_lines(__file__)
 
 
-def by_group(inputs: List[str]) -> Iterable[List[str]]:
+def by_group(inputs: Iterable[str]) -> Iterable[List[str]]:
     group: List[str] = []
     for row in inputs:
         if len(row) == 0:
@@ -107,16 +116,54 @@ def test_by_group(example: List[str]) -> None:
     assert groups[4] == ["b"]
 
 
+def answer_mask(line: str) -> int:
+    """The questions answered on one line, as bits."""
+    mask = 0
+    for byte in line.encode():
+        mask |= QUESTION_BITS[byte]
+    return mask
+
+
+def group_masks(inputs: Iterable[str]) -> Iterator[Tuple[int, int]]:
+    """(anyone, everyone) answer masks for each group, in one pass."""
+    anyone, everyone, members = 0, ALL_QUESTIONS, 0
+    for row in inputs:
+        if row:
+            mask = answer_mask(row)
+            anyone |= mask
+            everyone &= mask
+            members += 1
+        else:
+            if members:
+                yield anyone, everyone
+            anyone, everyone, members = 0, ALL_QUESTIONS, 0
+    if members:
+        yield anyone, everyone
+
+
+def test_group_masks(example: List[str]) -> None:
+    assert answer_mask("cab") == answer_mask("abcab") == 0b111
+    masks = list(group_masks(example))
+    assert masks[0] == (0b111, 0b111)
+    assert masks[2] == (0b111, 0b1)
+    assert masks[4] == (0b10, 0b10)
+    # A group with no letters in it is still a group, and ends at its blank.
+    assert list(group_masks(["ab", "", "!", "", "a", "ab"])) == [
+        (0b11, 0b11),
+        (0, 0),
+        (0b11, 0b1),
+    ]
+
+
 def count_uniq(group: List[str]) -> int:
-    chars: MutableSet[str] = set()
+    anyone = 0
     for line in group:
-        for char in line:
-            chars.add(char)
-    return len(chars)
+        anyone |= answer_mask(line)
+    return anyone.bit_count()
 
 
-def part1(inputs) -> int:
-    return sum(count_uniq(i) for i in by_group(inputs))
+def part1(inputs: Iterable[str]) -> int:
+    return sum(anyone.bit_count() for anyone, _ in group_masks(inputs))
 
 
 def test_part1() -> None:
@@ -161,21 +208,11 @@ def test_part1() -> None:
 # For each group, count the number of questions to which everyone answered "yes". What is the sum of those counts?
 
 
-def char_set(word: str) -> MutableSet[str]:
-    chars: MutableSet[str] = set()
-    for char in word:
-        chars.add(char)
-    return chars
-
-
 def count_common(group: List[str]) -> int:
-    all_chars = char_set(group[0])
-    for line in group[1:]:
-        these_chars = char_set(line)
-        all_chars &= these_chars
-        if len(all_chars) == 0:
-            return 0
-    return len(all_chars)
+    everyone = ALL_QUESTIONS
+    for line in group:
+        everyone &= answer_mask(line)
+    return everyone.bit_count()
 
 
 def test_count_common(example: List[str]) -> None:
@@ -192,8 +229,8 @@ def test_count_common(example: List[str]) -> None:
     assert count_common(groups[4]) == 1
 
 
-def part2(inputs) -> int:
-    return sum(count_common(i) for i in by_group(inputs))
+def part2(inputs: Iterable[str]) -> int:
+    return sum(everyone.bit_count() for _, everyone in group_masks(inputs))
 
 
 def test_part2() -> None:
@@ -45,14 +45,15 @@ list of rules is quite long; make sure you get all of it.)
 
 from __future__ import annotations
 
-import os
 import re
-from typing import Dict, List, MutableSet, Tuple
+from typing import Dict, Iterable, List, Tuple
 
-import pytest
+from aoc import search
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return """light red bags contain 1 bright white bag, 2 muted yellow bags.
 dark orange bags contain 3 bright white bags, 4 muted yellow bags.
@@ -66,69 +67,86 @@ dotted black bags contain no other bags.""".splitlines()
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
-class Bag:
-    """Has a colour and may contain other bags."""
+BAG_DEF = re.compile(r"(.*?) bags contain (.*)")
+CONTENT = re.compile(r"(\d+) (.*?) bags?")
 
-    def __init__(self, colour: str) -> None:
-        self.colour: str = colour
-        self.rules: List[Tuple[str, int]] = []
+Rule = Tuple[str, List[Tuple[str, int]]]
 
-    def add_rule(self, count: int, colour: str):
-        self.rules.append((colour, count))
 
-    @classmethod
-    def from_str(cls, bag_def: str) -> Bag:
-        if matched := re.match(r"(.*?) bags contain (.*)", bag_def):
-            new_bag = cls(matched[1])
-            for count, colour in re.findall(r"(\d+) (.*?) bags?", matched[2]):
-                new_bag.add_rule(int(count), colour)
-            return new_bag
-        raise ValueError(f"Couldn't parse {bag_def}")
+def parse_rule(bag_def: str) -> Rule:
+    """(colour, [(inner colour, count)...]) from one line of rules."""
+    if matched := BAG_DEF.match(bag_def):
+        inside = [(colour, int(count)) for count, colour in CONTENT.findall(matched[2])]
+        return matched[1], inside
+    raise ValueError(f"Couldn't parse {bag_def}")
+
+
+class BagRules:
+    """The rules compiled to a graph over numbered colours.
+
+    Edges run both ways: from each bag to what it must contain, and from
+    each bag to the bags that hold it directly.
+    """
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        ids: Dict[str, int] = {}
+        edges: List[Tuple[int, int, int]] = []
+        for colour, inside in rules:
+            outer = ids.setdefault(colour, len(ids))
+            for inner_colour, count in inside:
+                edges.append((outer, ids.setdefault(inner_colour, len(ids)), count))
+        self.ids = ids
+        self.colours: List[str] = list(ids)
+        self.contents: List[List[Tuple[int, int]]] = [[] for _ in ids]
+        self.holders: List[List[int]] = [[] for _ in ids]
+        for outer, inner, count in edges:
+            self.contents[outer].append((inner, count))
+            self.holders[inner].append(outer)
+        # Bags within each bag, for those worked out so far.
+        self.within: Dict[int, int] = {}
 
     @classmethod
-    def all_bags(cls, bag_defs: List[str]) -> Dict[str, Bag]:
-        all_bags: Dict[str, Bag] = {}
-        for bag_def in bag_defs:
-            bag = cls.from_str(bag_def)
-            all_bags[bag.colour] = bag
-        return all_bags
-
-    def can_contain_checked(
-        self, colour: str, bags: Dict[str, Bag], checked: MutableSet[str]
-    ) -> bool:
-        for sub_colour, _ in self.rules:
-            if sub_colour == colour:
-                return True
-            if sub_colour not in checked:
-                has_colour = bags[sub_colour].can_contain_checked(colour, bags, checked)
-                if has_colour:
-                    return True
-                checked.add(sub_colour)
-        return False
-
-    def can_contain(self, colour: str, bags: Dict[str, Bag]) -> bool:
-        return self.can_contain_checked(colour, bags, set())
-
-    def count_within(self, bags: Dict[str, Bag]) -> int:
-        total = 0
-        for colour, count in self.rules:
-            total += count + count * bags[colour].count_within(bags)
-            # print(f"{self.colour}: {colour} {count} ({total})")
-        return total
+    def from_lines(cls, bag_defs: List[str]) -> BagRules:
+        return cls(parse_rule(i) for i in bag_defs)
+
+    def holding(self, colour: str) -> List[str]:
+        """Every colour that can end up with a colour bag inside it."""
+        start = self.ids[colour]
+        found = search.reachable([start], self.holders.__getitem__)
+        return [self.colours[i] for i in sorted(found) if i != start]
+
+    def count_within(self, colour: str) -> int:
+        """How many bags a colour bag holds, all the way down.
+
+        Bags are totalled after everything inside them (a topological
+        order), and remembered, so each bag and rule is looked at once.
+        """
+        within, contents = self.within, self.contents
+        stack = [self.ids[colour]]
+        opened = set()
+        while stack:
+            bag = stack[-1]
+            if bag in within:
+                stack.pop()
+                continue
+            todo = [i for i, _ in contents[bag] if i not in within]
+            if not todo:
+                within[bag] = sum(n * (1 + within[i]) for i, n in contents[bag])
+                stack.pop()
+            elif bag in opened:
+                # Its contents were all dealt with, unless one holds it.
+                raise ValueError(f"{self.colours[bag]} bags contain themselves")
+            else:
+                opened.add(bag)
+                stack.extend(todo)
+        return within[self.ids[colour]]
 
 
 def test_can_contain(example: List[str]):
-    all_bags: Dict[str, Bag] = Bag.all_bags(example)
-    gold_holding_bags = []
-    for colour, bag in all_bags.items():
-        if bag.can_contain("shiny gold", all_bags):
-            gold_holding_bags.append(colour)
+    gold_holding_bags = BagRules.from_lines(example).holding("shiny gold")
     assert len(gold_holding_bags) == 4
     assert "bright white" in gold_holding_bags
     assert "muted yellow" in gold_holding_bags
@@ -137,8 +155,7 @@ def test_can_contain(example: List[str]):
 
 
 def part1(inputs) -> int:
-    all_bags = Bag.all_bags(inputs)
-    return len([i for i in all_bags.values() if i.can_contain("shiny gold", all_bags)])
+    return len(parsed(inputs, BagRules.from_lines).holding("shiny gold"))
 
 
 def test_part1() -> None:
@@ -179,7 +196,7 @@ def test_part1() -> None:
 # How many individual bags are required inside your single shiny gold bag?
 
 
-@pytest.fixture
+@fixture
 def example2() -> List[str]:
     return """shiny gold bags contain 2 dark red bags.
 dark red bags contain 2 dark orange bags.
@@ -191,17 +208,30 @@ dark violet bags contain no other bags.""".splitlines()
 
 
 def test_test_within(example2: List[str]):
-    all_bags: Dict[str, Bag] = Bag.all_bags(example2)
-    shiny_gold = all_bags["shiny gold"]
-    assert shiny_gold
-    assert shiny_gold.rules == [("dark red", 2)]
-    count = shiny_gold.count_within(all_bags)
-    assert count == 126
+    assert parse_rule(example2[0]) == ("shiny gold", [("dark red", 2)])
+    assert parse_rule(example2[-1]) == ("dark violet", [])
+    rules = BagRules.from_lines(example2)
+    assert rules.contents[rules.ids["shiny gold"]] == [(rules.ids["dark red"], 2)]
+    assert rules.count_within("shiny gold") == 126
+
+
+def test_cycle() -> None:
+    rules = BagRules.from_lines(
+        [
+            "red bags contain 1 blue bag.",
+            "blue bags contain 2 red bags.",
+            "shiny gold bags contain 1 red bag.",
+        ]
+    )
+    assert rules.holding("red") == ["blue", "shiny gold"]
+    import pytest
+
+    with pytest.raises(ValueError, match="bags contain themselves"):
+        rules.count_within("shiny gold")
 
 
 def part2(inputs) -> int:
-    all_bags: Dict[str, Bag] = Bag.all_bags(inputs)
-    return all_bags["shiny gold"].count_within(all_bags)
+    return parsed(inputs, BagRules.from_lines).count_within("shiny gold")
 
 
 def test_part2() -> None:
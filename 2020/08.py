@@ -1,13 +1,14 @@
 """Day 8"""
 
+from typing import List, Set
 
-import os
-import pytest
-import sys
-from typing import List, MutableSet
+from aoc import search
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
+from aoc.vm import ACC, JMP, NOP, Exit, InstructionSet, Program, Run, run
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return """nop +0
 acc +1
@@ -21,54 +22,24 @@ acc +6""".splitlines()
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
-
-
-class Machine:
-    def __init__(self, cmds: List[str]) -> None:
-        self.cmds = cmds
-        self.ip: int = 0
-        self.acc: int = 0
-
-    def next_cmd(self) -> int:
-        cmd = self.cmds[self.ip]
-        # print(f"{self.ip} {cmd} {self.acc}")
-        op, val_str = cmd.split(" ")
-        val = int(val_str)
-        if op == "jmp":
-            self.ip += val
-            return self.ip
-        if op == "acc":
-            self.acc += val
-        self.ip += 1
-        return self.ip
+    return read_lines(__file__)
+
+
+HANDHELD: InstructionSet = {"nop": (NOP, 1), "acc": (ACC, 1), "jmp": (JMP, 1)}
+
+
+def compile_program(inputs: List[str]) -> Program:
+    return Program.compile(inputs, HANDHELD)
 
 
 def test_machine(example: List[str]):
-    mac: Machine = Machine(example)
-    seen: MutableSet[int] = set([mac.ip])
-    while 1:
-        next_cmd = mac.next_cmd()
-        sys.stderr.write(str(next_cmd))
-        if next_cmd in seen:
-            break
-        seen.add(next_cmd)
-    assert mac.acc == 5
+    done = run(compile_program(example))
+    assert done.exit is Exit.LOOPED
+    assert done.acc == 5
 
 
 def part1(inputs: List[str]) -> int:
-    mac: Machine = Machine(inputs)
-    seen: MutableSet[int] = set([mac.ip])
-    while 1:
-        next_cmd = mac.next_cmd()
-        # sys.stderr.write(str(next_cmd))
-        if next_cmd in seen:
-            break
-        seen.add(next_cmd)
-    return mac.acc
+    return run(parsed(inputs, compile_program)).acc
 
 
 def test_part1() -> None:
@@ -76,51 +47,58 @@ def test_part1() -> None:
     assert part1(inputs) == 1797
 
 
-class LoopException(Exception):
-    """Loop found."""
-
-
-def completes(inputs: List[str]) -> Machine:
-    mac: Machine = Machine(inputs)
-    seen: MutableSet[int] = set([mac.ip])
-    while 1:
-        next_cmd = mac.next_cmd()
-        if next_cmd == len(inputs):
-            return mac
-        if next_cmd in seen:
-            raise LoopException
-        seen.add(next_cmd)
+def halting(program: Program) -> Set[int]:
+    """The instructions from which the program, as it is, runs off its end
+    (and the end itself).
+
+    Worked back from the end: an instruction halts if the one it goes to
+    next does, so this is everything that can reach the end backwards.
+    """
+    end = len(program)
+    comes_from: List[List[int]] = [[] for _ in range(end + 1)]
+    for i, (op, arg) in enumerate(zip(program.ops, program.args)):
+        following = i + arg if op == JMP else i + 1
+        if 0 <= following <= end:
+            comes_from[following].append(i)
+    return search.reachable([end], comes_from.__getitem__)
+
+
+def repair(program: Program) -> Run:
+    """Run the program with the one jmp or nop that stops it looping swapped.
+
+    Only an instruction the looping run reaches can matter, and swapping it
+    works if where it then goes halts, so one walk along that run finds it.
+    The program itself is left as it is.
+    """
+    ends = halting(program)
+    ops, args = program.ops, program.args
+    seen = bytearray(len(program))
+    ip = acc = 0
+    while 0 <= ip < len(program) and not seen[ip]:
+        seen[ip] = 1
+        op = ops[ip]
+        if op == ACC:
+            acc += args[ip]
+            ip += 1
+            continue
+        swapped = ip + 1 if op == JMP else ip + args[ip]
+        if swapped in ends:
+            # It can't come back to ip: if ip halted as it is, so would all.
+            return run(program, acc, start=swapped)
+        ip += args[ip] if op == JMP else 1
+    raise ValueError("no single change makes the program halt")
+
+
+def test_repair(example: List[str]) -> None:
+    program = compile_program(example)
+    assert halting(program) == {8, 9}
+    fixed = repair(program)
+    assert (fixed.exit, fixed.acc) == (Exit.HALTED, 8)
+    assert program.ops == compile_program(example).ops
 
 
 def part2(inputs) -> int:
-    mac: Machine = Machine(inputs)
-    seen: MutableSet[int] = set([mac.ip])
-    while 1:
-        next_cmd = mac.next_cmd()
-        if next_cmd in seen:
-            break
-        seen.add(next_cmd)
-    jmps = [i for i in seen if inputs[i].startswith("jmp")]
-    nops = [i for i in seen if inputs[i].startswith("nop")]
-    for i in jmps:
-        cmd = inputs[i]
-        _, val = cmd.split(" ")
-        inputs[i] = "nop " + val
-        try:
-            return completes(inputs).acc
-        except LoopException:
-            inputs[i] = cmd
-    for i in nops:
-        cmd = inputs[i]
-        _, val = cmd.split(" ")
-        inputs[i] = "jmp " + val
-        try:
-            return completes(inputs).acc
-        except LoopException:
-            inputs[i] = cmd
-
-    print(f"{len(jmps)} jmps, {len(nops)} nops")
-    return 0
+    return repair(parsed(inputs, compile_program)).acc
 
 
 def test_part2() -> None:
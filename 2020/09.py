@@ -1,11 +1,13 @@
 """Day X"""
 
-import os
-import pytest
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Tuple, Union
 
+from aoc.loader import iter_lines, read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """35
 20
@@ -29,45 +31,77 @@ def example() -> List[str]:
 576""".splitlines()
 
 
+PREAMBLE = 25
+
+
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
+
+
+def stream_inputs() -> Iterator[str]:
+    return iter_lines(__file__)
+
+
+def first_invalid(inputs: Iterable[Union[str, int]], window: int = PREAMBLE) -> int:
+    """The first number that isn't the sum of two of the window before it.
+
+    The window is kept as a queue, for what drops out, and a count of each
+    value in it, so checking a number is one lookup for each number in the
+    window rather than a look at every pair.
+    """
+    recent: Deque[int] = deque()
+    counts: Dict[int, int] = {}
+    for line in inputs:
+        num = int(line)
+        if len(recent) == window:
+            for i in recent:
+                other = num - i
+                if other in counts and (other != i or counts[i] > 1):
+                    break
+            else:
+                return num
+            old = recent.popleft()
+            left = counts[old] - 1
+            if left:
+                counts[old] = left
+            else:
+                del counts[old]
+        recent.append(num)
+        counts[num] = counts.get(num, 0) + 1
+    raise ValueError("every number is a sum")
 
 
-def is_sum(x: int, parts: List[int]) -> bool:
-    for i, part_a in enumerate(parts):
-        for part_b in parts[i + 1 :]:
-            if part_a + part_b == x:
-                return True
-    return False
+def contig_sum(x: int, parts: List[int]) -> Tuple[int, int]:
+    """parts[i:j], at least two long, that adds up to x.
+
+    The numbers are never negative, so the run grows at its end until it
+    adds up to too much and then shrinks from its start: each number goes
+    in and comes out at most once.
+    """
+    start = total = 0
+    for end, part in enumerate(parts):
+        total += part
+        while total > x and start < end:
+            total -= parts[start]
+            start += 1
+        if total == x and end > start:
+            return start, end + 1
+    raise ValueError("No sum")
 
 
 def test_example(example: List[str]):
+    assert first_invalid(example, window=5) == 127
+    # Two equal numbers make a sum, but one number can't be used twice.
+    assert first_invalid([4, 4, 1, 8, 5, 3], window=3) == 3
+    assert first_invalid([4, 1, 2, 8], window=3) == 8
     nums = [int(i) for i in example]
-    for start in range(9):
-        assert is_sum(nums[start + 5], nums[start : start + 5]) is True
-    assert is_sum(nums[8 + 6], nums[8 : 8 + 5]) is False
+    i, j = contig_sum(127, nums)
+    assert nums[i:j] == [15, 25, 47, 40]
+    assert contig_sum(5, [5, 1, 4]) == (1, 3)
 
 
-def part1(inputs) -> int:
-    nums = [int(i) for i in inputs]
-    for start in range(len(nums) - 25):
-        if not is_sum(nums[start + 25], nums[start : start + 25]):
-            return nums[start + 25]
-    return 0
-
-
-def contig_sum(x: int, parts: List[int]) -> Tuple[int, int]:
-    for i in range(len(parts)):
-        for j in range(i + 2, len(parts)):
-            part_sum = sum(parts[i:j])
-            if part_sum == x:
-                return i, j
-            if part_sum > x:
-                break
-    raise Exception("No sum")
+def part1(inputs: Iterable[str]) -> int:
+    return first_invalid(inputs)
 
 
 def test_part1() -> None:
@@ -77,7 +111,7 @@ def test_part1() -> None:
 
 def part2(inputs) -> int:
     nums = [int(i) for i in inputs]
-    i, j = contig_sum(167829540, nums)
+    i, j = contig_sum(first_invalid(nums), nums)
     return min(nums[i:j]) + max(nums[i:j])
 
 
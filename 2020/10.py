@@ -1,11 +1,13 @@
 """Day X"""
 
-import os
-import pytest
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, List, Tuple
 
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """16
 10
@@ -20,7 +22,7 @@ def example() -> List[str]:
 4""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def example2() -> List[str]:
     return """28
 33
@@ -56,21 +58,25 @@ def example2() -> List[str]:
 """.splitlines()
 
 
+def chain(inputs: List[str]) -> List[int]:
+    """Every joltage in order: the outlet, the adapters and the device."""
+    jolts = sorted(int(i) for i in inputs)
+    if not jolts:
+        raise ValueError("no adapters")
+    return [0] + jolts + [jolts[-1] + 3]
+
+
 def joltage_diffs(inputs: List[str]) -> Tuple[int, int]:
-    jolts = [0] + sorted(int(i) for i in inputs)
-    diff_count = {1: 0, 3: 1}
-    for i in range(len(jolts) - 1):
-        diff = jolts[i + 1] - jolts[i]
-        if diff in [1, 3]:
-            diff_count[diff] += 1
+    jolts = parsed(inputs, chain)
+    diff_count = {1: 0, 2: 0, 3: 0}
+    for low, high in zip(jolts, jolts[1:]):
+        if high - low in diff_count:
+            diff_count[high - low] += 1
     return diff_count[1], diff_count[3]
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_ex(example: List[str]):
@@ -96,51 +102,51 @@ def test_part1() -> None:
     assert part1(inputs) == 1656
 
 
-def joltage_runs(inputs: List[str]) -> List[int]:
-    jolts = [0] + sorted(int(i) for i in inputs)
-    onev_count: int = 0
-    last_diff: int = 0
-    runs = []
-    for i in range(len(jolts) - 1):
-        diff = jolts[i + 1] - jolts[i]
-        if diff == 1:
-            if last_diff == 1:
-                onev_count += 1
-        else:
-            if onev_count > 0:
-                runs.append(onev_count + 1)
-            onev_count = 0
-        last_diff = diff
-    if onev_count:
-        runs.append(onev_count + 1)
-    return runs
-
-
-def run_score(runs: List[int]) -> int:
-    # 2 => 2  2
-    # 3 => 4  2^2
-    # 4 => 7  2^3 - 1
-    total = 1
-    mult = {2: 2, 3: 4, 4: 7}
-    for i in runs:
-        total *= mult[i]
-    return total
-
-
-#
+def arrangements(jolts: List[int]) -> int:
+    """How many ways there are to get from the first joltage to the last.
+
+    Each adapter can be reached from any of the (at most three) before it
+    within 3 jolts, so the ways to each are the sum of theirs, and only the
+    last three need keeping.
+    """
+    if not jolts:
+        raise ValueError("no joltages")
+    if len(set(jolts)) != len(jolts):
+        raise ValueError("two adapters have the same joltage")
+    recent: Deque[Tuple[int, int]] = deque([(jolts[0], 1)], maxlen=3)
+    for jolt in jolts[1:]:
+        recent.append((jolt, sum(ways for i, ways in recent if jolt - i <= 3)))
+    return recent[-1][1]
+
+
 def test_combo(example: List[str]):
-    assert joltage_runs(example) == [3, 2]
-    assert run_score(joltage_runs(example)) == 8
+    assert arrangements(chain(example)) == 8
 
 
 def test_combo2(example2: List[str]):
-    assert joltage_runs(example2) == [4, 4, 3, 2, 4, 4]
-    assert run_score(joltage_runs(example2)) == 19208
+    assert arrangements(chain(example2)) == 19208
+
+
+def test_empty() -> None:
+    import pytest
+
+    with pytest.raises(ValueError, match="no adapters"):
+        chain([])
+    with pytest.raises(ValueError, match="no joltages"):
+        arrangements([])
+
+
+def test_long_runs() -> None:
+    # Runs of 1-jolt steps of any length, as well as 2-jolt steps.
+    assert arrangements(list(range(6))) == 13
+    assert arrangements([0, 1, 2, 3, 4, 5, 6, 7, 8, 11]) == 81
+    assert arrangements([0, 2, 4, 5, 8]) == 2
+    assert arrangements([0, 4, 5]) == 0
+    assert arrangements(list(range(20_000))) % 1000 == 32
 
 
 def part2(inputs) -> int:
-    runs = joltage_runs(inputs)
-    return run_score(runs)
+    return arrangements(parsed(inputs, chain))
 
 
 def test_part2() -> None:
@@ -1,12 +1,16 @@
 """Day 11"""
 
 from __future__ import annotations
-import os
-import pytest
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 
-@pytest.fixture
+from aoc import counters, grid
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
+
+@fixture
 def example() -> List[str]:
     return """L.LL.LL.LL
 LLLLLLL.LL
@@ -20,78 +24,183 @@ L.LLLLLL.L
 L.LLLLL.LL""".splitlines()
 
 
+FLOOR, EMPTY, TAKEN = b".L#"
+# settle() only follows the flips once fewer than 1/SPARSE of the seats flip.
+SPARSE = 8
+
+
+def nearest_seats(index: np.ndarray, dy: int, dx: int, in_sight: bool) -> np.ndarray:
+    """The index of the seat each cell sees towards (dy, dx), or -1.
+
+    index holds each seat's own index, and -1 on the floor. In sight, a cell
+    sees through floor to the first seat, which is the seat ahead or, if
+    that is floor, whatever the floor sees: one vector step a row (or a
+    column, going sideways), working back from the edge.
+    """
+    if not in_sight:
+        return grid.shifted(index, dy, dx, fill=-1)
+    if dy == 0:
+        return nearest_seats(index.T, dx, dy, in_sight).T
+    rows, cols = index.shape
+    nearest = np.full(index.shape, -1)
+    into = slice(max(0, -dx), cols - max(0, dx))
+    from_ = slice(max(0, dx), cols - max(0, -dx))
+    for y in range(rows - 1 - dy, -1, -1) if dy > 0 else range(-dy, rows):
+        ahead = y + dy
+        seen = np.where(index[ahead] >= 0, index[ahead], nearest[ahead])
+        nearest[y, into] = seen[from_]
+    return nearest
+
+
+class Seating:
+    """Where the seats are, and which seats each one looks at under a rule.
+
+    Seats never move, only fill and empty, so each rule's neighbours are
+    worked out once, as an (8, seats) table of seat numbers, one row a
+    direction; a missing neighbour is the extra, always empty, seat at the
+    end. A round is then eight gathers, whichever the rule.
+    """
+
+    def __init__(self, cells: np.ndarray) -> None:
+        seats = cells != FLOOR
+        self.floor = np.where(seats, EMPTY, FLOOR).astype(np.uint8)
+        self.cells = np.flatnonzero(seats)
+        self.tables: Dict[bool, np.ndarray] = {}
+        index = np.where(seats, np.arange(cells.size).reshape(cells.shape), -1)
+        # Flat cell index to seat number, with -1 (nothing) to the extra.
+        number = np.full(cells.size + 1, len(self.cells))
+        number[self.cells] = np.arange(len(self.cells))
+        for in_sight in (False, True):
+            table = [
+                number[nearest_seats(index, dy, dx, in_sight).ravel()[self.cells]]
+                for dy, dx in grid.SURROUNDING
+            ]
+            self.tables[in_sight] = np.stack(table)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def taken(self, cells: np.ndarray) -> np.ndarray:
+        """1 for each taken seat in cells, and 0 for the extra one."""
+        taken = np.zeros(len(self) + 1, dtype=np.uint8)
+        taken[:-1] = cells.ravel()[self.cells] == TAKEN
+        return taken
+
+    def draw(self, taken: np.ndarray) -> np.ndarray:
+        cells = self.floor.copy()
+        cells.ravel()[self.cells[taken[:-1] == 1]] = TAKEN
+        return cells
+
+
 class LifeGrid:
-    def __init__(self, rows: Iterable[str]) -> None:
-        self.rows = list(rows)
-        self.max_y = len(self.rows)
-        self.max_x = len(self.rows[0])
+    def __init__(
+        self,
+        rows: Union[Iterable[str], np.ndarray],
+        seating: Optional[Seating] = None,
+        taken: Optional[np.ndarray] = None,
+    ) -> None:
+        """A grid of rows, or of taken (from Seating.taken()) in seating."""
+        if seating is None:
+            cells = rows if isinstance(rows, np.ndarray) else grid.parse(rows)
+            seating = Seating(cells)
+            taken = seating.taken(cells)
+        self.seating = seating
+        self.taken = taken
+        self.max_y, self.max_x = seating.floor.shape
 
     @property
-    def count(self):
-        return sum([j.count("#") for j in self.rows])
+    def cells(self) -> np.ndarray:
+        return self.seating.draw(self.taken)
 
-    def neighbours(self, x, y):
-        for other_y in range(max(0, y - 1), min(self.max_y, y + 2)):
-            for other_x in range(max(0, x - 1), min(self.max_x, x + 2)):
-                if other_x == x and other_y == y:
-                    continue
-                yield other_x, other_y
+    @property
+    def rows(self) -> List[str]:
+        return grid.to_lines(self.cells)
+
+    @property
+    def count(self):
+        return int(self.taken.sum())
 
     def adjacent(self, x, y) -> Dict[str, int]:
-        # print(f"{x},{y}:")
-        cells: Dict[str, int] = {".": 0, "L": 0, "#": 0}
-        for other_x, other_y in self.neighbours(x, y):
-            cells[self.rows[other_y][other_x]] += 1
-        return cells
+        cells = self.cells
+        window = cells[max(0, y - 1) : y + 2, max(0, x - 1) : x + 2]
+        counts = {i: int((window == ord(i)).sum()) for i in ".L#"}
+        counts[chr(cells[y, x])] -= 1
+        return counts
 
-    def lines(self, x, y) -> Dict[str, int]:
-        cells: Dict[str, int] = {".": 0, "L": 0, "#": 0}
-        for other_x, other_y in self.neighbours(x, y):
-            x_delta = other_x - x
-            y_delta = other_y - y
-            while (
-                other_x in range(0, self.max_x)
-                and other_y in range(0, self.max_y)
-                and self.rows[other_y][other_x] == "."
-            ):
-                other_x += x_delta
-                other_y += y_delta
-            if other_x in range(0, self.max_x) and other_y in range(0, self.max_y):
-                cells[self.rows[other_y][other_x]] += 1
-        return cells
+    def taken_around(self, in_sight: bool) -> np.ndarray:
+        """How many of each seat's neighbours are taken."""
+        table = self.seating.tables[in_sight]
+        counters.count("LifeGrid.neighbours", table.size)
+        return np.take(self.taken, table).sum(axis=0, dtype=np.uint8)
 
-    def process_row(self, y: int, use_lines: bool = False) -> Tuple[str, bool]:
-        row = []
-        changed = False
-        count_cells = self.adjacent
-        threshold = 4
-        if use_lines:
-            count_cells = self.lines
-            threshold = 5
-        for x, cell in enumerate(self.rows[y]):
-            if cell == ".":
-                row.append(".")
+    def round(self, use_lines=False) -> Tuple[LifeGrid, bool]:
+        counters.count("LifeGrid.rounds")
+        around = self.taken_around(use_lines)
+        threshold = 5 if use_lines else 4
+        taken = self.taken.copy()
+        taken[:-1] = np.where(taken[:-1], around < threshold, around == 0)
+        if np.array_equal(taken, self.taken):
+            return self, False
+        return self.__class__([], self.seating, taken), True
+
+    def settle(self, use_lines=False) -> LifeGrid:
+        """Run rounds until nothing changes, and return the last grid.
+
+        Once few seats are flipping, this stops looking at every seat every
+        round: it keeps each seat's count of taken neighbours up to date as
+        seats flip, and only looks again at the seats around last round's
+        flips (a seat that flipped cannot flip back until one of them
+        changes). The seats and counts are changed in place, so those rounds
+        cost what the flips do, not the size of the grid. While a good part
+        of the grid is still flipping, a whole round of gathers is cheaper.
+        """
+        table = self.seating.tables[use_lines]
+        extra = len(self.seating)
+        threshold = 5 if use_lines else 4
+        taken = self.taken.copy()
+        around = np.zeros(extra + 1, dtype=np.int16)
+        marked = np.zeros(extra + 1, dtype=bool)
+        dirty: Optional[np.ndarray] = None
+        rounds = updates = 0
+        while True:
+            if dirty is None:
+                dirty = np.arange(extra)
+                around[:-1] = np.take(taken, table).sum(axis=0)
+                updates += table.size
+            now, count = taken[dirty], around[dirty]
+            flips = dirty[np.where(now, count >= threshold, count == 0)]
+            if not flips.size:
+                break
+            rounds += 1
+            step = 1 - 2 * taken[flips].astype(np.int16)
+            taken[flips] ^= 1
+            if flips.size > extra // SPARSE:
+                dirty = None
                 continue
-            adj_count = count_cells(x, y)
-            if cell == "L" and adj_count["#"] == 0:
-                row.append("#")
-                changed = True
-            elif cell == "#" and adj_count["#"] >= threshold:
-                row.append("L")
-                changed = True
-            else:
-                row.append(cell)
-        return "".join(row), changed
+            updates += table.shape[0] * flips.size
+            seen = table[:, flips]
+            # No seat is seen twice from one direction, bar the extra one.
+            for row in seen:
+                around[row] += step
+            marked[seen] = True
+            marked[extra] = False
+            dirty = np.flatnonzero(marked)
+            marked[dirty] = False
+        counters.count("LifeGrid.rounds", rounds)
+        counters.count("LifeGrid.updates", updates)
+        return self.__class__([], self.seating, taken)
 
-    def round(self, use_lines=False) -> Tuple[LifeGrid, bool]:
-        changed = False
-        new_grid = []
-        for y in range(0, self.max_y):
-            new_row, row_change = self.process_row(y, use_lines=use_lines)
-            if row_change:
-                changed = True
-            new_grid.append(new_row)
-        return self.__class__(new_grid), changed
+
+def test_nearest_seats() -> None:
+    cells = grid.parse(["L.L", "...", "L.#"])
+    index = np.where(cells != FLOOR, np.arange(9).reshape(3, 3), -1)
+    seen = [
+        nearest_seats(index, dy, dx, True)[0, 0] for dy, dx in ((0, 1), (1, 0), (1, 1))
+    ]
+    assert seen == [2, 6, 8]
+    assert nearest_seats(index, -1, -1, True)[2, 2] == 0
+    assert nearest_seats(index, 0, 1, False)[0, 0] == -1
+    assert nearest_seats(index, 0, -1, True)[0, 0] == -1
 
 
 def test_grid(example: List[str]):
@@ -111,22 +220,22 @@ def test_grid(example: List[str]):
         grid, changed = grid.round()
     assert not changed
     assert grid.count == 37
+    assert LifeGrid(example).settle().rows == grid.rows
 
 
 def test_grid_lines(example: List[str]):
     grid = LifeGrid(example)
+    seating = grid.seating
+    assert seating.tables[True].shape == (8, len(seating))
     for _ in range(8):
         grid, changed = grid.round(use_lines=True)
     assert not changed
     assert grid.count == 26
+    assert LifeGrid(example).settle(use_lines=True).rows == grid.rows
 
 
 def part1(inputs: List[str]) -> int:
-    grid = LifeGrid(inputs)
-    while 1:
-        grid, changed = grid.round()
-        if not changed:
-            return grid.count
+    return LifeGrid(inputs).settle().count
 
 
 def test_part1() -> None:
@@ -135,12 +244,7 @@ def test_part1() -> None:
 
 
 def part2(inputs) -> int:
-    grid = LifeGrid(inputs)
-    while 1:
-        grid, changed = grid.round(use_lines=True)
-        if not changed:
-            return grid.count
-    return 0
+    return LifeGrid(inputs).settle(use_lines=True).count
 
 
 def test_part2() -> None:
@@ -149,10 +253,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,64 +1,89 @@
 """Day 1. Submarine depths."""
 
-from typing import Iterable, List
+from itertools import islice
+from operator import lt
+from typing import List, Sequence
 
+import numpy as np
 
-def count_increases(values: List[int]) -> int:
-    increases = 0
-    for i, val in enumerate(values[1:]):
-        # Enumerating values[1:] so index i is values[i-1]
-        if val > values[i]:
-            increases += 1
-    return increases
+from aoc.loader import parsed, read_lines
+
+
+def count_increases(values: Sequence[int], window: int = 1) -> int:
+    """How many sums of window readings are bigger than the sum before.
+
+    Two windows a step apart share all but their ends, so one is bigger
+    just when values[i + window] > values[i]: no sums or slices needed.
+    """
+    check_window(window)
+    return sum(map(lt, values, islice(values, window, None)))
+
+
+def check_window(window: int) -> None:
+    if window < 1:
+        raise ValueError(f"windows must be at least 1 reading, not {window}")
 
 
 def test_count_increases() -> None:
     assert count_increases([1, 2, 3]) == 2
     assert count_increases([1, 1, 1]) == 0
+    assert count_increases([1, 2, 3, 4], 3) == 1
+    assert count_increases([5, 1, 1, 6, 1], 3) == 1
+    assert count_increases([1, 2], 3) == 0
 
 
-def window(values: List[int], count: int) -> Iterable[List[int]]:
-    for i in range(0, len(values) - count + 1):
-        yield values[i : i + count]
-
+def depth_array(inputs: List[str]) -> np.ndarray:
+    """The readings, parsed by NumPy, which raises on anything but a number."""
+    return np.array(inputs, dtype=np.int64)
 
-def test_window() -> None:
-    output = list(window([1, 2, 3, 4], 3))
-    assert len(output) == 2
-    assert output[0] == [1, 2, 3]
-    assert output[1] == [2, 3, 4]
 
+def count_increases_np(depths: np.ndarray, window: int = 1) -> int:
+    """count_increases() on a whole array at once."""
+    check_window(window)
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
 
-def window_sum(values: Iterable[int], count: int = 3) -> Iterable[int]:
-    for sub_values in window(list(values), count):
-        yield sum(sub_values)
 
+def test_count_increases_np() -> None:
+    depths = np.random.default_rng(1).integers(0, 50, 1000)
+    for window in (1, 2, 3, 10):
+        assert count_increases_np(depths, window) == count_increases(
+            depths.tolist(), window
+        )
+    assert count_increases_np(np.array([1, 2]), 3) == 0
+    assert depth_array(["199", "200", "208"]).tolist() == [199, 200, 208]
+    import pytest
 
-def test_window_sum() -> None:
-    output = list(window_sum([1, 2, 3, 4], 3))
-    assert len(output) == 2
-    assert output == [6, 9]
+    with pytest.raises(ValueError, match="at least 1 reading, not 0"):
+        count_increases_np(depths, 0)
+    with pytest.raises(ValueError, match="at least 1 reading, not 0"):
+        count_increases([1, 2], 0)
+    with pytest.raises(ValueError, match="'deep'"):
+        depth_array(["199", "deep"])
 
 
-def part1(depths: List[int]) -> int:
-    return count_increases(depths)
+def part1(inputs: List[str]) -> int:
+    return count_increases_np(parsed(inputs, depth_array))
 
 
 def test_part1() -> None:
-    depths: List[int] = [int(i) for i in open("01.data")]
-    assert part1(depths) == 1195
+    inputs = get_inputs()
+    assert part1(inputs) == 1195
 
 
-def part2(depths: List[int]) -> int:
-    return count_increases(list(window_sum(depths)))
+def part2(inputs: List[str]) -> int:
+    return count_increases_np(parsed(inputs, depth_array), 3)
 
 
 def test_part2() -> None:
-    depths: List[int] = [int(i) for i in open("01.data")]
-    assert part2(depths) == 1235
+    inputs = get_inputs()
+    assert part2(inputs) == 1235
+
+
+def get_inputs() -> List[str]:
+    return read_lines(__file__)
 
 
 if __name__ == "__main__":
-    depths: List[int] = [int(i) for i in open("01.data")]
-    print(part1(depths))
-    print(part2(depths))
+    inputs = get_inputs()
+    print(part1(inputs))
+    print(part2(inputs))
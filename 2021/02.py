@@ -1,11 +1,16 @@
 """Day X"""
 
-import os
-import pytest
-from typing import List
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
 
+import numpy as np
 
-@pytest.fixture
+from aoc.loader import iter_lines, read_lines
+from aoc.testing import fixture
+
+
+@fixture
 def example() -> List[str]:
     return """forward 5
 down 5
@@ -15,32 +20,120 @@ down 8
 forward 2""".splitlines()
 
 
-def go_sub(inputs: List[str]):
-    pos = 0
-    depth = 0
-
-    def down(x):
-        nonlocal depth
-        depth += x
-
-    def up(x):
-        nonlocal depth
-        depth -= x
-
-    def forward(x):
-        nonlocal pos
-        pos += x
-
-    move = {"down": down, "up": up, "forward": forward}
-    for command in inputs:
-        cmd, num = command.split(" ")
-        move[cmd](int(num))
-    return pos, depth
-
-
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    x, y = go_sub(inputs)
-    return x * y
+FORWARD, DOWN, UP = range(3)
+COMMANDS = {"forward": FORWARD, "down": DOWN, "up": UP}
+# Commands integrated at a time, when streaming.
+CHUNK = 1 << 16
+# Sums within a chunk stay in int64 while they can't get this big.
+INT64_LIMIT = 1 << 63
+
+
+@dataclass
+class Position:
+    horizontal: int = 0
+    # Down and up change the aim; in part 1 that is taken to be the depth.
+    aim: int = 0
+    depth: int = 0
+
+
+def largest(values: np.ndarray) -> int:
+    """The largest size in values, worked out in Python ints so it can't wrap."""
+    return max(abs(int(values.min())), abs(int(values.max())))
+
+
+def parse_course(lines: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Each command's distance forward and change of aim, 0 where it has none."""
+    # Fields a line, counted without keeping each line's list of them.
+    fields = np.fromiter(map(len, map(str.split, lines)), np.int64, len(lines))
+    wrong = np.flatnonzero(fields != 2)
+    if len(wrong):
+        raise ValueError(f"{lines[wrong[0]]!r} isn't a command and a number")
+    words = "\n".join(lines).split()
+    names, numbers = words[::2], words[1::2]
+    kinds = list(map(COMMANDS.get, names))
+    if None in kinds:
+        raise ValueError(f"{lines[kinds.index(None)]!r} isn't forward, down or up")
+    try:
+        sizes = np.array(numbers, dtype=np.int64)
+    except OverflowError:
+        sizes = np.array([int(i) for i in numbers], dtype=object)
+    if len(sizes) and largest(sizes) >= INT64_LIMIT >> 1:
+        # Turning up by int64's minimum can't be negated in int64.
+        sizes = sizes.astype(object)
+    codes = np.array(kinds, dtype=np.int8)
+    forward = np.where(codes == FORWARD, sizes, 0)
+    turns = np.where(codes == DOWN, sizes, 0) - np.where(codes == UP, sizes, 0)
+    return forward, turns
+
+
+def steer(start: Position, forward: np.ndarray, turns: np.ndarray) -> Position:
+    """Where the commands take the sub from start, in one pass of sums.
+
+    The aim during each command is start's plus the running sum of turns,
+    and each step forward goes down by the aim. Only sums within the chunk
+    are done in NumPy; start's values are Python ints and added to those,
+    so nothing wraps round however long the course. A chunk whose own sums
+    could pass int64 is summed as Python ints too.
+    """
+    if not len(turns):
+        return start
+    if (max(largest(forward), largest(turns)) * len(turns)) ** 2 >= INT64_LIMIT:
+        forward, turns = forward.astype(object), turns.astype(object)
+    aim = np.cumsum(turns)
+    ahead = int(forward.sum())
+    return Position(
+        start.horizontal + ahead,
+        start.aim + int(aim[-1]),
+        start.depth + start.aim * ahead + int(np.dot(forward, aim)),
+    )
+
+
+def test_steer() -> None:
+    far = steer(Position(0, 2**61, 0), np.array([9] * 4), np.zeros(4, np.int64))
+    assert far == Position(36, 2**61, 36 * 2**61)
+    assert far.depth == 83010348331692982272 > 2**63
+    # Sums within one chunk that would pass int64 are done exactly too.
+    big = 2**40
+    forward, turns = parse_course([f"down {big}", f"forward {big}"] * 3)
+    assert steer(Position(), forward, turns) == Position(3 * big, 3 * big, 6 * big**2)
+    huge = parse_course([f"down {2**70}", "forward 2"])
+    assert steer(Position(), *huge) == Position(2, 2**70, 2**71)
+    lowest = -(2**63)
+    for turn, aim in ((f"down {lowest}", lowest), (f"up {lowest}", -lowest)):
+        position = voyage(["forward 3", turn, "forward 2"])
+        assert position == Position(5, aim, 2 * aim)
+
+
+def voyage(inputs: Iterable[str], chunk: int = CHUNK) -> Position:
+    """steer() through the commands chunk at a time, carrying the position over."""
+    position = Position()
+    commands = iter(inputs)
+    while True:
+        lines = list(islice(commands, chunk))
+        if not lines:
+            return position
+        position = steer(position, *parse_course(lines))
+
+
+def test_voyage(example: List[str]) -> None:
+    whole = voyage(example)
+    assert whole == Position(15, 10, 60)
+    for chunk in (1, 2, 4):
+        assert voyage(iter(example), chunk) == whole
+    assert voyage([]) == Position()
+    import pytest
+
+    for bad in ("fly 3", "downstairs 2", "upward 1"):
+        with pytest.raises(ValueError, match=f"'{bad}' isn't forward, down or up"):
+            parse_course(["forward 1", bad])
+    for bad in ("forward", "forward 5 down"):
+        with pytest.raises(ValueError, match=f"'{bad}' isn't a command and a number"):
+            parse_course(["down 1", bad, "3"])
+
+
+def part1(inputs: Iterable[str]) -> int:
+    position = voyage(inputs)
+    return position.horizontal * position.aim
 
 
 def test_part1() -> None:
@@ -48,34 +141,9 @@ def test_part1() -> None:
     assert part1(inputs) == 1813801
 
 
-def go_sub2(inputs: List[str]):
-    pos = 0
-    depth = 0
-    aim = 0
-
-    def down(x):
-        nonlocal aim
-        aim += x
-
-    def up(x):
-        nonlocal aim
-        aim -= x
-
-    def forward(x):
-        nonlocal pos, aim, depth
-        pos += x
-        depth += aim * x
-
-    move = {"down": down, "up": up, "forward": forward}
-    for command in inputs:
-        cmd, num = command.split(" ")
-        move[cmd](int(num))
-    return pos, depth
-
-
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    x, y = go_sub2(inputs)
-    return x * y
+def part2(inputs: Iterable[str]) -> int:
+    position = voyage(inputs)
+    return position.horizontal * position.depth
 
 
 def test_part2() -> None:
@@ -83,11 +151,17 @@ def test_part2() -> None:
     assert part2(inputs) == 1960569556
 
 
+def test_stream(example):
+    assert part1(iter(example)) == 150
+    assert part2(iter(example)) == 900
+
+
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
+
+
+def stream_inputs() -> Iterator[str]:
+    return iter_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -2,6 +2,8 @@
 
 from typing import Iterable, List, Tuple
 
+from aoc.loader import read_lines
+
 
 def count_bits(inputs: Iterable[str]) -> Tuple[List[int], int]:
     totals: List[int] = []
@@ -66,6 +68,10 @@ def test_part2():
     assert part2(data) == 1007985
 
 
+def get_inputs():
+    return read_lines(__file__)
+
+
 if __name__ == "__main__":
     print("DATA")
     data = [i.strip() for i in open("03.data")]
@@ -75,20 +75,17 @@ get the final score, 188 * 24 = 4512.
 To guarantee victory against the giant squid, figure out which board will win
 first. What will your final score be if you choose that board?"""
 
-import os
 from typing import List, MutableSet, Optional
 
-import pytest
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return """7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
 
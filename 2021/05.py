@@ -57,14 +57,15 @@ Consider only horizontal and vertical lines. At how many points do at least two
 lines overlap?
 """
 
-import os
-import pytest
 import re
 from typing import Iterator, List
 from collections import namedtuple
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def ex_lines() -> List[str]:
     return """0,9 -> 5,9
 8,0 -> 0,8
@@ -78,7 +79,7 @@ def ex_lines() -> List[str]:
 5,5 -> 8,2""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def ex_render() -> List[str]:
     return """.......1..
 ..1....1..
@@ -173,10 +174,7 @@ def test_grid(ex_lines: List[str]):
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def part1(inputs) -> int:
@@ -76,20 +76,19 @@ days?
 
 """
 
-import os
-import pytest
 from typing import List
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 
 def get_inputs() -> List[int]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        for line in open(base + ".data"):
-            return [int(i) for i in line.strip().split(",")]
+    for line in read_lines(__file__):
+        return [int(i) for i in line.split(",")]
     return []
 
 
-@pytest.fixture
+@fixture
 def example() -> List[int]:
     return [int(i) for i in """3,4,3,1,2""".split(",")]
 
@@ -1,20 +1,18 @@
 """Day 7"""
 
-import os
-import pytest
 from typing import List
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """16,1,2,0,4,2,7,1,2,14""".splitlines()
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def sum_diffs(x: int, nums: List[int]) -> int:
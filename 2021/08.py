@@ -1,11 +1,12 @@
 """Day 8"""
 
-import os
-import pytest
 from typing import Dict, Iterable, List, Tuple
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
 edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
@@ -19,16 +20,13 @@ egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | gbdfcae bgc cg cgb
 gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def example_row() -> str:
     return "acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab | cdfeb fcadb cdfeb cdbaf"
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def signals_digits(row: str) -> Tuple[List[str], List[str]]:
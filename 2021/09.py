@@ -1,11 +1,15 @@
 """Day 9"""
 
-import os
-import pytest
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
 
-@pytest.fixture
+from aoc import grid
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
+
+
+@fixture
 def example() -> List[str]:
     return """2199943210
 3987894921
@@ -15,59 +19,35 @@ def example() -> List[str]:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 class Grid:
     def __init__(self, inputs: List[str]):
-        self.rows = [[int(j) for j in i] for i in inputs]
-        self.width = len(self.rows[0])
-        self.height = len(self.rows)
-
-    def adjacent(self, x: int, y: int) -> List[Tuple[int, int, int]]:
-        cells: List[
-            Tuple[
-                int,
-                int,
-            ]
-        ] = []
-        if y > 0:
-            cells.append((self.rows[y - 1][x], x, y - 1))
-        if y < self.height - 1:
-            cells.append((self.rows[y + 1][x], x, y + 1))
-        if x > 0:
-            cells.append((self.rows[y][x - 1], x - 1, y))
-        if x < self.width - 1:
-            cells.append((self.rows[y][x + 1], x + 1, y))
-        return cells
+        self.heights = grid.digits(inputs)
+        self.height, self.width = self.heights.shape
+        self._basins: Optional[np.ndarray] = None
 
     def low_point(self) -> Iterable[Tuple[int, int, int]]:
-        for y in range(0, self.height):
-            for x in range(0, self.width):
-                cell = self.rows[y][x]
-                if cell < min([i[0] for i in self.adjacent(x, y)]):
-                    yield cell, x, y
-
-    def find_basin(self, start_x: int, start_y: int):
-        done = set()
-        points = set([(start_x, start_y)])
-        count = 0
-        todo = list(points)
-        while todo and count < 20:
-            todo = []
-            count += 1
-            for x, y in points:
-                if (y * self.height + x) not in done:
-                    todo.append((x, y))
-            for x, y in todo:
-                done.add(y * self.height + x)
-                for n, new_x, new_y in self.adjacent(x, y):
-                    if n < 9 and (new_y * self.height + new_x) not in done:
-                        points.add((new_x, new_y))
-        return len(points)
+        lowest = grid.neighbour_reduce(np.minimum, self.heights, grid.ADJACENT, 9)
+        ys, xs = np.nonzero(self.heights < lowest)
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            yield int(self.heights[y, x]), x, y
+
+    @property
+    def basins(self) -> np.ndarray:
+        """Every cell's basin label (0 for the 9s between them)."""
+        if self._basins is None:
+            self._basins = grid.regions(self.heights < 9)
+        return self._basins
+
+    def find_basin(self, start_x: int, start_y: int) -> int:
+        return int((self.basins == self.basins[start_y, start_x]).sum())
+
+    def basin_sizes(self) -> List[int]:
+        sizes = np.bincount(self.basins.flat)
+        sizes[0] = 0
+        return sizes[sizes > 0].tolist()
 
 
 def test_example(example: List[str]):
@@ -86,8 +66,8 @@ def test_basin(example: List[str]):
 
 
 def part1(inputs) -> int:
-    grid = Grid(inputs)
-    return sum(i[0] + 1 for i in grid.low_point())
+    heightmap = parsed(inputs, Grid)
+    return sum(i[0] + 1 for i in heightmap.low_point())
 
 
 def test_part1() -> None:
@@ -96,11 +76,8 @@ def test_part1() -> None:
 
 
 def part2(inputs) -> int:
-    grid = Grid(inputs)
-    basins = []
-    for _, x, y in grid.low_point():
-        basins.append(grid.find_basin(x, y))
-    top_3 = sorted(basins)[-3:]
+    heightmap = parsed(inputs, Grid)
+    top_3 = sorted(heightmap.basin_sizes())[-3:]
     return top_3[0] * top_3[1] * top_3[2]
 
 
@@ -1,11 +1,12 @@
 """Day 10"""
 
-import os
-import pytest
 from typing import List
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """[({(<(())[]>[[{[]{<()<>>
 [(()[<>])]({[<{<<[]>>(
@@ -20,10 +21,7 @@ def example() -> List[str]:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 class IncompleteChunk(Exception):
@@ -75,6 +73,8 @@ def parser_score(lines: List[str]) -> int:
 
 
 def test_example(example: List[str]):
+    import pytest
+
     with pytest.raises(IncompleteChunk):
         check_chunks(example[0])
     assert parser_score(example) == 26397
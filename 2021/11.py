@@ -1,11 +1,15 @@
 """Day X"""
 
-import os
-import pytest
 from typing import List
 
+import numpy as np
 
-@pytest.fixture
+from aoc import grid
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
+
+@fixture
 def example() -> List[str]:
     return """5483143223
 2745854711
@@ -19,70 +23,31 @@ def example() -> List[str]:
 5283751526""".splitlines()
 
 
-class OctopusFish:
-    def __init__(self, state: int):
-        self.state = state
-        self.flashed = False
-        self.neighbours: List[OctopusFish] = []
-
-    def inc(self):
-        self.state += 1
-
-    def check_flash(self) -> int:
-        if self.state > 9 and not self.flashed:
-            self.flashed = True
-            flashes = 1
-            for fish in self.neighbours:
-                fish.inc()
-            for fish in self.neighbours:
-                flashes += fish.check_flash()
-            return flashes
-        return 0
-
-    def reset(self):
-        if self.flashed:
-            self.state = 0
-        self.flashed = False
-
-    def __str__(self):
-        return str(self.state)
-
-
 class Pool:
     def __init__(self, fish_def: List[str]):
-        self.rows: List[List[OctopusFish]] = [
-            [OctopusFish(int(i)) for i in j] for j in fish_def
-        ]
-        self.max_row: int = len(self.rows)
-        self.max_col: int = len(self.rows[0])
-        self.all_fish: List[OctopusFish] = []
-        for row in range(self.max_row):
-            for col in range(self.max_col):
-                fish: OctopusFish = self.rows[row][col]
-                self.all_fish.append(fish)
-                for i in range(max(0, row - 1), min(self.max_row, row + 2)):
-                    for j in range(max(0, col - 1), min(self.max_col, col + 2)):
-                        if i == row and j == col:
-                            continue
-                        fish.neighbours.append(self.rows[i][j])
+        self.levels = grid.digits(fish_def)
 
     def count_flashes(self) -> int:
-        total = 0
-        for fish in self.all_fish:
-            fish.inc()
-        for fish in self.all_fish:
-            total += fish.check_flash()
-        for fish in self.all_fish:
-            fish.reset()
-        return total
+        """One step: every octopus gains a level, and the ones past 9 flash."""
+        levels = self.levels
+        levels += 1
+        flashed = np.zeros(levels.shape, dtype=bool)
+        while True:
+            flashing = (levels > 9) & ~flashed
+            if not flashing.any():
+                break
+            flashed |= flashing
+            levels += grid.neighbour_count(flashing)
+        levels[flashed] = 0
+        return int(flashed.sum())
 
     def __str__(self):
-        return "\n".join(["".join([str(j) for j in i]) for i in self.rows])
+        return "\n".join(grid.to_lines(self.levels + ord("0")))
 
 
 def test_example(example: List[str]):
     pool = Pool(example)
-    assert str(pool.rows[0][0]) == "5"
+    assert pool.levels[0, 0] == 5
     assert str(pool) == "\n".join(example)
     print(pool)
     print()
@@ -117,7 +82,7 @@ def test_part1() -> None:
 def test_all_flash(example: List[str]):
     pool = Pool(example)
     rounds = 1
-    while pool.count_flashes() < len(pool.all_fish):
+    while pool.count_flashes() < pool.levels.size:
         rounds += 1
     assert rounds == 195
 
@@ -125,7 +90,7 @@ def test_all_flash(example: List[str]):
 def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
     pool = Pool(inputs)
     rounds = 1
-    while pool.count_flashes() < len(pool.all_fish):
+    while pool.count_flashes() < pool.levels.size:
         rounds += 1
     return rounds
 
@@ -136,10 +101,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
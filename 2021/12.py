@@ -1,11 +1,13 @@
 """Day X"""
 
-import os
-import pytest
-from typing import Dict, Iterable, List
+from typing import Dict, Iterator, List
 
+from aoc import search
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """start-A
 start-b
@@ -16,7 +18,7 @@ A-end
 b-end""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def example2() -> List[str]:
     return """dc-end
 HN-start
@@ -30,7 +32,7 @@ kj-HN
 kj-dc""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def example3() -> List[str]:
     return """fs-end
 he-DX
@@ -53,6 +55,12 @@ start-RW""".splitlines()
 
 
 class Network:
+    """Caves by number, with the small ones also numbered as bits of a mask.
+
+    A search state packs the cave, the mask of small caves visited so far
+    and whether a small cave has been visited twice into one int.
+    """
+
     def __init__(self, defs: List[str]) -> None:
         self.edges: Dict[str, List[str]] = {}
         for path_def in defs:
@@ -61,69 +69,61 @@ class Network:
             self.edges.setdefault(node_b, [])
             self.edges[node_a].append(node_b)
             self.edges[node_b].append(node_a)
-
-    def paths(
-        self, start_node, end_node, history: List[str] = None
-    ) -> Iterable[List[str]]:
-        if history is None:
-            history = []
-        history.append(start_node)
-        # print(f"{start_node} {history}")
-        if start_node == end_node:
-            yield history
-        else:
-            for next_node in self.edges[start_node]:
-                if (next_node.lower() == next_node) and (next_node in history):
-                    continue
-                yield from self.paths(next_node, end_node, history.copy())
-
-    def paths2(
-        self, start_node, end_node, history: List[str] = None, dupe_allowed: bool = True
-    ) -> Iterable[List[str]]:
-        if history is None:
-            history = []
-        history.append(start_node)
-        # print(f"{start_node} {dupe_allowed} {history}")
-        if start_node == end_node:
-            yield history
-        else:
-            for next_node in self.edges[start_node]:
-                if next_node.lower() == next_node:
-                    if next_node == "start":
-                        continue
-                    if next_node in history:
-                        if dupe_allowed:
-                            yield from self.paths2(
-                                next_node, end_node, history.copy(), dupe_allowed=False
-                            )
-                        continue
-                yield from self.paths2(
-                    next_node, end_node, history.copy(), dupe_allowed=dupe_allowed
-                )
+        self.names = list(self.edges)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.bits = [0] * len(self.names)
+        small = [i for i in self.names if i.lower() == i]
+        for bit, name in enumerate(small):
+            self.bits[self.index[name]] = 1 << bit
+        self.links = [[self.index[j] for j in self.edges[i]] for i in self.names]
+        self.caves = len(self.names)
+        self.masks = 1 << len(small)
+
+    def state(self, cave: int, visited: int, twice: bool) -> int:
+        return (twice * self.masks + visited) * self.caves + cave
+
+    def count_paths(self, start_node, end_node, dupe_allowed: bool = False) -> int:
+        """Paths visiting small caves once (and one of them twice if allowed)."""
+        start, end = self.index[start_node], self.index[end_node]
+        caves, masks, bits, links = self.caves, self.masks, self.bits, self.links
+
+        def onward(state: int) -> Iterator[int]:
+            state, cave = divmod(state, caves)
+            twice, visited = divmod(state, masks)
+            for next_cave in links[cave]:
+                bit = bits[next_cave]
+                if not visited & bit:
+                    yield self.state(next_cave, visited | bit, twice)
+                elif dupe_allowed and not twice and next_cave != start:
+                    yield self.state(next_cave, visited, True)
+
+        return search.count_paths(
+            self.state(start, bits[start], False),
+            onward,
+            lambda state: state % caves == end,
+        )
 
 
 def test_example(example: List[str]):
     net = Network(example)
-    print(net.edges)
-    for path in net.paths("start", "end"):
-        print(path)
-    paths = list(net.paths("start", "end"))
-    assert len(paths) == 10
-    assert len(list(net.paths2("start", "end"))) == 36
+    assert net.count_paths("start", "end") == 10
+    assert net.count_paths("start", "end", dupe_allowed=True) == 36
 
 
 def test_example2(example2: List[str]):
-    assert len(list(Network(example2).paths("start", "end"))) == 19
-    assert len(list(Network(example2).paths2("start", "end"))) == 103
+    net = Network(example2)
+    assert net.count_paths("start", "end") == 19
+    assert net.count_paths("start", "end", dupe_allowed=True) == 103
 
 
 def test_example3(example3: List[str]):
-    assert len(list(Network(example3).paths("start", "end"))) == 226
-    assert len(list(Network(example3).paths2("start", "end"))) == 3509
+    net = Network(example3)
+    assert net.count_paths("start", "end") == 226
+    assert net.count_paths("start", "end", dupe_allowed=True) == 3509
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return len(list(Network(inputs).paths("start", "end")))
+def part1(inputs: List[str]) -> int:
+    return parsed(inputs, Network).count_paths("start", "end")
 
 
 def test_part1() -> None:
@@ -131,8 +131,8 @@ def test_part1() -> None:
     assert part1(inputs) == 5576
 
 
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return len(list(Network(inputs).paths2("start", "end")))
+def part2(inputs: List[str]) -> int:
+    return parsed(inputs, Network).count_paths("start", "end", dupe_allowed=True)
 
 
 def test_part2() -> None:
@@ -141,10 +141,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,11 +1,12 @@
 """Day X"""
 
-import os
-import pytest
 from typing import List, MutableSet, Tuple
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """6,10
 0,14
@@ -30,7 +31,7 @@ fold along y=7
 fold along x=5""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def example_grid() -> str:
     return """...#..#..#.
 ....#......
@@ -49,7 +50,7 @@ def example_grid() -> str:
 #.#........"""
 
 
-@pytest.fixture
+@fixture
 def example_fold() -> str:
     return """#.##..#..#.
 #...#......
@@ -160,10 +161,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,13 +1,14 @@
 """Day 14"""
 
-import os
-import pytest
 import timeit
 from typing import Dict, Iterable, List, Tuple
 from functools import cache
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """NNCB
 
@@ -167,10 +168,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
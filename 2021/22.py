@@ -1,13 +1,16 @@
 """Day 22"""
 
 from __future__ import annotations
-import os
-import pytest
 import re
-from typing import Dict, List, MutableSet, Tuple
+from typing import Dict, List, MutableSet, Optional, Tuple
 
+from aoc import counters
+from aoc.intervals import Range, covering, difference, intersection, overlapping
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """on x=-20..26,y=-36..17,z=-47..7
 on x=-20..33,y=-21..23,z=-26..28
@@ -33,7 +36,7 @@ on x=-54112..-39298,y=-85059..-49293,z=-27449..7877
 on x=967..23432,y=45373..81175,z=27513..53682""".splitlines()
 
 
-@pytest.fixture
+@fixture
 def example2() -> List[str]:
     return """on x=-5..47,y=-31..22,z=-19..33
 on x=-44..5,y=-27..21,z=-14..35
@@ -99,6 +102,8 @@ off x=-93533..-4276,y=-16170..68771,z=-104985..-24507""".splitlines()
 
 # pylint: disable=too-many-arguments
 
+AXES = ("x", "y", "z")
+
 
 class Cuboid:
     def __init__(self, x0: int, x1: int, y0: int, y1: int, z0: int, z1: int) -> None:
@@ -115,71 +120,38 @@ class Cuboid:
         return total
 
     def overlaps(self, other: Cuboid) -> bool:
-        for axis in ["x", "y", "z"]:
-            if other.points[axis][1] < self.points[axis][0]:
-                return False
-            if self.points[axis][1] < other.points[axis][0]:
-                return False
-        return True
+        mine, theirs = self.points, other.points
+        return (
+            overlapping(mine["x"], theirs["x"])
+            and overlapping(mine["y"], theirs["y"])
+            and overlapping(mine["z"], theirs["z"])
+        )
 
     def within(self, other: Cuboid) -> bool:
-        for axis in ["x", "y", "z"]:
-            if self.points[axis][0] < other.points[axis][0]:
-                return False
-            if self.points[axis][1] > other.points[axis][1]:
-                return False
-        return True
+        return all(covering(other.points[i], self.points[i]) for i in AXES)
 
     def split(self, other: Cuboid) -> List[Cuboid]:
+        """The parts of this cuboid outside other, as at most six cuboids.
+
+        Going one axis at a time, the slices of what is left that lie beyond
+        other along that axis are cut off whole, and what is left shrinks to
+        other's range on it.
+        """
+        counters.count("Cuboid.split")
         if not self.overlaps(other):
             return [self]
-
-        if self.within(other):
-            return []
-
-        subcube: Dict[str, List[Tuple[int, int]]] = {"x": [], "y": [], "z": []}
-        for axis in ["x", "y", "z"]:
-            new_pairs = subcube[axis]
-            start = self.points[axis][0]
-            end = self.points[axis][1]
-            mid1 = other.points[axis][0]
-            mid2 = other.points[axis][1]
-            # assert mid1 <= end and mid2 >= start
-            if mid1 <= start:
-                if mid2 < end:
-                    new_pairs.append((start, mid2))
-                    new_pairs.append((mid2 + 1, end))
-                else:
-                    new_pairs.append((start, end))
-            else:  # start < mid1 (
-                new_pairs.append((start, mid1 - 1))
-                if mid2 < end:
-                    new_pairs.append((mid1, mid2))
-                    new_pairs.append((mid2 + 1, end))
-                else:
-                    new_pairs.append((mid1, end))
         cubes: List[Cuboid] = []
-        check_volume = 0
-        # print(self.points)
-        # print("-" + str(other.points))
-
-        for x0, x1 in subcube["x"]:
-            for y0, y1 in subcube["y"]:
-                for z0, z1 in subcube["z"]:
-                    new_cube = Cuboid(x0, x1, y0, y1, z0, z1)
-                    # print("  " + str(new_cube.points))
-                    check_volume += new_cube.volume
-                    if new_cube.overlaps(other):
-                        if not new_cube.within(other):
-                            raise Exception(
-                                f"{new_cube.points} !< {other.points} ({self.points})"
-                            )
-                    #                        assert new_cube.within(other)
-                    else:
-                        cubes.append(new_cube)
-        assert check_volume == self.volume
+        left = dict(self.points)
+        for axis in AXES:
+            for part in difference(left[axis], other.points[axis]):
+                cubes.append(Cuboid.from_points({**left, axis: part}))
+            left[axis] = intersection(left[axis], other.points[axis])
         return cubes
 
+    @classmethod
+    def from_points(cls, points: Dict[str, Range]) -> Cuboid:
+        return cls(*points["x"], *points["y"], *points["z"])
+
 
 class LightGrid:
     def __init__(self, size=50) -> None:
@@ -212,19 +184,27 @@ class LightGrid:
                     ):
                         action((x, y, z))
 
-    def layer(self, spec: str):
+    def layer(self, spec: str, clip: Optional[Range] = None):
+        """Switch a cuboid on or off, only the part of it within clip on every
+        axis if given."""
         if matched := re.match(
             r"(on|off) x=([^.]+)..([^,]+),y=([^.]+)..([^,]+),z=([^.]+)..(\S+)$", spec
         ):
-            op, x_min, x_max, y_min, y_max, z_min, z_max = matched.groups()
+            op, *bounds = matched.groups()
             if op == "on":
                 action = self.add_layer
             else:
                 action = self.intersect
 
-            action(
-                int(x_min), int(x_max), int(y_min), int(y_max), int(z_min), int(z_max)
-            )
+            edges: List[int] = []
+            for low, high in zip(bounds[::2], bounds[1::2]):
+                edge: Optional[Range] = (int(low), int(high))
+                if clip is not None:
+                    edge = intersection(edge, clip)
+                if edge is None:
+                    return
+                edges.extend(edge)
+            action(*edges)
 
     def add_layer(
         self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int
@@ -234,6 +214,7 @@ class LightGrid:
     def add_cube(self, new_cube: Cuboid):
         if len(self.layers) > 1000000:
             raise Exception("Too many layers")
+        counters.count("LightGrid.overlap_checks", len(self.layers))
         overlaps: List[Cuboid] = [i for i in self.layers if new_cube.overlaps(i)]
         if not overlaps:
             self.layers.add(new_cube)
@@ -258,6 +239,7 @@ class LightGrid:
         self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int
     ):
         hole = Cuboid(x_min, x_max, y_min, y_max, z_min, z_max)
+        counters.count("LightGrid.overlap_checks", len(self.layers))
         for cube in list(self.layers):
             if cube.overlaps(hole):
                 self.layers.remove(cube)
@@ -270,6 +252,10 @@ def test_example(example: List[str]):
     for row in example:
         grid.switch(row)
     assert len(grid.on) == 590784
+    clipped = LightGrid()
+    for row in example:
+        clipped.layer(row, clip=(-50, 50))
+    assert sum([i.volume for i in clipped.layers]) == 590784
 
 
 def test_example2(example2: List[str]):
@@ -286,8 +272,8 @@ def test_example2(example2: List[str]):
 def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
     grid = LightGrid()
     for row in inputs:
-        grid.switch(row)
-    return len(grid.on)
+        grid.layer(row, clip=(-grid.size, grid.size))
+    return sum([i.volume for i in grid.layers])
 
 
 def test_part1() -> None:
@@ -308,10 +294,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
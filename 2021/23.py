@@ -1,207 +1,125 @@
 """Day X"""
 
-import os
-import pytest
-import re
-from typing import AbstractSet, Iterator, List, MutableSet, Tuple
+from typing import Dict, Iterator, List, Tuple
 
+from aoc import search
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
+# Columns of the hallway cells a pod may stop in, and of the rooms' doors.
+HALL = (0, 1, 3, 5, 7, 9, 10)
+DOORS = (2, 4, 6, 8)
+PODS = ".ABCD"
+ENERGY = (0, 1, 10, 100, 1000)
 
-class GameBoard:
 
-    link = {
-        "aaa": [("aa", 1)],
-        "aa": [("aaa", 1), ("ab", 2), ("a1", 2)],
-        "a0": [("a1", 1)],
-        "b0": [("b1", 1)],
-        "c0": [("c1", 1)],
-        "d0": [("d1", 1)],
-        "a1": [("a0", 1), ("aa", 2), ("ab", 2)],
-        "b1": [("b0", 1), ("ab", 2), ("bc", 2)],
-        "c1": [("c0", 1), ("bc", 2), ("cd", 2)],
-        "d1": [("d0", 1), ("cd", 2), ("dd", 2)],
-        "dd": [("ddd", 1), ("cd", 2), ("d1", 2)],
-        "ddd": [("dd", 1)],
-        "ab": [("aa", 2), ("bc", 2), ("a1", 2), ("b1", 2)],
-        "bc": [("ab", 2), ("cd", 2), ("b1", 2), ("c1", 2)],
-        "cd": [("bc", 2), ("dd", 2), ("c1", 2), ("d1", 2)],
-    }
-
-    cost = {
-        "A": 1,
-        "B": 10,
-        "C": 100,
-        "D": 1000,
-    }
-
-    can = {
-        "any": ["aaa", "aa", "ab", "bc", "cd", "dd", "ddd"],
-        "A": ["a0", "a1"],
-        "B": ["b0", "b1"],
-        "C": ["c0", "c1"],
-        "D": ["d0", "d1"],
-    }
-
-    def __init__(self) -> None:
-        self.pos = dict(
-            (j, ".")
-            for j in [i + "0" for i in ["a", "b", "c", "d"]]
-            + [i + "1" for i in ["a", "b", "c", "d"]]
-            + ["aa", "aaa", "dd", "ddd", "ab", "bc", "cd"]
+class GameBoard:
+    """Burrow states as ints, three bits a cell: 0 for empty, 1-4 for A-D.
+
+    Cell i is hallway stop i for i < 7, then each room from the top down.
+    """
+
+    def __init__(self, depth: int = 2) -> None:
+        self.depth = depth
+        self.size = len(HALL) + 4 * depth
+        self.pos = [0] * self.size
+        self.rooms = [
+            [len(HALL) + room * depth + level for level in range(depth)]
+            for room in range(4)
+        ]
+        # (room cell, stop) -> steps between them, and the cells in the way.
+        self.routes: Dict[Tuple[int, int], Tuple[int, List[int]]] = {}
+        for room, door in enumerate(DOORS):
+            for level, cell in enumerate(self.rooms[room]):
+                above = self.rooms[room][:level]
+                for stop, col in enumerate(HALL):
+                    between = [
+                        i
+                        for i, other in enumerate(HALL)
+                        if min(col, door) < other < max(col, door)
+                    ]
+                    steps = abs(col - door) + level + 1
+                    self.routes[cell, stop] = steps, above + between
+        home = [0] * len(HALL) + [i // depth + 1 for i in range(4 * depth)]
+        self.goal = self.encode(home)
+
+    def room_cell(self, room: int, level: int) -> int:
+        return self.rooms[room][level]
+
+    def encode(self, cells: List[int]) -> int:
+        return sum(pod << 3 * i for i, pod in enumerate(cells))
+
+    def decode(self, state: int) -> List[int]:
+        return [state >> 3 * i & 7 for i in range(self.size)]
+
+    def moves(self, state: int) -> Iterator[Tuple[int, int]]:
+        """(next state, cost) for the pods that can move into or out of a room."""
+        cells = self.decode(state)
+        for stop in range(len(HALL)):
+            pod = cells[stop]
+            if not pod:
+                continue
+            room = [cells[i] for i in self.rooms[pod - 1]]
+            if any(i not in (0, pod) for i in room):
+                continue  # Strangers still to leave.
+            cell = self.rooms[pod - 1][room.count(0) - 1]
+            steps, between = self.routes[cell, stop]
+            if not any(cells[i] for i in between):
+                # Going home never gets in anyone's way, so do that first.
+                yield moved(state, pod, stop, cell), steps * ENERGY[pod]
+                return
+        for room, levels in enumerate(self.rooms):
+            occupied = [i for i in levels if cells[i]]
+            if all(cells[i] == room + 1 for i in occupied):
+                continue  # Empty, or only pods already home.
+            cell = occupied[0]
+            pod = cells[cell]
+            for stop in range(len(HALL)):
+                steps, between = self.routes[cell, stop]
+                if not cells[stop] and not any(cells[i] for i in between):
+                    yield moved(state, pod, cell, stop), steps * ENERGY[pod]
+
+    def least_cost(self, state: int) -> int:
+        """A lower bound on the cost left: each pod straight to its room's door."""
+        cells = self.decode(state)
+        total = 0
+        for stop, col in enumerate(HALL):
+            pod = cells[stop]
+            if pod:
+                total += (abs(col - DOORS[pod - 1]) + 1) * ENERGY[pod]
+        for room, door in enumerate(DOORS):
+            for level, cell in enumerate(self.rooms[room]):
+                pod = cells[cell]
+                if pod and pod != room + 1:
+                    steps = abs(door - DOORS[pod - 1]) + level + 2
+                    total += steps * ENERGY[pod]
+        return total
+
+    def solve(self) -> int:
+        found = search.astar(
+            [self.encode(self.pos)],
+            self.moves,
+            lambda state: state == self.goal,
+            self.least_cost,
         )
-        self.min_home_cost = -1
-
-    def find_path(
-        self,
-        pod: str,
-        loc: str,
-        avoid: AbstractSet[str],
-        path_cost: int,
-        verbose: bool = False,
-    ) -> Iterator[Tuple[str, int]]:
-        if verbose:
-            print(f"FP {pod} {loc} {avoid}")
-        pod_loc = pod.lower()
-        if loc == pod_loc + "0":
-            if verbose:
-                print(f"home {loc}")
-            return
-        if loc == pod_loc + "1" and self.pos[pod_loc + "0"] == pod:
-            if verbose:
-                print(f"home {loc}")
-            return
-        for new_loc, link_cost in self.link[loc]:
-            if verbose:
-                print(
-                    f"  {new_loc}? {new_loc in self.can['any']} {new_loc in self.can[pod]}"
-                )
-            if (
-                (
-                    new_loc in self.can["any"]
-                    or new_loc in self.can[pod]
-                    or new_loc
-                    == loc.replace("0", "1")  # Handle d0 -> d1 transitional case
-                )
-                and new_loc not in avoid
-                and self.pos[new_loc] == "."
-            ):
-                # print(f"{loc} {pod} .. {new_loc} {avoid}")
-                if new_loc == pod_loc + "1":
-                    if self.pos[pod_loc + "0"] == ".":
-                        new_loc = pod_loc + "0"
-                        link_cost += 1
-                        if verbose:
-                            print("Force home")
-                    elif self.pos[pod_loc + "0"] != pod:
-                        if verbose:
-                            print(f"Can't home: clash with {self.pos[pod_loc + '0']}")
-                        continue
-                cost = path_cost + (link_cost * self.cost[pod])
-                yield from self.find_path(
-                    pod, new_loc, avoid | set([loc]), cost, verbose=verbose
-                )
-                if new_loc in self.can["any"] or new_loc in self.can[pod]:
-                    yield new_loc, cost
-
-    def moves(self, loc: str, verbose: bool = False) -> Iterator[Tuple[str, int]]:
-        pod = self.pos[loc]
-        return self.find_path(pod, loc, set([loc]), 0, verbose=verbose)
-
-    def home_move(self, pod: str, loc: str) -> bool:
-        if loc == pod.lower() + "0":
-            return True
-        if loc == pod.lower() + "1" and self.pos[pod.lower() + "0"] == pod:
-            return True
-        return False
-
-    def homed(self) -> bool:
-        for pod in ["a", "b", "c", "d"]:
-            if self.pos[pod + "0"] != pod.upper():
-                return False
-            if self.pos[pod + "1"] != pod.upper():
-                return False
-        return True
-
-    @property
-    def state(self):
-        return ",".join(self.pos.values())
+        return found.cost
 
     def __str__(self):
-        x = self.pos
-        return (
-            f"{x['aaa']}{x['aa']} {x['ab']} {x['bc']} {x['cd']} {x['dd']}{x['ddd']}\n"
-            f"##{x['a1']} {x['b1']} {x['c1']} {x['d1']}##\n"
-            f"##{x['a0']} {x['b0']} {x['c0']} {x['d0']}##"
-        )
+        x = [PODS[i] for i in self.pos]
+        hall = dict(zip(HALL, x))
+        rows = ["".join(hall.get(i, ".") for i in range(11))]
+        for level in range(self.depth):
+            pods = [x[self.room_cell(room, level)] for room in range(4)]
+            rows.append(f"##{'#'.join(pods)}##")
+        return "\n".join(rows)
+
+
+def moved(state: int, pod: int, source: int, target: int) -> int:
+    """state with pod moved out of source into the empty target cell."""
+    return state - (pod << 3 * source) + (pod << 3 * target)
 
-    def solve(self, start_cost: int, avoid_state: MutableSet[str]) -> Iterator[int]:
-
-        print(start_cost)
-        if self.min_home_cost > 0 and start_cost > self.min_home_cost:
-            return
-        print(str(self))
-        if self.homed():
-            print(f"HOMED {start_cost}")
-            if start_cost < self.min_home_cost:
-                self.min_home_cost = start_cost
-            yield start_cost
-            return
-        stack = []
-        for loc, pod in self.pos.items():
-            if pod != ".":
-                for new_loc, move_cost in self.moves(
-                    loc, verbose=(pod == "B" and loc == "bc" and self.pos["b1"] == ".")
-                ):
-                    print(f"{pod} {loc} -> {new_loc} ({move_cost})")
-                    if (
-                        self.min_home_cost < 0
-                        or start_cost + move_cost < self.min_home_cost
-                    ):
-                        stack.append((pod, loc, new_loc, move_cost))
-        if not stack:
-            avoid_state.add(self.state)
-            yield 0
-            return
-        avoid: MutableSet[str] = avoid_state.union(set([self.state]))
-        moved = False
-        # Sort by minimal move_cost
-        stack = sorted(stack, key=lambda x: x[3])
-        print(str(self))
-        for pod, loc, new_loc, move_cost in stack:
-            # print(f"{start_cost} {loc} {pod} -> {new_loc}")
-            assert self.pos[loc] == pod
-            if self.home_move(pod, new_loc):
-                print(str(self))
-
-                print(f"HM {pod} {loc} -> {new_loc}")
-                self.pos[new_loc] = pod
-                self.pos[loc] = "."
-                if self.homed():
-                    print(f"HOMED {start_cost + move_cost}")
-                    if start_cost + move_cost < self.min_home_cost:
-                        self.min_home_cost = start_cost + move_cost
-                    yield start_cost + move_cost
-                else:
-                    yield from self.solve(start_cost + move_cost, avoid)
-                moved = True
-                self.pos[new_loc] = "."
-                self.pos[loc] = pod
-        if moved:
-            return
-        found = 0
-        for pod, loc, new_loc, move_cost in stack:
-            self.pos[new_loc] = pod
-            self.pos[loc] = "."
-            if self.state not in avoid_state:
-                for cost in self.solve(start_cost + move_cost, avoid):
-                    found += 1
-                    yield cost
-            self.pos[loc] = pod
-            self.pos[new_loc] = "."
-        for state in avoid:
-            avoid_state.add(state)
-
-
-@pytest.fixture
+
+@fixture
 def example() -> List[str]:
     return """#############
 #...........#
@@ -210,54 +128,49 @@ def example() -> List[str]:
   #########""".splitlines()
 
 
+UNFOLDED = ["  #D#C#B#A#", "  #D#B#A#C#"]
+
+
 def build_board(inputs: List[str]) -> GameBoard:
-    board = GameBoard()
-    row = [i for i in inputs[2].split("#") if i.strip()]
-    assert len(row) == 4
-    for letter, pod in zip(["a", "b", "c", "d"], row):
-        board.pos[letter + "1"] = pod
-    row = [i for i in inputs[3].split("#") if i.strip()]
-    assert len(row) == 4
-    for letter, pod in zip(["a", "b", "c", "d"], row):
-        board.pos[letter + "0"] = pod
+    rows = [[i for i in row.split("#") if i.strip()] for row in inputs[2:-1]]
+    board = GameBoard(depth=len(rows))
+    for level, row in enumerate(rows):
+        assert len(row) == 4
+        for room, pod in enumerate(row):
+            board.pos[board.room_cell(room, level)] = PODS.index(pod)
     return board
 
 
 def test_example(example: List[str]):
     board = build_board(example)
-    min_cost = 9999999999
-    for i in board.solve(0, set()):
-        if i > 0 and i < min_cost:
-            print(f"MIN HOME {i}")
-            board.min_home_cost = i
-            min_cost = i
-    costs = [i for i in board.solve(0, set()) if i > 0]
-    assert min(costs) == 12521
+    assert str(board).splitlines()[1:] == ["##B#C#B#D##", "##A#D#C#A##"]
+    assert board.solve() == 12521
+
+
+def test_example2(example: List[str]):
+    assert part2(example) == 44169
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return 0
+def part1(inputs: List[str]) -> int:
+    return build_board(inputs).solve()
 
 
 def test_part1() -> None:
     inputs = get_inputs()
-    assert part1(inputs) == 1
+    assert part1(inputs) == 13520
 
 
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return 0
+def part2(inputs: List[str]) -> int:
+    return build_board(inputs[:3] + UNFOLDED + inputs[3:]).solve()
 
 
 def test_part2() -> None:
     inputs = get_inputs()
-    assert part2(inputs) == 1
+    assert part2(inputs) == 48708
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".data"):
-        return [i.strip() for i in open(base + ".data")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
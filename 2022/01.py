@@ -1,18 +1,21 @@
 """Day X"""
 
-import os
-import pytest
-from typing import List
+import heapq
+from typing import Iterable, Iterator, List
+
+from aoc.loader import iter_lines, read_lines
+from aoc.testing import fixture
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
+
+
+def stream_inputs() -> Iterator[str]:
+    return iter_lines(__file__)
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return """1000
 2000
@@ -30,21 +33,20 @@ def example() -> List[str]:
 10000""".splitlines()
 
 
-def split_elves(lines: List[str]):
-    elves: List[int] = []
+def split_elves(lines: Iterable[str]) -> Iterator[int]:
+    """Each elf's total, as soon as its last line is read."""
     elf = 0
     for line in lines:
         if cals := line.strip():
             elf += int(cals)
         else:
-            elves.append(elf)
+            yield elf
             elf = 0
     if elf:
-        elves.append(elf)
-    return elves
+        yield elf
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
+def part1(inputs: Iterable[str]) -> int:  # pylint: disable=unused-argument
     return max(split_elves(inputs))
 
 
@@ -57,15 +59,19 @@ def test_part1() -> None:
     assert part1(inputs) == 72602
 
 
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    top3 = sorted(split_elves(inputs), reverse=True)[0:3]
-    return sum(top3)
+def part2(inputs: Iterable[str]) -> int:  # pylint: disable=unused-argument
+    return sum(heapq.nlargest(3, split_elves(inputs)))
 
 
 def test_example2(example):
     assert part2(example) == 45000
 
 
+def test_stream(example):
+    assert part1(iter(example)) == 24000
+    assert part2(iter(example)) == 45000
+
+
 def test_part2() -> None:
     inputs = get_inputs()
     assert part2(inputs) == 207410
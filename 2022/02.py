@@ -1,8 +1,9 @@
 """Day 2"""
 
-import os
-import pytest
-from typing import List
+from typing import Iterable, Iterator, List
+
+from aoc.loader import iter_lines, read_lines
+from aoc.testing import fixture
 
 SCORE = {"rock": 1, "paper": 2, "scissors": 3, "win": 6, "draw": 3, "lose": 0}
 
@@ -35,14 +36,14 @@ def decrypt(a: str, outcome: str) -> str:
     return OUTCOME[a][outcome]
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return """A Y
 B X
 C Z""".splitlines()
 
 
-def total_score(rows: List[str]) -> int:
+def total_score(rows: Iterable[str]) -> int:
     score = 0
     for row in rows:
         a, b = row.strip().split(" ")
@@ -50,7 +51,7 @@ def total_score(rows: List[str]) -> int:
     return score
 
 
-def decrypt_score(rows: List[str]) -> int:
+def decrypt_score(rows: Iterable[str]) -> int:
     score = 0
     for row in rows:
         a, b = row.strip().split(" ")
@@ -70,7 +71,12 @@ def test_example2(example):
     assert decrypt_score(example) == 12
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
+def test_stream(example):
+    assert total_score(iter(example)) == 15
+    assert decrypt_score(iter(example)) == 12
+
+
+def part1(inputs: Iterable[str]) -> int:  # pylint: disable=unused-argument
     return total_score(inputs)
 
 
@@ -79,7 +85,7 @@ def test_part1() -> None:
     assert part1(inputs) == 9651
 
 
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
+def part2(inputs: Iterable[str]) -> int:  # pylint: disable=unused-argument
     return decrypt_score(inputs)
 
 
@@ -89,10 +95,11 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
+
+
+def stream_inputs() -> Iterator[str]:
+    return iter_lines(__file__)
 
 
 def test_get_inputs() -> None:
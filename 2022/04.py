@@ -1,9 +1,11 @@
 """Day X"""
 
-import os
-import pytest
 from typing import List
 
+from aoc.intervals import covering, overlapping
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """2-4,6-8
 2-3,4-5
 5-7,7-9
@@ -12,7 +14,7 @@ INPUT = """2-4,6-8
 2-6,4-8"""
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -20,41 +22,17 @@ def example() -> List[str]:
 def pairs(lines: List[str]):
     for row in lines:
         a, b = row.split(",")
-        yield ([int(i) for i in a.split("-")], [int(i) for i in b.split("-")])
+        low_a, high_a = a.split("-")
+        low_b, high_b = b.split("-")
+        yield (int(low_a), int(high_a)), (int(low_b), int(high_b))
 
 
 def count_overlaps(input: List[str]) -> int:
-    count = 0
-    for a, b in pairs(input):
-        # sort
-        if a[0] > b[0] or (a[0] == b[0] and a[1] <= b[1]):
-            a, b = b, a
-        if b[0] >= a[0] and b[1] <= a[1]:
-            count += 1
-    return count
-
-
-def has_overlap(a0, a1, b0, b1) -> bool:
-    if a0 in range(b0, b1 + 1):
-        return True
-    if a1 in range(b0, b1 + 1):
-        return True
-    if b0 in range(a0, a1 + 1):
-        return True
-    if b1 in range(a0, a1 + 1):
-        return True
-    return False
+    return sum(1 for a, b in pairs(input) if covering(a, b) or covering(b, a))
 
 
 def count_any_overlaps(input: List[str]) -> int:
-    count = 0
-    for (
-        a,
-        b,
-    ) in pairs(input):
-        if has_overlap(a[0], a[1], b[0], b[1]):
-            count += 1
-    return count
+    return sum(1 for a, b in pairs(input) if overlapping(a, b))
 
 
 def test_example(example):
@@ -81,10 +59,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,10 +1,11 @@
 """Day X"""
 
-import os
-import pytest
 from typing import List, Tuple
 import re
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """    [D]    
 [N] [C]    
 [Z] [M] [P]
@@ -65,7 +66,7 @@ class Yard:
         return "".join(heads)
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return INPUT.splitlines()
 
@@ -138,10 +139,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.rstrip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__, strip=str.rstrip)
 
 
 def test_get_inputs() -> None:
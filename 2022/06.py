@@ -1,11 +1,12 @@
 """Day X"""
 
-import os
-import pytest
 from typing import List
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
-@pytest.fixture
+
+@fixture
 def example() -> str:
     input = """mjqjpqmgbljsphdztnvjfqwrcgsmlb"""
     return input
@@ -44,10 +45,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
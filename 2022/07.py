@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-import os
-import pytest
 from typing import Dict, List, Union
 
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
+
 INPUT = """$ cd /
 $ ls
 dir a
@@ -31,7 +32,7 @@ $ ls
 7214296 k"""
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -123,8 +124,8 @@ def test_example(example):
     assert min(root.find_bigger(8381165)) == 24933642
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    root = parse_tree(inputs)
+def part1(inputs: List[str]) -> int:
+    root = parsed(inputs, parse_tree)
     return sum(root.find_smaller(100000))
 
 
@@ -133,8 +134,8 @@ def test_part1() -> None:
     assert part1(inputs) == 1453349
 
 
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    root = parse_tree(inputs)
+def part2(inputs: List[str]) -> int:
+    root = parsed(inputs, parse_tree)
     usage = root.size
     total = 70000000
     needed = 30000000
@@ -149,10 +150,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,9 +1,13 @@
 """Day X"""
 
-import os
-import pytest
 from typing import List
 
+import numpy as np
+
+from aoc import grid
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
+
 INPUT = """30373
 25512
 65332
@@ -11,98 +15,54 @@ INPUT = """30373
 35390"""
 
 
+def turned(cells: np.ndarray) -> List[np.ndarray]:
+    """Views of cells with rows running in from the left, right, top and bottom.
+
+    Writing to a view writes to cells, so results worked out along the rows
+    of each view land back in place.
+    """
+    return [cells, cells[:, ::-1], cells.T, cells.T[:, ::-1]]
+
+
+def viewing_distances(trees: np.ndarray) -> np.ndarray:
+    """How far each tree can see along its row, towards the row's end."""
+    distance = np.zeros(trees.shape, dtype=np.int64)
+    blocked = np.zeros(trees.shape, dtype=bool)
+    for step in range(1, trees.shape[1]):
+        ahead = grid.shifted(trees, 0, step, fill=255)
+        distance += ~blocked & (ahead != 255)
+        blocked |= ahead >= trees
+    return distance
+
+
 class Forest:
     def __init__(self, map: List[str]) -> None:
-        self.trees = [[int(j) for j in i] for i in map]
-        self.visible = [[0] * len(self.trees[0]) for _ in map]
-        self.mark_visible()
-
-    def by_row(self, reverse=False):
-        for i in range(len(self.trees)):
-            index = len(self.trees) - i - 1 if reverse else i
-            yield index, self.trees[index]
-
-    def by_column(self, reverse=False):
-        for i in range(len(self.trees[0])):
-            index = len(self.trees[0]) - 1 - i if reverse else i
-            yield index, [j[index] for j in self.trees]
-
-    def mark_visible(self):
-        iter_by_row = [self.by_row(), self.by_row(reverse=True)]
-        # , self.by_column(), self.by_column(reverse=True)]
-        for iter in iter_by_row:
-            x, base = next(iter)
-            base = base.copy()  # we are going to update it!
-            for i, val in enumerate(base):
-                self.visible[x][i] = 1
-                # assert val == self.trees[x][i]
-            for x, row in iter:
-                for i, val in enumerate(row):
-                    # assert val == self.trees[x][i]
-                    if val > base[i]:
-                        # print(f"{val} > {base[i]} ({x},{i})")
-                        self.visible[x][i] = 1
-                        base[i] = val
-
-        iter_by_col = [self.by_column(), self.by_column(reverse=True)]
-        for iter in iter_by_col:
-            y, base = next(iter)
-            base = base.copy()  # we are going to update it!
-            for i, val in enumerate(base):
-                self.visible[i][y] = 1
-                # assert val == self.trees[i][y]
-            for y, row in iter:
-                for i, val in enumerate(row):
-                    # assert val == self.trees[i][y]
-                    if val > base[i]:
-                        # print(f"{val} > {base[i]} ({i},{y})")
-                        self.visible[i][y] = 1
-                        base[i] = val
+        self.trees = grid.digits(map)
+        self.visible = self.mark_visible()
+
+    def mark_visible(self) -> np.ndarray:
+        visible = np.zeros(self.trees.shape, dtype=bool)
+        for trees, seen in zip(turned(self.trees), turned(visible)):
+            # The tallest tree before each one along its row (-1 at the edge).
+            taller = np.maximum.accumulate(trees.astype(np.int8), axis=1)
+            before = np.pad(taller[:, :-1], ((0, 0), (1, 0)), constant_values=-1)
+            seen |= trees > before
+        return visible
 
     def count_visible(self) -> int:
-        return sum(sum(i) for i in self.visible)
-
-    def scenic_score(self, x: int, y: int):
-        h = self.trees[x][y]
-        score = [-1] * 4
-        i = 0
-        while -1 in score:
-            i += 1
-            for dir in range(4):
-                if score[dir] != -1:
-                    continue
-                try:
-                    if dir == 0:
-                        check = self.trees[x + i][y]
-                    elif dir == 1:
-                        if x - i < 0:
-                            raise IndexError
-                        check = self.trees[x - i][y]
-                    elif dir == 2:
-                        check = self.trees[x][y + i]
-                    else:
-                        if y - i < 0:
-                            raise IndexError
-                        check = self.trees[x][y - i]
-                except IndexError:
-                    score[dir] = i - 1
-                if check >= h:
-                    score[dir] = i
-                if score[dir] == 0:
-                    return 0
-        return score[0] * score[1] * score[2] * score[3]
-
-    def best_score(self):
-        top_score = 0
-        for i in range(1, len(self.trees) - 2):
-            for j in range(1, len(self.trees[i]) - 2):
-                score = self.scenic_score(i, j)
-                if score > top_score:
-                    top_score = score
-        return top_score
-
-
-@pytest.fixture
+        return int(self.visible.sum())
+
+    def scenic_scores(self) -> np.ndarray:
+        scores = np.ones(self.trees.shape, dtype=np.int64)
+        for trees, score in zip(turned(self.trees), turned(scores)):
+            score *= viewing_distances(np.ascontiguousarray(trees))
+        return scores
+
+    def best_score(self) -> int:
+        return int(self.scenic_scores().max())
+
+
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -115,7 +75,7 @@ def test_example(example):
 
 
 def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return Forest(inputs).count_visible()
+    return parsed(inputs, Forest).count_visible()
 
 
 def test_part1() -> None:
@@ -124,7 +84,7 @@ def test_part1() -> None:
 
 
 def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return Forest(inputs).best_score()
+    return parsed(inputs, Forest).best_score()
 
 
 def test_part2() -> None:
@@ -133,10 +93,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
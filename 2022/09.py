@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-import os
-import pytest
 from typing import List
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """R 4
 U 4
 L 3
@@ -66,12 +67,12 @@ class Grid:
                 self.seen[i].add(str(self.ropes[i]))
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
 
-@pytest.fixture
+@fixture
 def example2() -> List[str]:
     return [
         i.strip()
@@ -136,10 +137,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
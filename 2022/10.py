@@ -1,9 +1,10 @@
 """Day X"""
 
-from dataclasses import dataclass, field
-import os
-import pytest
-from typing import List, Dict, Callable, Optional
+from typing import List
+
+from aoc.loader import read_lines
+from aoc.testing import fixture
+from aoc.vm import ACC, NOP, InstructionSet, Program, run
 
 INPUT = """addx 15
 addx -11
@@ -153,68 +154,39 @@ noop
 noop"""
 
 
-@dataclass
-class Proc:
-    instr: List[str]
-    pc: int = 0
-    reg_x: int = 1
-    clock: int = 1
-    pending: Optional[int] = None
-
-    def addx(self, n: str):
-        self.pending = int(n)
+CRT: InstructionSet = {"noop": (NOP, 1), "addx": (ACC, 2)}
 
-    def noop(self):
-        pass
 
-    def tick(self) -> int:
-        retval = self.reg_x
-        if self.pending is not None:
-            self.reg_x += self.pending
-            self.pending = None
-        else:
-            instr = self.instr[self.pc]
-            op, *args = instr.split(" ")
-            getattr(self, op)(*args)
-            self.pc += 1
-        self.clock += 1
-        return retval
+class Proc:
+    def __init__(self, instr: List[str]) -> None:
+        self.program = Program.compile(instr, CRT)
 
     def watch(self, points: List[int]) -> int:
+        """The sum of the signal strengths during the given cycles."""
+        track = set(points)
         seen = []
-        track = sorted(points)
-        next_i = 0
-        while self.clock < track[-1]:
-            self.tick()
-            if self.clock >= track[next_i]:
-                next_i += 1
-                print(f"{self.clock} {self.reg_x} : {self.clock * self.reg_x}")
-                seen.append(self.reg_x * self.clock)
+
+        def observe(clock: int, reg_x: int) -> None:
+            if clock in track:
+                seen.append(reg_x * clock)
+
+        run(self.program, 1, observe, detect_loops=False, max_cycles=max(points))
         return sum(seen)
 
     def draw(self) -> str:
         out = []
-        self.pc = 0
-        self.clock = 1
-        self.reg_x = 1
-        self.pending = None
 
-        while self.pc < len(self.instr):
-            x_pos = self.tick()
-            char = (self.clock - 2) % 40
-            visible = False
-            if char == 0 and self.clock > 3:
+        def observe(clock: int, reg_x: int) -> None:
+            char = (clock - 1) % 40
+            if char == 0 and clock > 1:
                 out.append("\n")
-            if char - 1 <= x_pos <= char + 1:
-                visible = True
-                out.append("#")
-            else:
-                out.append(".")
-            # print(f"{self.clock - 1} {char} {self.reg_x} {visible}")
+            out.append("#" if char - 1 <= reg_x <= char + 1 else ".")
+
+        run(self.program, 1, observe, detect_loops=False)
         return "".join(out)
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -223,15 +195,12 @@ def test_example(example):
     ex = Proc(example)
     out = ex.watch([20, 60, 100, 140, 180, 220])
     assert out == 13140
-    assert (
-        ex.draw()
-        == """##..##..##..##..##..##..##..##..##..##..
+    assert ex.draw() == """##..##..##..##..##..##..##..##..##..##..
 ###...###...###...###...###...###...###.
 ####....####....####....####....####....
 #####.....#####.....#####.....#####.....
 ######......######......######......####
 #######.......#######.......#######....."""
-    )
 
 
 def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
@@ -252,22 +221,16 @@ def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
 
 def test_part2() -> None:
     inputs = get_inputs()
-    assert (
-        part2(inputs)
-        == """####..##..###...##....##.####...##.####.
+    assert part2(inputs) == """####..##..###...##....##.####...##.####.
 ...#.#..#.#..#.#..#....#.#.......#....#.
 ..#..#....###..#..#....#.###.....#...#..
 .#...#....#..#.####....#.#.......#..#...
 #....#..#.#..#.#..#.#..#.#....#..#.#....
 ####..##..###..#..#..##..#.....##..####."""
-    )
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-import os
-import pytest
 import re
 from typing import Callable, Iterator, List
 
+from aoc import counters
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """Monkey 0:
   Starting items: 79, 98
   Operation: new = old * 19
@@ -61,6 +63,7 @@ class Monkey:
         return Monkey(items, op_expr, test_divisor, true_monkey, false_monkey)
 
     def inspect(self, all_monkeys: List[Monkey], divide: bool = True, mod: int = 0):
+        counters.count("Monkey.inspect", len(self.items))
         for item in self.items:
             self.inspected += 1
             new_val = eval(self.operation, {"old": item})
@@ -88,7 +91,7 @@ def split_monkeys(input: List[str]) -> Iterator[Monkey]:
         yield Monkey.from_str(this_monkey)
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -138,10 +141,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,12 +1,15 @@
 """Day 12"""
 
 from __future__ import annotations
-import os
-import pytest
-from queue import PriorityQueue
-from typing import List, Optional
+from typing import List
 from string import ascii_lowercase
 
+import numpy as np
+
+from aoc import grid, search
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
+
 INPUT = """Sabqponm
 abcryxxl
 accszExk
@@ -14,7 +17,7 @@ acctuvwj
 abdefghi"""
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -27,94 +30,44 @@ def score(char: str) -> int:
     return ascii_lowercase.find(char)
 
 
-class Node:
-    def __init__(self, value: int, row: int, col: int) -> None:
-        self.value = value
-        self.y = row
-        self.x = col
-        self.routes = []
-        self.rev_routes = []
-
-    def add_neighbour(self, other: Node):
-        if other.value - self.value <= 1:
-            self.routes.append(other)
-        if self.value - other.value <= 1:
-            self.rev_routes.append(other)
-
-    def __lt__(self, other: Node) -> bool:
-        return False
-
-    def __eq__(self, other: Node) -> bool:
-        return other.x == self.x and other.y == self.y
-
-    def __hash__(self) -> int:
-        return self.x * 10000 + self.y
-
-
 class Map:
     def __init__(self, rows: List[str]) -> None:
-        self.start: Optional[Node] = None
-        self.end: Optional[Node] = None
-        self.rows: List[List[Node]] = []
-        self.total = 0
-        for i, row in enumerate(rows):
-            this_row: List[Node] = []
-            self.rows.append(this_row)
-            for j, char in enumerate(row):
-                node = Node(score(char), i, j)
-                this_row.append(node)
-                if char == "S":
-                    self.start = node
-                if char == "E":
-                    self.end = node
-                if j > 0:
-                    this_row[j - 1].add_neighbour(node)
-                    node.add_neighbour(this_row[j - 1])
-                if i > 0:
-                    self.rows[i - 1][j].add_neighbour(node)
-                    node.add_neighbour(self.rows[i - 1][j])
-                self.total += 1
+        cells = grid.parse(rows)
+        heights = cells.astype(np.int16) - ord("a")
+        heights[cells == ord("S")] = score("S")
+        heights[cells == ord("E")] = score("E")
+        self.start = int(np.flatnonzero(cells == ord("S"))[0])
+        self.end = int(np.flatnonzero(cells == ord("E"))[0])
+        self.values: List[int] = heights.ravel().tolist()
+        self.total = heights.size
+        # Cells by flat index, with the neighbours each one can step up to
+        # and the ones that can step up to it.
+        self.routes: List[List[int]] = [[] for _ in range(self.total)]
+        self.rev_routes: List[List[int]] = [[] for _ in range(self.total)]
+        width = heights.shape[1]
+        for dy, dx in grid.ADJACENT:
+            delta = dy * width + dx
+            on_grid = grid.shifted(np.ones(heights.shape, dtype=bool), dy, dx)
+            climb = grid.shifted(heights, dy, dx) - heights
+            for node in np.flatnonzero(on_grid & (climb <= 1)).tolist():
+                self.routes[node].append(node + delta)
+            for node in np.flatnonzero(on_grid & (climb >= -1)).tolist():
+                self.rev_routes[node].append(node + delta)
 
     def solve(self) -> int:
-        dist = {self.start: 0}
-        prev = {}
-        seen = set()
-
-        route_q = PriorityQueue()
-        for i in self.start.routes:
-            route_q.put((1, i))
-        while route_q.not_empty:
-            n, node = route_q.get()
-            seen.add(node)
-            for next_node in node.routes:
-                if next_node == self.end:
-                    return n + 1
-                if next_node not in seen:
-                    if n + 1 < dist.get(next_node, self.total):
-                        dist[next_node] = n + 1
-                        prev[next_node] = node
-                        route_q.put((n + 1, next_node))
+        found = search.bfs(
+            [self.start], self.routes.__getitem__, lambda node: node == self.end
+        )
+        return found.cost
 
     def rev_solve(self, end_char="a") -> int:
-        dist = {self.end: 0}
-        prev = {}
-        seen = set()
         end_score = score(end_char)
-
-        route_q = PriorityQueue()
-        for i in self.end.rev_routes:
-            route_q.put((1, i))
-        while route_q.not_empty:
-            n, node = route_q.get()
-            seen.add(node)
-            for next_node in node.rev_routes:
-                if next_node.value == end_score:
-                    return n + 1
-                if next_node not in seen:
-                    if n + 1 < dist.get(next_node, self.total):
-                        dist[next_node] = n + 1
-                        prev[next_node] = node
-                        route_q.put((n + 1, next_node))
+        found = search.bfs(
+            [self.end],
+            self.rev_routes.__getitem__,
+            lambda node: self.values[node] == end_score,
+        )
+        return found.cost
 
 
 def test_example(example):
@@ -123,8 +76,8 @@ def test_example(example):
     assert map.rev_solve() == 29
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return Map(inputs).solve()
+def part1(inputs: List[str]) -> int:
+    return parsed(inputs, Map).solve()
 
 
 def test_part1() -> None:
@@ -132,8 +85,8 @@ def test_part1() -> None:
     assert part1(inputs) == 383
 
 
-def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    return Map(inputs).rev_solve()
+def part2(inputs: List[str]) -> int:
+    return parsed(inputs, Map).rev_solve()
 
 
 def test_part2() -> None:
@@ -142,10 +95,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -2,11 +2,12 @@
 
 from functools import cmp_to_key
 from itertools import zip_longest
-import os
-import pytest
 import re
 from typing import Iterator, List, Tuple
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """[1,1,3,1,1]
 [1,1,5,1,1]
 
@@ -43,7 +44,7 @@ class ParseError(Exception):
     """Found an unexpected situation when parsing."""
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -149,10 +150,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -1,16 +1,20 @@
 """Day X"""
 
 from __future__ import annotations
-import os
-import pytest
 import re
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
+
+from aoc import grid
+from aoc.loader import read_lines
+from aoc.testing import fixture
 
 INPUT = """498,4 -> 498,6 -> 496,6
 503,4 -> 502,4 -> 502,9 -> 494,9"""
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -19,73 +23,104 @@ class OutOfBounds(RuntimeError):
     """Sand outside known coords."""
 
 
+AIR, ROCK, SAND = 0, 1, 2
+SOURCE = 500
+
+
 class Cavern:
-    def add_block(self, row: int, col: int):
-        while len(self.rows) <= row:
-            self.rows.append(set())
-        self.rows[row].add(col)
-        if not self.min_col or col < self.min_col:
-            self.min_col = col
-        if not self.max_col or col > self.max_col:
-            self.max_col = col
-
-    def __init__(self, blocks: List[str]) -> None:
-        self.rows = [set()]
-        self.min_col = None
-        self.max_col = None
-        self.has_floor = False
-        for block in blocks:
-            points = []
-            for i in re.split(r" \-\> ", block):
-                points.append([int(j) for j in i.split(",", 2)])
-            start = points[0]
-            for end in points[1:]:
-                # print(f"{start} - {end}")
-                for col in range(min(start[0], end[0]), max(start[0], end[0]) + 1):
-                    for row in range(min(start[1], end[1]), max(start[1], end[1]) + 1):
-                        self.add_block(row, col)
-                start = end
-            # print(self)
+    """The cave as rows x cols cells, wide enough for the rocks and piled sand.
+
+    Column `col` of the puzzle is cells[:, col - self.left]. With a floor,
+    the floor is the bottom row, two below the lowest rock.
+    """
+
+    def __init__(self, blocks: List[str], floor: bool = False) -> None:
+        paths = [
+            [[int(j) for j in i.split(",", 2)] for i in re.split(r" \-\> ", block)]
+            for block in blocks
+        ]
+        depth = max(row for path in paths for _, row in path) + 3
+        cols = [col for path in paths for col, _ in path]
+        # Sand can't spread further than depth either way from the source,
+        # but rocks can be anywhere; leave a column spare past the outermost.
+        self.left = min(SOURCE - depth, min(cols) - 1)
+        right = max(SOURCE + depth, max(cols) + 1)
+        self.cells = np.zeros((depth, right - self.left + 1), dtype=np.uint8)
+        for path in paths:
+            for (col0, row0), (col1, row1) in zip(path, path[1:]):
+                self.cells[
+                    min(row0, row1) : max(row0, row1) + 1,
+                    min(col0, col1) - self.left : max(col0, col1) - self.left + 1,
+                ] = ROCK
+        self.path: List[Tuple[int, int]] = []
+        self.has_floor = floor
+        if floor:
+            self.cells[-1] = ROCK
+        rock_cols = np.flatnonzero(self.cells[:-1].any(axis=0))
+        self.min_col = int(rock_cols[0]) + self.left
+        self.max_col = int(rock_cols[-1]) + self.left
 
     def __str__(self) -> str:
-        out = []
-        for row_num, row in enumerate(self.rows):
-            rowstr = [str(row_num), " "]
-            for i in range(self.min_col, self.max_col + 1):
-                rowstr.append("#" if i in row else " ")
-            out.append("".join(rowstr))
-        return "\n".join(out)
+        chars = np.array([ord(" "), ord("#"), ord("o")], dtype=np.uint8)
+        view = self.cells[:, self.min_col - self.left : self.max_col - self.left + 1]
+        return "\n".join(
+            f"{row_num} {row}" for row_num, row in enumerate(grid.to_lines(chars[view]))
+        )
 
     def next_sand_pos(self, row: int, col: int) -> tuple:
-        """Adds one piece of sand from the given point"""
-        while row < len(self.rows) and col not in self.rows[row]:
-            row += 1
-        if row >= len(self.rows):
-            return row, col
-        if col - 1 not in self.rows[row]:
-            if col == self.min_col and not self.has_floor:
-                return row, col - 1
-            return self.next_sand_pos(row, col - 1)
-        if col + 1 not in self.rows[row]:
-            if col == self.max_col and not self.has_floor:
-                return row, col + 1
-            return self.next_sand_pos(row, col + 1)
-        return row - 1, col
+        """Where sand falling from the given point comes to rest.
+
+        The points it falls through are left in self.path: the next grain
+        takes the same way down, so it can start from the last of them.
+        """
+        cells = self.cells
+        x = col - self.left
+        while True:
+            self.path.append((row, col))
+            # Drop straight onto whatever is below, in one go.
+            below = cells[row + 1 :, x] != AIR
+            landing = int(below.argmax())
+            if not below[landing]:
+                return len(cells), col
+            row += landing
+            if not cells[row + 1, x - 1]:
+                if col == self.min_col and not self.has_floor:
+                    return row + 1, col - 1
+                row, x, col = row + 1, x - 1, col - 1
+            elif not cells[row + 1, x + 1]:
+                if col == self.max_col and not self.has_floor:
+                    return row + 1, col + 1
+                row, x, col = row + 1, x + 1, col + 1
+            else:
+                return row, col
 
     def add_sand(self) -> tuple:
-        row, col = self.next_sand_pos(0, 500)
-        if self.min_col <= col <= self.max_col and row < len(self.rows):
-            self.add_block(row, col)
-        elif self.has_floor:
-            self.add_block(row, col)
-        else:
+        path = self.path
+        while path and self.cells[path[-1][0], path[-1][1] - self.left]:
+            path.pop()
+        row, col = self.next_sand_pos(*(path.pop() if path else (0, SOURCE)))
+        fell_out = row >= len(self.cells) or not self.min_col <= col <= self.max_col
+        if fell_out and not self.has_floor:
             raise OutOfBounds(row, col, str(self))
+        self.cells[row, col - self.left] = SAND
         return row, col
 
+    def fill(self) -> int:
+        """How much sand comes to rest before the source is blocked.
 
-class Floor:
-    def __contains__(self, _: int) -> bool:
-        return True
+        With a floor, sand ends up in every cell it can get to, which is each
+        open cell below or diagonally below one it got to in the row above.
+        """
+        reached = np.zeros(self.cells.shape[1], dtype=bool)
+        reached[SOURCE - self.left] = True
+        total = 1
+        for row in self.cells[1:]:
+            spread = reached.copy()
+            spread[1:] |= reached[:-1]
+            spread[:-1] |= reached[1:]
+            reached = spread & (row == AIR)
+            total += int(reached.sum())
+        return total
 
 
 def test_example(example):
@@ -94,13 +129,12 @@ def test_example(example):
     for i in range(24):
         cav.add_sand()
         print(i, cav)
+    import pytest
+
     with pytest.raises(OutOfBounds):
         cav.add_sand()
     assert i == 23
-    cav = Cavern(example)
-    cav.rows.append(set())
-    cav.rows.append(Floor())
-    cav.has_floor = True
+    cav = Cavern(example, floor=True)
     row = 0
     col = 0
     i = 0
@@ -110,6 +144,17 @@ def test_example(example):
     assert i == 93
 
 
+def test_far_rocks(example):
+    # Rocks further out than any sand can reach are still where they should be.
+    far = example + ["400,3 -> 401,3", "620,5 -> 620,6"]
+    cavern = Cavern(far)
+    assert cavern.min_col == 400 and cavern.max_col == 620
+    assert cavern.cells[3, 400 - cavern.left] == ROCK
+    assert cavern.cells[6, 620 - cavern.left] == ROCK
+    assert part1(far) == 24
+    assert Cavern(far, floor=True).fill() == 93
+
+
 def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
     cav = Cavern(inputs)
     count = 0
@@ -127,16 +172,7 @@ def test_part1() -> None:
 
 
 def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    cav = Cavern(inputs)
-    cav.rows.append(set())
-    cav.rows.append(Floor())
-    cav.has_floor = True
-    row, col = 0, 0
-    count = 0
-    while row != 0 or col != 500:
-        row, col = cav.add_sand()
-        count += 1
-    return count
+    return Cavern(inputs, floor=True).fill()
 
 
 def test_part2() -> None:
@@ -145,10 +181,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-import os
-import pytest
 import re
 from typing import List, Optional, Tuple
 
+from aoc.intervals import IntervalSet
+from aoc.loader import parsed, read_lines
+from aoc.testing import fixture
+
 INPUT = """Sensor at x=2, y=18: closest beacon is at x=-2, y=15
 Sensor at x=9, y=16: closest beacon is at x=10, y=16
 Sensor at x=13, y=2: closest beacon is at x=15, y=3
@@ -48,7 +50,11 @@ class Sensor:
         return None
 
 
-@pytest.fixture
+def parse_sensors(inputs: List[str]) -> List[Sensor]:
+    return [Sensor.from_str(i) for i in inputs]
+
+
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -58,45 +64,77 @@ def non_beacon_row(
     row: int,
     bound_x_min: Optional[int] = None,
     bound_x_max: Optional[int] = None,
-):
-    ranges = []
-    for s in sensors:
-        if span := s.row_coverage(row):
-            min_x, max_x = span
-            if bound_x_min is not None and bound_x_max is not None:
-                if max_x < bound_x_min:
-                    continue
-                if min_x > bound_x_max:
-                    continue
-                min_x = max(min_x, bound_x_min)
-                max_x = min(max_x, bound_x_max)
-            overlaps = [i for i in ranges if min_x <= i[1] + 1 and max_x >= i[0] - 1]
-            others = [i for i in ranges if min_x > i[1] + 1 or max_x < i[0] - 1]
-            ranges = others + [
-                (
-                    min([i[0] for i in overlaps] + [min_x]),
-                    max([i[1] for i in overlaps] + [max_x]),
-                )
-            ]
+) -> IntervalSet:
+    ranges = IntervalSet(
+        span for span in (s.row_coverage(row) for s in sensors) if span is not None
+    )
+    if bound_x_min is not None and bound_x_max is not None:
+        return ranges.clip(bound_x_min, bound_x_max)
     return ranges
 
 
-def count_non_beacon_row(sensors, row):
+def count_non_beacon_row(sensors: List[Sensor], row: int) -> int:
     ranges = non_beacon_row(sensors, row)
-    return sum(i[1] - i[0] for i in ranges)
-
-
-def find_beacon(sensors, start_num, end_num):
-    found = -1
-    found_ranges = []
-    for row in range(end_num + 1):
-        ranges = non_beacon_row(sensors, row, start_num, end_num)
-        if len(ranges) > 1:
-            print(ranges)
-            found = row
-            found_ranges = ranges.copy()
+    beacons = {s.b_x for s in sensors if s.b_y == row}
+    return ranges.size - sum(1 for i in beacons if i in ranges)
+
+
+def covering_chain(
+    sensors: List[Sensor], row: int, low: int, high: int
+) -> List[Sensor]:
+    """Sensors whose spans on row link up from low to high, left to right."""
+    spans = sorted(
+        ((span, s) for s in sensors if (span := s.row_coverage(row)) is not None),
+        key=lambda i: i[0],
+    )
+    chain: List[Sensor] = []
+    reach = low - 1
+    for (start, end), sensor in spans:
+        if reach >= high or start > reach + 1:
             break
-    return (found_ranges[0][1] + 1) * 4000000 + found
+        if end > reach:
+            chain.append(sensor)
+            reach = end
+    return chain
+
+
+def chain_covers(chain: List[Sensor], row: int, low: int, high: int) -> bool:
+    """Whether the chain's spans on row still link up from low to high.
+
+    Each test here is of a concave (or convex) function of the row, so if
+    they hold on two rows they hold on every row between.
+    """
+    spans = [s.row_coverage(row) for s in chain]
+    if not spans or any(i is None for i in spans):
+        return False
+    if spans[0][0] > low or spans[-1][1] < high:
+        return False
+    return all(a[0] <= b[1] + 1 and b[0] <= a[1] + 1 for a, b in zip(spans, spans[1:]))
+
+
+def rows_still_covered(sensors: List[Sensor], row: int, low: int, high: int) -> int:
+    """How many rows after a fully covered one are sure to be covered too."""
+    chain = covering_chain(sensors, row, low, high)
+    good, step = 0, 1
+    while chain_covers(chain, row + step, low, high):
+        good, step = step, step * 2
+    # Covered at good rows on, not at step: the last covered one is between.
+    while step - good > 1:
+        middle = (good + step) // 2
+        if chain_covers(chain, row + middle, low, high):
+            good = middle
+        else:
+            step = middle
+    return good
+
+
+def find_beacon(sensors: List[Sensor], start_num: int, end_num: int) -> int:
+    row = start_num
+    while row <= end_num:
+        for x, _ in non_beacon_row(sensors, row).gaps(start_num, end_num):
+            return x * 4000000 + row
+        row += 1 + rows_still_covered(sensors, row, start_num, end_num)
+    raise ValueError("every position is covered")
 
 
 def test_example(example):
@@ -108,7 +146,7 @@ def test_example(example):
 
 
 def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    sensors = [Sensor.from_str(i) for i in inputs]
+    sensors = parsed(inputs, parse_sensors)
     return count_non_beacon_row(sensors, 2000000)
 
 
@@ -118,7 +156,7 @@ def test_part1() -> None:
 
 
 def part2(inputs: List[str]) -> int:  # pylint: disable=unused-argument
-    sensors = [Sensor.from_str(i) for i in inputs]
+    sensors = parsed(inputs, parse_sensors)
     return find_beacon(sensors, 0, 4000000)
 
 
@@ -128,10 +166,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -3,12 +3,13 @@
 from __future__ import annotations
 from collections import Counter
 from math import ceil
-import os
-import pytest
 import re
 from typing import List
 from dataclasses import dataclass, field, replace
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """Blueprint 1:  Each ore robot costs 4 ore.  Each clay robot costs 2 ore.  Each obsidian robot costs 3 ore and 14 clay.  Each geode robot costs 2 ore and 7 obsidian.
 Blueprint 2:  Each ore robot costs 2 ore.  Each clay robot costs 3 ore.  Each obsidian robot costs 3 ore and 8 clay.  Each geode robot costs 3 ore and 12 obsidian."""
 
@@ -137,7 +138,7 @@ class Builder:
         return cls(*found_num)
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -170,10 +171,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
 
 
 def test_get_inputs() -> None:
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-import os
-import pytest
 import re
 from typing import List
 
+from aoc.loader import read_lines
+from aoc.testing import fixture
+
 INPUT = """        ...#
         .#..
         #...
@@ -23,7 +24,7 @@ INPUT = """        ...#
 10R5L5R10L4R5L5"""
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip("\n") for i in INPUT.splitlines()]
 
@@ -320,10 +321,7 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip("\n") for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__, strip=None)
 
 
 def test_get_inputs() -> None:
@@ -1,9 +1,10 @@
 """Day X"""
 
 from math import pow
-import os
-import pytest
-from typing import List
+from typing import Iterable, Iterator, List
+
+from aoc.loader import iter_lines, read_lines
+from aoc.testing import fixture
 
 INPUT = """1=-0-2
 12111
@@ -70,7 +71,7 @@ def to_snafu(input: int) -> str:
     return "".join(reversed(output))
 
 
-@pytest.fixture
+@fixture
 def example() -> List[str]:
     return [i.strip() for i in INPUT.splitlines()]
 
@@ -100,7 +101,11 @@ def test_example(example):
     assert [to_snafu(i) for i in dec_example] == example
 
 
-def part1(inputs: List[str]) -> int:  # pylint: disable=unused-argument
+def test_stream(example):
+    assert part1(iter(example)) == "2=-1=0"
+
+
+def part1(inputs: Iterable[str]) -> str:  # pylint: disable=unused-argument
     return to_snafu(sum(to_dec(i) for i in inputs))
 
 
@@ -119,10 +124,11 @@ def test_part2() -> None:
 
 
 def get_inputs() -> List[str]:
-    base, _ = os.path.splitext(os.path.basename(__file__))
-    if os.path.exists(base + ".txt"):
-        return [i.strip() for i in open(base + ".txt")]
-    return []
+    return read_lines(__file__)
+
+
+def stream_inputs() -> Iterator[str]:
+    return iter_lines(__file__)
 
 
 def test_get_inputs() -> None:
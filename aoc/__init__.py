@@ -0,0 +1 @@
+"""Shared tooling for running and timing the Advent of Code solutions."""
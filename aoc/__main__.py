@@ -0,0 +1,6 @@
+"""Entry point for ``python -m aoc``."""
+
+from aoc.cli import main
+
+if __name__ == "__main__":
+    main()
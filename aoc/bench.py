@@ -0,0 +1,338 @@
+"""Warmed-up, repeated timings saved as JSON, with regression checks.
+
+With --scales, days are timed on generated inputs of each size instead of
+their own, charting how their runtime grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from aoc import loader
+from aoc.registry import Day, find_days, input_hash, select_days
+from aoc.runner import (
+    day_spec,
+    describe,
+    map_days,
+    non_negative_int,
+    open_day,
+    positive_int,
+    time_part,
+)
+
+# Differences smaller than this are timer noise, whatever the percentage.
+MIN_REGRESSION = 0.001
+
+
+def percentile(times: List[float], pct: float) -> float:
+    ordered = sorted(times)
+    pos = (len(ordered) - 1) * pct / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def test_percentile() -> None:
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([1.0, 2.0, 3.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([float(i) for i in range(101)], 95) == 95.0
+
+
+@dataclass
+class PartBench:
+    part: int
+    times: List[float] = field(default_factory=list)
+    answer: str = ""
+    error: Optional[str] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "min": min(self.times),
+            "median": percentile(self.times, 50),
+            "p95": percentile(self.times, 95),
+            "repeat": len(self.times),
+            "answer": self.answer,
+        }
+
+
+@dataclass
+class DayBench:
+    day: Day
+    input_hash: str
+    parts: List[PartBench] = field(default_factory=list)
+    # Size of the generated input timed, or 0 for the day's own.
+    scale: int = 0
+
+
+def bench_day(day: Day, warmup: int = 1, repeat: int = 5, scale: int = 0) -> DayBench:
+    """Worker: time both parts of one day `repeat` times after `warmup` runs.
+
+    Given a scale, the day gets a generated input of that size instead.
+    """
+    if not scale:
+        return time_parts(DayBench(day, input_hash(day)), warmup, repeat)
+    from aoc.generators import write_input
+
+    with loader.substitute(day.path, write_input(day, scale)):
+        result = DayBench(day, input_hash(day), scale=scale)
+        return time_parts(result, warmup, repeat)
+
+
+def time_parts(result: DayBench, warmup: int, repeat: int) -> DayBench:
+    try:
+        module = open_day(result.day)
+    except Exception as exc:  # pylint: disable=broad-except
+        error = describe(exc)
+        result.parts = [PartBench(1, error=error), PartBench(2, error=error)]
+        return result
+    for part in (1, 2):
+        part_bench = PartBench(part)
+        result.parts.append(part_bench)
+        try:
+            for _ in range(warmup):
+                time_part(module, part)
+            for _ in range(repeat):
+                part_bench.answer, elapsed, _ = time_part(module, part)
+                part_bench.times.append(elapsed)
+        except Exception as exc:  # pylint: disable=broad-except
+            part_bench.error = describe(exc)
+    return result
+
+
+def result_key(day: Day, part: int, hashed: str) -> str:
+    return f"{day.name}/{part}@{hashed}"
+
+
+def to_json(results: List[DayBench]) -> Dict[str, Dict[str, Any]]:
+    """Stats for every part that ran, keyed by year/day/part@input-hash."""
+    return {
+        result_key(i.day, j.part, i.input_hash): (
+            dict(j.stats(), scale=i.scale) if i.scale else j.stats()
+        )
+        for i in results
+        for j in i.parts
+        if not j.error
+    }
+
+
+def compare(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> Dict[str, float]:
+    """Keys whose median grew by more than threshold, with the fractional change.
+
+    Keys include the input hash, so a part run against a different input than
+    the baseline is never compared with it.
+    """
+    regressed: Dict[str, float] = {}
+    for key, stats in current.items():
+        if key not in baseline:
+            continue
+        old = baseline[key]["median"]
+        new = stats["median"]
+        if new - old > MIN_REGRESSION and new > old * (1 + threshold):
+            regressed[key] = (new - old) / old if old else float("inf")
+    return regressed
+
+
+def test_compare() -> None:
+    baseline = {
+        "2020/05/1@a": {"median": 0.5},
+        "2020/05/2@a": {"median": 0.5},
+        "2020/06/1@a": {"median": 0.00001},
+    }
+    current = {
+        "2020/05/1@a": {"median": 0.51},
+        "2020/05/2@a": {"median": 1.0},
+        "2020/05/2@b": {"median": 9.0},
+        "2020/06/1@a": {"median": 0.00005},
+    }
+    assert compare(current, baseline, 0.1) == {"2020/05/2@a": 1.0}
+
+
+def format_table(
+    results: List[DayBench],
+    baseline: Optional[Dict[str, Dict[str, Any]]] = None,
+    regressed: Optional[Dict[str, float]] = None,
+) -> str:
+    rows = [
+        f"{'day':<8} {'part':>4} {'min':>9} {'median':>9} {'p95':>9}"
+        + ("   change" if baseline is not None else "")
+    ]
+    for day_bench in results:
+        for part in day_bench.parts:
+            start = f"{day_bench.day.name:<8} {part.part:>4}"
+            if part.error:
+                rows.append(f"{start}  {part.error}")
+                continue
+            stats = part.stats()
+            row = start + "".join(
+                f" {stats[i]:>9.4f}" for i in ("min", "median", "p95")
+            )
+            key = result_key(day_bench.day, part.part, day_bench.input_hash)
+            if baseline is not None and key in baseline:
+                old = baseline[key]["median"]
+                if old:
+                    row += f" {(stats['median'] - old) / old:>+8.1%}"
+                if regressed and key in regressed:
+                    row += "  REGRESSED"
+            rows.append(row)
+    return "\n".join(rows)
+
+
+def growth(small: int, small_time: float, large: int, large_time: float) -> float:
+    """k, where time grows like scale ** k between two runs."""
+    return math.log(large_time / small_time) / math.log(large / small)
+
+
+def test_growth() -> None:
+    assert growth(1, 0.5, 10, 5.0) == 1.0
+    assert round(growth(10, 0.01, 100, 1.0), 6) == 2.0
+
+
+def format_scaling(results: List[DayBench], width: int = 30) -> str:
+    """Median time against scale for every part, with a log-scale bar.
+
+    The growth column estimates the k in time ~ scale ** k since the scale
+    before, so 1.0 is linear and 2.0 quadratic.
+    """
+    series: Dict[Tuple[str, int], List[Tuple[int, PartBench]]] = {}
+    for day_bench in sorted(results, key=lambda i: (i.day.name, i.scale)):
+        for part in day_bench.parts:
+            key = (day_bench.day.name, part.part)
+            series.setdefault(key, []).append((day_bench.scale, part))
+    medians = [j.stats()["median"] for i in results for j in i.parts if not j.error]
+    positive = [i for i in medians if i > 0] or [1.0]
+    low, high = math.log(min(positive)), math.log(max(positive))
+
+    rows = [f"{'day':<8} {'part':>4} {'scale':>6} {'median':>9} {'growth':>6}"]
+    for (name, part_num), runs in sorted(series.items()):
+        before: Optional[Tuple[int, float]] = None
+        for scale, part in runs:
+            start = f"{name:<8} {part_num:>4} {scale:>6}"
+            if part.error:
+                rows.append(f"{start}  {part.error}")
+                before = None
+                continue
+            median = part.stats()["median"]
+            row = f"{start} {median:>9.4f}"
+            if before and before[1] > 0 and median > 0:
+                row += f" {growth(*before, scale, median):>6.2f}"
+            else:
+                row += " " * 7
+            if median > 0 and high > low:
+                filled = (math.log(median) - low) / (high - low)
+                row += "  " + "#" * (1 + round((width - 1) * filled))
+            rows.append(row)
+            before = (scale, median)
+    return "\n".join(rows)
+
+
+def test_format_scaling() -> None:
+    day = Day("2022", 1, "01.py")
+    results = [
+        DayBench(day, "a", [PartBench(1, [0.01]), PartBench(2, error="Boom")], 1),
+        DayBench(day, "b", [PartBench(1, [0.1]), PartBench(2, [0.5])], 10),
+    ]
+    rows = format_scaling(results, width=10).splitlines()
+    assert rows[1].split() == ["2022/01", "1", "1", "0.0100", "#"]
+    assert rows[2].split() == ["2022/01", "1", "10", "0.1000", "1.00", "#" * 6]
+    assert rows[3].split() == ["2022/01", "2", "1", "Boom"]
+    assert rows[4].split()[:5] == ["2022/01", "2", "10", "0.5000", "#" * 10]
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    days = select_days(find_days(), args.days)
+    if args.scales:
+        results = bench_scales(days, args)
+    else:
+        worker = partial(bench_day, warmup=args.warmup, repeat=args.repeat)
+        results = map_days(worker, days, jobs=args.jobs)
+    current = to_json(results)
+    with open(args.output, "w") as out:
+        json.dump(current, out, indent=2, sort_keys=True)
+
+    baseline = None
+    regressed: Dict[str, float] = {}
+    if args.compare:
+        with open(args.compare) as base_file:
+            baseline = json.load(base_file)
+        regressed = compare(current, baseline, args.threshold)
+    if args.scales:
+        print(format_scaling(results))
+    else:
+        print(format_table(results, baseline, regressed))
+    if regressed:
+        print(f"{len(regressed)} parts regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+def bench_scales(days: List[Day], args: argparse.Namespace) -> List[DayBench]:
+    from aoc.generators import generators
+
+    available = generators()
+    skipped = [i.name for i in days if i.name not in available]
+    if skipped:
+        print(f"no generator for {', '.join(skipped)}")
+    days = [i for i in days if i.name in available]
+    results: List[DayBench] = []
+    for scale in sorted(set(args.scales)):
+        worker = partial(bench_day, warmup=args.warmup, repeat=args.repeat, scale=scale)
+        results.extend(map_days(worker, days, jobs=args.jobs))
+    return results
+
+
+def add_parser(commands: Any) -> None:
+    bench = commands.add_parser("bench", help="repeated timings with JSON baselines")
+    bench.add_argument(
+        "days", nargs="*", type=day_spec, help='"YYYY" or "YYYY/DD" (default: all)'
+    )
+    bench.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="worker processes (default: 1, so days don't disturb each other)",
+    )
+    bench.add_argument(
+        "--warmup", type=non_negative_int, default=1, help="untimed runs per part"
+    )
+    bench.add_argument(
+        "--repeat", type=positive_int, default=5, help="timed runs per part"
+    )
+    bench.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        metavar="SCALE",
+        help="time generated inputs of these sizes (1 = real) instead",
+    )
+    bench.add_argument("-o", "--output", default="bench.json", help="results file")
+    bench.add_argument("--compare", help="baseline results file to check against")
+    bench.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="median slowdown that counts as a regression (default: 0.1 = 10%%)",
+    )
+    bench.set_defaults(func=cmd_bench)
+
+
+def test_arguments() -> None:
+    import pytest
+
+    parser = argparse.ArgumentParser()
+    add_parser(parser.add_subparsers())
+    args = parser.parse_args(["bench", "--warmup", "0", "--repeat", "1", "-j", "1"])
+    assert (args.warmup, args.repeat, args.jobs) == (0, 1, 1)
+    for bad in (["--repeat", "0"], ["--warmup", "-1"], ["--jobs", "0"]):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["bench", *bad])
@@ -0,0 +1,123 @@
+"""On-disk cache of answers, so unchanged days needn't be solved again.
+
+Answers are keyed by the day, the part, a hash of the day's source, a hash
+of the `aoc` package's sources (which the days share grids, searches and
+the VM from) and a hash of its input, so editing any of them means the day
+is run (and timed) afresh. The least recently used entries are dropped once there are more than
+`max_entries`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from aoc import loader
+
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ".cache",
+    "answers.json",
+)
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+MAX_ENTRIES = 500
+
+
+def source_hash(path: str) -> str:
+    with open(path, "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()[:16]
+
+
+def package_hash(package: str = PACKAGE_DIR) -> str:
+    """One hash of every module in the package, in a fixed order."""
+    digest = hashlib.sha256()
+    for folder, dirs, files in os.walk(package):
+        dirs[:] = sorted(i for i in dirs if i != "__pycache__")
+        for name in sorted(i for i in files if i.endswith(".py")):
+            path = os.path.join(folder, name)
+            digest.update(os.path.relpath(path, package).encode())
+            digest.update(source_hash(path).encode())
+    return digest.hexdigest()[:16]
+
+
+def answer_key(
+    name: str,
+    part: int,
+    path: str,
+    input_path: Optional[str],
+    package: str = PACKAGE_DIR,
+) -> str:
+    input_digest = loader.file_digest(input_path) if input_path else ""
+    return f"{name}/{part}:{source_hash(path)}:{package_hash(package)}:{input_digest}"
+
+
+class AnswerCache:
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        if os.path.exists(path):
+            try:
+                with open(path) as cache_file:
+                    self.entries.update(json.load(cache_file))
+            except ValueError:
+                # A damaged cache is just an empty one.
+                pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, answer: str, elapsed: float) -> None:
+        self.entries[key] = {"answer": answer, "elapsed": elapsed}
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as cache_file:
+            json.dump(self.entries, cache_file)
+        os.replace(tmp_path, self.path)
+
+
+def test_answer_cache(tmp_path) -> None:
+    path = str(tmp_path / "answers.json")
+    cache = AnswerCache(path, max_entries=2)
+    assert cache.get("a") is None
+    cache.put("a", "1", 0.5)
+    cache.put("b", "2", 0.5)
+    assert cache.get("a") == {"answer": "1", "elapsed": 0.5}
+    cache.put("c", "3", 0.5)
+    # "b" was the least recently used
+    assert list(cache.entries) == ["a", "c"]
+    cache.save()
+    assert list(AnswerCache(path).entries) == ["a", "c"]
+
+
+def test_answer_key(tmp_path) -> None:
+    module = tmp_path / "01.py"
+    module.write_text("def part1(inputs):\n    return 1\n")
+    (tmp_path / "01.txt").write_text("1\n")
+    key = answer_key("2022/01", 1, str(module), str(tmp_path / "01.txt"))
+    assert key.startswith("2022/01/1:")
+    module.write_text("def part1(inputs):\n    return 2\n")
+    assert answer_key("2022/01", 1, str(module), str(tmp_path / "01.txt")) != key
+
+
+def test_package_change(tmp_path) -> None:
+    package = tmp_path / "aoc"
+    package.mkdir()
+    (package / "grid.py").write_text("SIZE = 1\n")
+    module = tmp_path / "01.py"
+    module.write_text("def part1(inputs):\n    return 1\n")
+    key = answer_key("2022/01", 1, str(module), None, str(package))
+    assert answer_key("2022/01", 1, str(module), None, str(package)) == key
+    (package / "grid.py").write_text("SIZE = 2\n")
+    assert answer_key("2022/01", 1, str(module), None, str(package)) != key
@@ -0,0 +1,23 @@
+"""Command line for ``python -m aoc``."""
+
+import argparse
+from typing import Optional, Sequence
+
+from aoc import bench, generators, runner, watch
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Run and time the Advent of Code days."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    runner.add_parser(commands)
+    bench.add_parser(commands)
+    generators.add_parser(commands)
+    watch.add_parser(commands)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
@@ -0,0 +1,78 @@
+"""Named operation counters, for seeing why a slow part is slow.
+
+Solutions call `count("Monkey.inspect", len(items))` (or `peak()` for a
+high-water mark) where their work happens. Nothing is kept unless something
+is `collecting()` (as `run --counters` does), and then it all goes in one
+Counter; otherwise each call is a test of one global. That is cheap, but
+not free, so inner loops should add up a whole call's worth (items
+inspected, states pushed) and count it once rather than once an item.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_COUNTS: Optional[Counter] = None
+
+
+def enabled() -> bool:
+    return _COUNTS is not None
+
+
+def count(name: str, amount: int = 1) -> None:
+    if _COUNTS is not None:
+        _COUNTS[name] += amount
+
+
+def peak(name: str, value: int) -> None:
+    """Keep the largest value seen for name."""
+    if _COUNTS is not None and value > _COUNTS[name]:
+        _COUNTS[name] = value
+
+
+@contextmanager
+def collecting(enable: bool = True) -> Iterator[Counter]:
+    """Collect the counts made within the block into the Counter yielded.
+
+    With enable False this yields an empty Counter and changes nothing, so
+    callers needn't have two ways of running.
+    """
+    global _COUNTS  # pylint: disable=global-statement
+    counts: Counter = Counter()
+    if not enable:
+        yield counts
+        return
+    outer, _COUNTS = _COUNTS, counts
+    try:
+        yield counts
+    finally:
+        _COUNTS = outer
+
+
+def test_count() -> None:
+    count("ignored")
+    assert not enabled()
+    with collecting() as counts:
+        assert enabled()
+        count("calls")
+        count("items", 5)
+        count("items", 2)
+        peak("depth", 3)
+        peak("depth", 1)
+        with collecting(False) as nothing:
+            count("calls")
+    assert not enabled()
+    count("calls")
+    assert counts == {"calls": 2, "items": 7, "depth": 3}
+    assert not nothing
+
+
+def test_nested() -> None:
+    with collecting() as outer:
+        count("a")
+        with collecting() as inner:
+            count("b")
+        count("a")
+    assert outer == {"a": 2} and inner == {"b": 1}
@@ -0,0 +1,118 @@
+"""Synthetic puzzle inputs of any size, to see how each day's solution scales.
+
+A generator takes a scale and a seeded random.Random and returns the lines of
+a valid input for its day: scale 1 is about the size of a real input, and the
+work in it (lines, grid cells, bags, monkeys...) grows roughly linearly with
+scale. Valid means the day's solution can run on it to an answer, so each
+generator keeps to whatever the solution assumes of its real input.
+
+The generators live in one module per year and register themselves with
+@generator("YYYY/DD"); they are only imported when first asked for.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+from random import Random
+from typing import Any, Callable, Dict, List
+
+from aoc.registry import ROOT, Day, find_days, select_days
+from aoc.runner import day_spec
+
+Generator = Callable[[int, Random], List[str]]
+
+GENERATED_DIR = os.path.join(ROOT, ".cache", "inputs")
+MODULES = ["aoc.generators.y2020", "aoc.generators.y2021", "aoc.generators.y2022"]
+
+_GENERATORS: Dict[str, Generator] = {}
+
+
+def generator(name: str) -> Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        _GENERATORS[name] = func
+        return func
+
+    return register
+
+
+def generators() -> Dict[str, Generator]:
+    """Every generator, by "YYYY/DD" name."""
+    for module in MODULES:
+        importlib.import_module(module)
+    return _GENERATORS
+
+
+def generate(name: str, scale: int = 1, seed: int = 0) -> List[str]:
+    """The lines of an input for day `name`, the same for the same scale and seed."""
+    return generators()[name](scale, Random(f"{name}:{scale}:{seed}"))
+
+
+def write_input(day: Day, scale: int, seed: int = 0, directory: str = "") -> str:
+    """Generate an input for day into a file (unless it's there already)."""
+    directory = directory or GENERATED_DIR
+    path = os.path.join(directory, f"{day.year}-{day.day:02d}-x{scale}-{seed}.txt")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as out:
+            out.write("\n".join(generate(day.name, scale, seed)) + "\n")
+        os.replace(tmp_path, path)
+    return path
+
+
+def test_generate() -> None:
+    for name in generators():
+        lines = generate(name, 1)
+        assert lines, name
+        assert lines == generate(name, 1), name
+        assert lines != generate(name, 1, seed=1), name
+
+
+def test_solvable(tmp_path) -> None:
+    """The days whose inputs take most care to get right solve quickly."""
+    from aoc.loader import substitute
+    from aoc.runner import open_day, run_part
+
+    careful = ["2020/08", "2020/09", "2021/03", "2021/07", "2022/05", "2022/07"]
+    for day in find_days():
+        if day.name in careful:
+            module = open_day(day)
+            with substitute(day.path, write_input(day, 2, directory=str(tmp_path))):
+                for part in (1, 2):
+                    assert run_part(module, part).error is None, day.name
+
+
+def test_write_input(tmp_path) -> None:
+    day = [i for i in find_days(["2022"]) if i.day == 1][0]
+    path = write_input(day, 2, directory=str(tmp_path))
+    assert path.endswith("2022-01-x2-0.txt")
+    with open(path) as generated:
+        assert generated.read().splitlines() == generate("2022/01", 2)
+
+
+def cmd_generate(args: argparse.Namespace) -> None:
+    available = generators()
+    days = [i for i in select_days(find_days(), args.days) if i.name in available]
+    for day in days:
+        if args.output:
+            path = write_input(day, args.scale, args.seed, args.output)
+            print(f"{day.name}: {path}")
+        else:
+            sys.stdout.write("\n".join(generate(day.name, args.scale, args.seed)))
+            sys.stdout.write("\n")
+
+
+def add_parser(commands: Any) -> None:
+    gen = commands.add_parser("generate", help="write synthetic inputs of any size")
+    gen.add_argument(
+        "days", nargs="*", type=day_spec, help='"YYYY" or "YYYY/DD" (default: all)'
+    )
+    gen.add_argument("-s", "--scale", type=int, default=1, help="size (1 = real)")
+    gen.add_argument("--seed", type=int, default=0, help="random seed")
+    gen.add_argument(
+        "-o", "--output", help="directory to write into (default: print the lines)"
+    )
+    gen.set_defaults(func=cmd_generate)
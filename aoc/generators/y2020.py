@@ -0,0 +1,244 @@
+"""Input generators for 2020."""
+
+import math
+import os
+import string
+from random import Random
+from typing import List
+
+from aoc import loader
+from aoc.generators import generator
+from aoc.registry import ROOT
+
+# 2020/09 part 2 looks for a run adding up to this, part 1's real answer.
+XMAS_INVALID = 167829540
+
+ADJECTIVES = (
+    "bright clear dark dim dotted drab dull faded light mirrored muted pale plaid "
+    "posh shiny striped vibrant wavy"
+).split()
+COLOURS = (
+    "aqua beige black blue bronze brown coral crimson cyan fuchsia gold gray "
+    "green indigo lavender lime magenta maroon olive orange plum purple red salmon "
+    "tan teal tomato turquoise violet white yellow"
+).split()
+
+
+@generator("2020/01")
+def expense_report(scale: int, rng: Random) -> List[str]:
+    """Entries over 1010, bar one pair and one triple adding up to 2020.
+
+    The triple's entries and the pair's smaller one are all 505 or more, so
+    no two of them make up a third with another entry, and no other entry
+    is 2020 less any of them: each part has one answer.
+    """
+    x = rng.randint(505, 700)
+    y = rng.randint(505, 700)
+    small = [x, y, 2020 - x - y]
+    pair = rng.choice([i for i in range(505, 1010) if i not in small])
+    entries = small + [pair, 2020 - pair]
+    taken = {2020 - i for i in entries}
+    while len(entries) < 200 * scale:
+        entry = rng.randint(1011, 2020)
+        if entry not in taken:
+            entries.append(entry)
+    rng.shuffle(entries)
+    return [str(i) for i in entries]
+
+
+@generator("2020/05")
+def boarding_passes(scale: int, rng: Random) -> List[str]:
+    """A block of seats with one missing, every seat in it at least once.
+
+    There are only 1024 seats, so bigger inputs are mostly repeats.
+    """
+    first = rng.randint(20, 80)
+    seats = list(range(first, first + 800))
+    seats.remove(rng.choice(seats[100:-100]))
+    seats += rng.choices(seats, k=max(0, 800 * scale - len(seats)))
+    rng.shuffle(seats)
+    return [
+        f"{i >> 3:07b}".translate(str.maketrans("01", "FB"))
+        + f"{i & 7:03b}".translate(str.maketrans("01", "LR"))
+        for i in seats
+    ]
+
+
+@generator("2020/06")
+def customs_groups(scale: int, rng: Random) -> List[str]:
+    lines: List[str] = []
+    for group in range(480 * scale):
+        if group:
+            lines.append("")
+        shared = rng.sample(string.ascii_lowercase, rng.randint(0, 8))
+        for _ in range(rng.randint(1, 5)):
+            own = rng.sample(string.ascii_lowercase, rng.randint(not shared, 6))
+            person = "".join(sorted(set(shared + own)))
+            lines.append("".join(rng.sample(person, len(person))))
+    return lines
+
+
+def colour_names(count: int, rng: Random) -> List[str]:
+    """count distinct two-word colours, none of them "shiny gold"."""
+    names: List[str] = []
+    combos = len(ADJECTIVES) * len(COLOURS)
+    i = 0
+    while len(names) < count:
+        adjective = ADJECTIVES[i % len(ADJECTIVES)]
+        colour = COLOURS[i // len(ADJECTIVES) % len(COLOURS)]
+        suffix = i // combos or ""
+        name = f"{adjective}{suffix} {colour}"
+        if name != "shiny gold":
+            names.append(name)
+        i += 1
+    rng.shuffle(names)
+    return names
+
+
+@generator("2020/07")
+def bag_rules(scale: int, rng: Random) -> List[str]:
+    """Layers of bags, each holding bags from the layers below it.
+
+    The number of layers stays the same as the bags multiply, so the number of
+    ways down from any bag (which part 2 walks) doesn't explode.
+    """
+    layers = 8
+    names = colour_names(600 * scale - 1, rng)
+    tiers = [names[i::layers] for i in range(layers)]
+    tiers[3].append("shiny gold")
+    lines: List[str] = []
+    for depth, tier in enumerate(tiers):
+        below = [j for i in tiers[depth + 1 :] for j in i]
+        for name in tier:
+            inside = rng.sample(below, min(len(below), rng.randint(0, 4)))
+            if depth < 3 and rng.random() < 0.05 and "shiny gold" not in inside:
+                inside = inside[:3] + ["shiny gold"]
+            if not inside:
+                lines.append(f"{name} bags contain no other bags.")
+                continue
+            counts = [rng.randint(1, 5) for _ in inside]
+            held = ", ".join(
+                f"{count} {colour} bag{'s' if count > 1 else ''}"
+                for count, colour in zip(counts, inside)
+            )
+            lines.append(f"{name} bags contain {held}.")
+    rng.shuffle(lines)
+    return lines
+
+
+@generator("2020/08")
+def boot_code(scale: int, rng: Random) -> List[str]:
+    """A program that ends, with one step on its way turned into a loop.
+
+    As in real inputs, swapping back that one step is the only swap that
+    ends it: every other nop the looping run passes points back along the
+    run, and the instructions it skips over jump back into it. Every jump
+    (and every nop, were it a jump) lands inside the program or just past
+    its end.
+    """
+    size = 640 * scale
+    program: List[str] = [""] * size
+    path: List[int] = []
+    ip = 0
+    while ip < size:
+        path.append(ip)
+        kind = rng.random()
+        if kind < 0.45:
+            program[ip] = f"acc {rng.randint(-50, 50):+d}"
+            ip += 1
+        elif kind < 0.6:
+            program[ip] = "nop"
+            ip += 1
+        else:
+            step = rng.randint(1, min(6, size - ip))
+            program[ip] = f"jmp {step:+d}"
+            ip += step
+    # Loop back from late in the run to somewhere earlier in it, from a step
+    # that went on to the next instruction, so making it a nop mends it.
+    path.append(size)
+    steps = [
+        i for i in range(len(path) // 2, len(path) - 1) if path[i + 1] == path[i] + 1
+    ]
+    broken = rng.choice(steps)
+    back = path[rng.randrange(0, broken)]
+    for i, ip in enumerate(path[:-1]):
+        if program[ip] == "nop":
+            # Along the looping run, as a jmp it would only loop sooner.
+            target = path[rng.randrange(i + 1)] if i < broken else rng.randrange(size)
+            program[ip] = f"nop {target - ip:+d}"
+    for i, instr in enumerate(program):
+        if not instr:
+            program[i] = f"jmp {path[rng.randrange(broken)] - i:+d}"
+    program[path[broken]] = f"jmp {back - path[broken]:+d}"
+    return program
+
+
+@generator("2020/09")
+def xmas_numbers(scale: int, rng: Random) -> List[str]:
+    """Numbers that are each the sum of two of the 25 before, until the last.
+
+    Numbers mostly repeat the one 25 before (plus one of the zeros kept in
+    the window), with the odd new sum: summing all the time would double them
+    every 25 lines. Three numbers held in the window from the start add up
+    to the invalid one, and are repeated just before it for part 2.
+    """
+    preamble = 25
+    cap = XMAS_INVALID // 2 - 1
+    nums = [rng.randint(1, cap // 4) for _ in range(preamble)]
+    zeros, parts = (7, 19), (5, 12, 21)
+    for slot in zeros:
+        nums[slot] = 0
+    first = rng.randint(XMAS_INVALID // 4 + 1, XMAS_INVALID // 3)
+    second = rng.randint(XMAS_INVALID // 4 + 1, XMAS_INVALID // 3)
+    for slot, value in zip(parts, (first, second, XMAS_INVALID - first - second)):
+        nums[slot] = value
+    kept = set(zeros + parts)
+    end = preamble * max(2, 40 * scale - 1)
+    for n in range(preamble, end):
+        value = nums[n - preamble]
+        if n % preamble not in kept and rng.random() < 0.3:
+            i, j = rng.sample(range(n - preamble, n), 2)
+            if 0 < nums[i] + nums[j] <= cap:
+                value = nums[i] + nums[j]
+        nums.append(value)
+    # end is a multiple of the preamble, so these don't push the parts out.
+    nums.extend(nums[end - preamble + i] for i in parts)
+    nums.append(XMAS_INVALID)
+    return [str(i) for i in nums]
+
+
+@generator("2020/10")
+def adapters(scale: int, rng: Random) -> List[str]:
+    """Steps of 1 to 3 jolts, mostly 1s in runs of any length."""
+    jolts: List[int] = []
+    joltage = 0
+    while len(jolts) < 100 * scale:
+        joltage += rng.choice([1, 1, 1, 1, 2, 3, 3])
+        jolts.append(joltage)
+    rng.shuffle(jolts)
+    return [str(i) for i in jolts]
+
+
+@generator("2020/11")
+def seat_layout(scale: int, rng: Random) -> List[str]:
+    """Copies of the real layout, each turned its own way, with floor between.
+
+    Random layouts are no good: solid patches of seats go on filling and
+    emptying all at once, round after round, and never settle. Apart, each
+    copy settles just as the real one does.
+    """
+    real = loader.read_lines(os.path.join(ROOT, "2020", "11.py"))
+    across = math.ceil(math.sqrt(scale))
+    tiles: List[List[str]] = []
+    for _ in range(scale):
+        tile = real[::-1] if rng.random() < 0.5 else list(real)
+        tiles.append([i[::-1] for i in tile] if rng.random() < 0.5 else tile)
+    while len(tiles) % across:
+        tiles.append(["." * len(real[0])] * len(real))
+    lines: List[str] = []
+    for first in range(0, len(tiles), across):
+        if lines:
+            lines.append("." * len(lines[0]))
+        band = tiles[first : first + across]
+        lines.extend(".".join(tile[i] for tile in band) for i in range(len(real)))
+    return lines
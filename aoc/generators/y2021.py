@@ -0,0 +1,355 @@
+"""Input generators for 2021."""
+
+import math
+import string
+from collections import deque
+from random import Random
+from typing import Dict, List
+
+from aoc.generators import generator
+
+# Lit segments of each digit on an unscrambled display.
+SEGMENTS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def square_side(base: int, scale: int) -> int:
+    """The side of a square grid holding scale times base * base cells."""
+    return round(base * math.sqrt(scale))
+
+
+@generator("2021/01")
+def sonar_depths(scale: int, rng: Random) -> List[str]:
+    depth = rng.randint(100, 200)
+    depths: List[int] = []
+    for _ in range(2000 * scale):
+        depth = max(1, depth + rng.randint(-12, 20))
+        depths.append(depth)
+    return [str(i) for i in depths]
+
+
+@generator("2021/02")
+def course(scale: int, rng: Random) -> List[str]:
+    moves = rng.choices(["forward", "down", "up"], weights=[5, 3, 2], k=1000 * scale)
+    return [f"{i} {rng.randint(1, 9)}" for i in moves]
+
+
+def co2_filter_ends(words: List[str]) -> bool:
+    """Whether part 2's least-common filter gets down to one word.
+
+    It keeps the words with the rarer bit, so if every word left has the same
+    bit it keeps none.
+    """
+    index = 0
+    while len(words) > 1:
+        ones = [i for i in words if i[index] == "1"]
+        zeros = [i for i in words if i[index] == "0"]
+        words = zeros if len(ones) >= len(words) / 2 else ones
+        index += 1
+    return len(words) == 1
+
+
+@generator("2021/03")
+def diagnostic(scale: int, rng: Random) -> List[str]:
+    """Distinct binary numbers, with more bits as there are more of them."""
+    count = 1000 * scale
+    bits = max(12, (count * 4).bit_length())
+    while True:
+        words = [f"{i:0{bits}b}" for i in rng.sample(range(2**bits), count)]
+        if co2_filter_ends(words):
+            return words
+
+
+@generator("2021/04")
+def bingo(scale: int, rng: Random) -> List[str]:
+    """Every number is drawn, so every board wins in the end."""
+    draws = list(range(100))
+    rng.shuffle(draws)
+    lines = [",".join(str(i) for i in draws)]
+    for _ in range(100 * scale):
+        lines.append("")
+        board = rng.sample(range(100), 25)
+        for row in range(5):
+            lines.append(" ".join(f"{i:2d}" for i in board[row * 5 : row * 5 + 5]))
+    return lines
+
+
+@generator("2021/05")
+def vents(scale: int, rng: Random) -> List[str]:
+    """Horizontal, vertical and diagonal lines on the same 1000x1000 floor."""
+    lines: List[str] = []
+    for _ in range(500 * scale):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        length = rng.randint(1, 400)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        if rng.random() < 0.5:
+            dx, dy = -dx, -dy
+        # Shorten the line until it stays on the floor.
+        while not (0 <= x1 + dx * length < 1000 and 0 <= y1 + dy * length < 1000):
+            length -= 1
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}")
+    return lines
+
+
+@generator("2021/06")
+def lanternfish(scale: int, rng: Random) -> List[str]:
+    return [",".join(str(rng.randint(1, 5)) for _ in range(300 * scale))]
+
+
+def fuel(target: int, crabs: List[int], rising: bool = False) -> int:
+    if rising:
+        return sum(abs(i - target) * (abs(i - target) + 1) // 2 for i in crabs)
+    return sum(abs(i - target) for i in crabs)
+
+
+def is_best(target: int, crabs: List[int], rising: bool = False) -> bool:
+    here = fuel(target, crabs, rising)
+    return here < min(fuel(target + i, crabs, rising) for i in (-1, 1))
+
+
+@generator("2021/07")
+def crab_positions(scale: int, rng: Random) -> List[str]:
+    """Positions where the median and the mean are the best meeting points.
+
+    The solution checks both are strictly better than their neighbours, as
+    they were for the real input.
+    """
+    while True:
+        crabs = [int(rng.expovariate(1 / 400)) for _ in range(1000 * scale)]
+        median = sorted(crabs)[len(crabs) // 2]
+        mean = sum(crabs) // len(crabs)
+        if is_best(median, crabs) and is_best(mean, crabs, rising=True):
+            return [",".join(str(i) for i in crabs)]
+
+
+@generator("2021/08")
+def displays(scale: int, rng: Random) -> List[str]:
+    """Each display's wires crossed its own way."""
+    lines: List[str] = []
+    for _ in range(200 * scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def show(digit: int) -> str:
+            wires = [wiring[i] for i in SEGMENTS[digit]]
+            return "".join(rng.sample(wires, len(wires)))
+
+        patterns = [show(i) for i in rng.sample(range(10), 10)]
+        output = [show(rng.randrange(10)) for _ in range(4)]
+        lines.append(" ".join(patterns) + " | " + " ".join(output))
+    return lines
+
+
+@generator("2021/09")
+def heightmap(scale: int, rng: Random) -> List[str]:
+    """Basins walled off by 9s, each sloping down to its own low point.
+
+    Every cell belongs to the nearest of some random low points; cells next
+    to another basin are 9, and the rest rise by one a step from the bottom.
+    """
+    side = square_side(100, scale)
+    owner = [[-1] * side for _ in range(side)]
+    distance = [[0] * side for _ in range(side)]
+    todo = deque()
+    for basin, cell in enumerate(rng.sample(range(side * side), side * side // 40)):
+        y, x = divmod(cell, side)
+        owner[y][x] = basin
+        todo.append((y, x))
+    while todo:
+        y, x = todo.popleft()
+        for j, i in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+            if 0 <= j < side and 0 <= i < side and owner[j][i] < 0:
+                owner[j][i] = owner[y][x]
+                distance[j][i] = distance[y][x] + 1
+                todo.append((j, i))
+    lines: List[str] = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            walled = any(
+                owner[j][i] < owner[y][x]
+                for j, i in ((y - 1, x), (y, x - 1), (y + 1, x), (y, x + 1))
+                if 0 <= j < side and 0 <= i < side
+            )
+            row.append("9" if walled else str(min(8, distance[y][x])))
+        lines.append("".join(row))
+    return lines
+
+
+def chunk_line(rng: Random, corrupt: bool) -> str:
+    chars: List[str] = []
+    stack: List[str] = []
+    length = rng.randint(90, 110)
+    while len(chars) < length:
+        if stack and rng.random() < 0.45:
+            chars.append(BRACKETS[stack.pop()])
+        else:
+            stack.append(rng.choice(list(BRACKETS)))
+            chars.append(stack[-1])
+    if not stack:
+        stack.append(rng.choice(list(BRACKETS)))
+        chars.append(stack[-1])
+    if corrupt:
+        wrong = [i for i in BRACKETS.values() if i != BRACKETS[stack[-1]]]
+        chars.append(rng.choice(wrong))
+        chars.extend(rng.choices("()[]{}<>", k=rng.randint(0, 10)))
+    return "".join(chars)
+
+
+@generator("2021/10")
+def chunks(scale: int, rng: Random) -> List[str]:
+    """Corrupted and incomplete lines, but no complete ones."""
+    return [chunk_line(rng, rng.random() < 0.5) for _ in range(100 * scale)]
+
+
+def flashes_together(levels: List[List[int]], limit: int) -> bool:
+    """Whether every octopus flashes in the same step within limit steps."""
+    levels = [row.copy() for row in levels]
+    size = len(levels) * len(levels[0])
+    for _ in range(limit):
+        todo = []
+        for y, row in enumerate(levels):
+            for x in range(len(row)):
+                row[x] += 1
+                if row[x] == 10:
+                    todo.append((y, x))
+        flashed = set(todo)
+        while todo:
+            y, x = todo.pop()
+            for j in range(max(0, y - 1), min(len(levels), y + 2)):
+                for i in range(max(0, x - 1), min(len(levels[0]), x + 2)):
+                    levels[j][i] += 1
+                    if levels[j][i] >= 10 and (j, i) not in flashed:
+                        flashed.add((j, i))
+                        todo.append((j, i))
+        for y, x in flashed:
+            levels[y][x] = 0
+        if len(flashed) == size:
+            return True
+    return False
+
+
+@generator("2021/11")
+def octopuses(scale: int, rng: Random) -> List[str]:
+    """A pool that does all flash at once in the end, as part 2 waits for.
+
+    Big pools of random levels rarely ever do, so bigger pools start calm,
+    at one level, with only some octopuses stirred up.
+    """
+    side = square_side(10, scale)
+    stirred = max(0.1, 1 / scale)
+    while True:
+        calm = rng.randrange(10)
+        levels = [
+            [rng.randrange(10) if rng.random() < stirred else calm for _ in range(side)]
+            for _ in range(side)
+        ]
+        if flashes_together(levels, 1000):
+            return ["".join(str(i) for i in row) for row in levels]
+
+
+@generator("2021/12")
+def caves(scale: int, rng: Random) -> List[str]:
+    """Separate cave systems side by side between start and end.
+
+    Every path stays inside one system, so the paths add up rather than
+    multiply as the systems are added. Big caves are never joined to each
+    other, which would give endless paths.
+    """
+    lines: List[str] = []
+    for system in range(10 * scale):
+        small = [f"{i}{system}" for i in rng.sample(string.ascii_lowercase, 5)]
+        big = [f"{i}{system}" for i in rng.sample(string.ascii_uppercase, 2)]
+        edges = {("start", rng.choice(small)), ("start", big[0])}
+        edges.add((rng.choice(small), "end"))
+        edges.add((big[1], "end"))
+        for cave in big:
+            for other in rng.sample(small, 3):
+                edges.add((cave, other))
+        for _ in range(3):
+            edges.add(tuple(rng.sample(small, 2)))
+        lines.extend(f"{a}-{b}" for a, b in sorted(edges))
+    rng.shuffle(lines)
+    return lines
+
+
+@generator("2021/13")
+def origami(scale: int, rng: Random) -> List[str]:
+    """Dots on paper that folds exactly in half, down to 40x6 at the end.
+
+    Bigger inputs get more dots and a pair of extra folds (so four times the
+    paper) for every factor of four.
+    """
+    extra = round(math.log(scale, 4)) if scale > 1 else 0
+    x_folds, y_folds = 5 + extra, 7 + extra
+    width, height = 41 * 2**x_folds - 1, 7 * 2**y_folds - 1
+    # The paper is as big as its furthest dots, so put dots in the far corner.
+    dots = {(width - 1, height - 1)}
+    while len(dots) < 900 * scale:
+        dots.add((rng.randrange(width), rng.randrange(height)))
+    lines = [f"{x},{y}" for x, y in dots]
+    rng.shuffle(lines)
+    lines.append("")
+    folds: List[str] = []
+    for axis, count in (("x", x_folds), ("y", y_folds)):
+        size = width if axis == "x" else height
+        for _ in range(count):
+            size //= 2
+            folds.append(f"fold along {axis}={size}")
+    # Alternate the axes while both have folds left, as the real ones do.
+    x_list = [i for i in folds if "x=" in i]
+    y_list = [i for i in folds if "y=" in i]
+    while x_list or y_list:
+        for fold_list in (x_list, y_list):
+            if fold_list:
+                lines.append(fold_list.pop(0))
+    return lines
+
+
+@generator("2021/14")
+def polymer(scale: int, rng: Random) -> List[str]:
+    elements = rng.sample(string.ascii_uppercase, 10)
+    lines = ["".join(rng.choices(elements, k=20 * scale)), ""]
+    lines.extend(
+        f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements
+    )
+    return lines
+
+
+def cuboid(ranges: Dict[str, tuple]) -> str:
+    return ",".join(f"{axis}={low}..{high}" for axis, (low, high) in ranges.items())
+
+
+@generator("2021/22")
+def reactor(scale: int, rng: Random) -> List[str]:
+    """Small steps inside -50..50 followed by big ones that all miss it."""
+    lines: List[str] = []
+    for i in range(20 * scale):
+        ranges = {}
+        for axis in "xyz":
+            low = rng.randint(-50, 30)
+            ranges[axis] = (low, rng.randint(low, 50))
+        lines.append(f"{'on' if i % 4 < 3 else 'off'} {cuboid(ranges)}")
+    for i in range(400 * scale):
+        ranges = {}
+        for axis in "xyz":
+            low = rng.randint(-95000, 80000)
+            ranges[axis] = (low, low + rng.randint(5000, 30000))
+        # Move one side clear of the initialisation area.
+        axis = rng.choice("xyz")
+        low, high = ranges[axis]
+        if low <= 50 and high >= -50:
+            shift = 51 - low if rng.random() < 0.5 else -51 - high
+            ranges[axis] = (low + shift, high + shift)
+        lines.append(f"{'on' if rng.random() < 0.6 else 'off'} {cuboid(ranges)}")
+    return lines
@@ -0,0 +1,359 @@
+"""Input generators for 2022."""
+
+import math
+import os
+import string
+from random import Random
+from typing import Dict, List, Tuple
+
+from aoc import loader
+from aoc.generators import generator
+from aoc.registry import ROOT
+
+SNAFU_DIGITS = "=-012"
+
+
+def grid_size(rows: int, cols: int, scale: int) -> Tuple[int, int]:
+    """rows x cols stretched to hold scale times as many cells."""
+    side = math.sqrt(scale)
+    return round(rows * side), round(cols * side)
+
+
+@generator("2022/01")
+def calories(scale: int, rng: Random) -> List[str]:
+    lines: List[str] = []
+    for elf in range(250 * scale):
+        if elf:
+            lines.append("")
+        lines.extend(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+    return lines
+
+
+@generator("2022/02")
+def strategy(scale: int, rng: Random) -> List[str]:
+    return [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(2500 * scale)]
+
+
+@generator("2022/03")
+def rucksacks(scale: int, rng: Random) -> List[str]:
+    """Groups of three sharing just their badge, each pack with one item in
+    both compartments."""
+    lines: List[str] = []
+    for _ in range(100 * scale):
+        letters = rng.sample(string.ascii_letters, 52)
+        badge, rest = letters[0], letters[1:]
+        for elf in range(3):
+            own = rest[elf * 17 : elf * 17 + 17]
+            both = rng.choice(own + [badge])
+            others = [i for i in own if i != both]
+            half = rng.randint(4, 8)
+            first = rng.choices(others[:8], k=half - 1) + [both]
+            second = rng.choices(others[8:], k=half - 1) + [both]
+            if badge not in first + second:
+                first[rng.randrange(half - 1)] = badge
+            rng.shuffle(first)
+            rng.shuffle(second)
+            lines.append("".join(first + second))
+    return lines
+
+
+@generator("2022/04")
+def section_pairs(scale: int, rng: Random) -> List[str]:
+    lines: List[str] = []
+    for _ in range(1000 * scale):
+        pair = []
+        for _ in range(2):
+            low = rng.randint(1, 99)
+            pair.append(f"{low}-{rng.randint(low, 99)}")
+        lines.append(",".join(pair))
+    return lines
+
+
+@generator("2022/05")
+def crates(scale: int, rng: Random) -> List[str]:
+    """Nine stacks, the first four crates high as the solution checks.
+
+    Moves never take a stack's last crate, so there is always a top crate to
+    read off at the end.
+    """
+    heights = [4] + [rng.randint(1, 8 * scale) for _ in range(8)]
+    stacks = [rng.choices(string.ascii_uppercase, k=i) for i in heights]
+    lines: List[str] = []
+    for level in range(max(heights) - 1, -1, -1):
+        row = " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        )
+        lines.append(row.rstrip())
+    lines.append(" ".join(f" {i} " for i in range(1, 10)).rstrip())
+    lines.append("")
+    sizes = heights.copy()
+    for _ in range(500 * scale):
+        source = rng.choice([i for i in range(9) if sizes[i] > 1])
+        target = rng.choice([i for i in range(9) if i != source])
+        count = rng.randint(1, min(sizes[source] - 1, 30))
+        sizes[source] -= count
+        sizes[target] += count
+        lines.append(f"move {count} from {source + 1} to {target + 1}")
+    return lines
+
+
+@generator("2022/06")
+def datastream(scale: int, rng: Random) -> List[str]:
+    """Three letters over and over, so both markers come at the very end."""
+    body = rng.choices("abc", k=4096 * scale)
+    return ["".join(body + rng.sample(string.ascii_lowercase[3:], 14))]
+
+
+@generator("2022/07")
+def terminal(scale: int, rng: Random) -> List[str]:
+    """Browsing a random tree of directories, filled to about 48,000,000.
+
+    That leaves part 2 needing to free about 8,000,000, which some directory
+    under / always holds.
+    """
+    count = 180 * scale
+    children: Dict[int, List[int]] = {i: [] for i in range(count)}
+    for i in range(1, count):
+        children[rng.randrange(i)].append(i)
+    files = {i: [rng.random() for _ in range(rng.randint(0, 4))] for i in range(count)}
+    total = sum(sum(i) for i in files.values())
+    lines: List[str] = ["$ cd /"]
+
+    def browse(node: int) -> None:
+        lines.append("$ ls")
+        for child in children[node]:
+            lines.append(f"dir d{child}")
+        for i, weight in enumerate(files[node]):
+            size = max(1, int(weight / total * 48_000_000))
+            lines.append(f"{size} f{i}.{rng.choice(['txt', 'dat', 'log'])}")
+        for child in children[node]:
+            lines.append(f"$ cd d{child}")
+            browse(child)
+            lines.append("$ cd ..")
+
+    browse(0)
+    return lines
+
+
+@generator("2022/08")
+def forest(scale: int, rng: Random) -> List[str]:
+    rows, cols = grid_size(99, 99, scale)
+    return ["".join(rng.choices(string.digits, k=cols)) for _ in range(rows)]
+
+
+@generator("2022/09")
+def rope_moves(scale: int, rng: Random) -> List[str]:
+    return [f"{rng.choice('UDLR')} {rng.randint(1, 19)}" for _ in range(2000 * scale)]
+
+
+@generator("2022/10")
+def cpu_program(scale: int, rng: Random) -> List[str]:
+    """Enough instructions for 240 cycles a time, keeping X on the screen."""
+    lines: List[str] = []
+    cycles, reg_x = 0, 1
+    while cycles < 240 * scale:
+        if rng.random() < 0.3:
+            lines.append("noop")
+            cycles += 1
+        else:
+            step = rng.randint(-min(reg_x, 15), min(39 - reg_x, 15))
+            reg_x += step
+            lines.append(f"addx {step}")
+            cycles += 2
+    return lines
+
+
+def primes(count: int) -> List[int]:
+    found: List[int] = []
+    candidate = 2
+    while len(found) < count:
+        if all(candidate % i for i in found if i * i <= candidate):
+            found.append(candidate)
+        candidate += 1
+    return found
+
+
+Monkey = Tuple[List[int], str, int, int, int]
+
+
+def worry(operation: str, old: int) -> int:
+    _, op, operand = operation.split()
+    value = old if operand == "old" else int(operand)
+    return old * value if op == "*" else old + value
+
+
+def stays_calm(troop: List[Monkey], rounds: int = 20) -> bool:
+    """Whether part 1's worry levels stay small over its rounds.
+
+    Items passed round the squaring monkey over and over grow without bound
+    (part 1 only divides them by 3), which real inputs never do.
+    """
+    items = [list(i[0]) for i in troop]
+    for _ in range(rounds):
+        for held, (_, operation, divisor, on_true, on_false) in zip(items, troop):
+            for old in held:
+                new = worry(operation, old) // 3
+                if new >= 2**64:
+                    return False
+                items[on_false if new % divisor else on_true].append(new)
+            held.clear()
+    return True
+
+
+def troop(divisors: List[int], rng: Random) -> List[Monkey]:
+    squarer = rng.randrange(8)
+    monkeys: List[Monkey] = []
+    for i, divisor in enumerate(divisors):
+        if i == squarer:
+            operation = "old * old"
+        elif rng.random() < 0.3:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8))]
+        on_true, on_false = rng.sample([j for j in range(8) if j != i], 2)
+        monkeys.append((items, operation, divisor, on_true, on_false))
+    return monkeys
+
+
+@generator("2022/11")
+def monkeys(scale: int, rng: Random) -> List[str]:
+    """Troops of eight monkeys that only throw to each other.
+
+    Each troop has its own prime divisors and one monkey squaring its worry,
+    like the real ones.
+    """
+    divisors = primes(8 * scale)
+    lines: List[str] = []
+    for first in range(0, 8 * scale, 8):
+        tests = rng.sample(divisors[first : first + 8], 8)
+        monkeys = troop(tests, rng)
+        while not stays_calm(monkeys):
+            monkeys = troop(tests, rng)
+        for i, (items, operation, divisor, on_true, on_false) in enumerate(monkeys):
+            if lines:
+                lines.append("")
+            lines.extend(
+                [
+                    f"Monkey {first + i}:",
+                    f"  Starting items: {', '.join(str(j) for j in items)}",
+                    f"  Operation: new = {operation}",
+                    f"  Test: divisible by {divisor}",
+                    f"    If true: throw to monkey {first + on_true}",
+                    f"    If false: throw to monkey {first + on_false}",
+                ]
+            )
+    return lines
+
+
+@generator("2022/12")
+def hill(scale: int, rng: Random) -> List[str]:
+    """Rough ground rising from west to east, with a smooth path along one row.
+
+    The path guarantees a way from S to E (and back down to an "a").
+    """
+    rows, cols = grid_size(41, 160, scale)
+    path_row = rng.randrange(rows)
+    grid: List[str] = []
+    for row in range(rows):
+        heights = []
+        for col in range(cols):
+            height = 25 * col // (cols - 1)
+            if row != path_row:
+                height = min(25, max(0, height + rng.randint(-3, 3)))
+            heights.append(string.ascii_lowercase[height])
+        if row == path_row:
+            heights[0], heights[-1] = "S", "E"
+        grid.append("".join(heights))
+    return grid
+
+
+def packet(rng: Random, depth: int = 0) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+
+@generator("2022/13")
+def packet_pairs(scale: int, rng: Random) -> List[str]:
+    lines: List[str] = []
+    for pair in range(150 * scale):
+        if pair:
+            lines.append("")
+        lines.extend([packet(rng), packet(rng)])
+    return lines
+
+
+@generator("2022/14")
+def rock_paths(scale: int, rng: Random) -> List[str]:
+    """Zigzags of rock in a cave that gets wider and deeper with scale."""
+    depth, width = grid_size(170, 120, scale)
+    lines: List[str] = []
+    for _ in range(150 * scale):
+        x, y = 500 + rng.randint(-width // 2, width // 2), rng.randint(12, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 5)):
+            if i % 2:
+                y = min(depth, max(12, y + rng.randint(-6, 6)))
+            else:
+                x += rng.randint(-8, 8)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return lines
+
+
+@generator("2022/15")
+def sensors(scale: int, rng: Random) -> List[str]:
+    """The real sensors, plus smaller ones inside their ranges.
+
+    Finding the one spot no sensor sees in 0..4000000 needs a carefully
+    built input, so this starts from the real one: sensors placed wholly
+    inside another's range leave that spot uncovered.
+    """
+    real = loader.read_lines(os.path.join(ROOT, "2022", "15.py"))
+    parsed: List[Tuple[int, int, int]] = []
+    for line in real:
+        sx, sy, bx, by = [
+            int(i.split("=")[1]) for i in line.replace(":", ",").split(",")
+        ]
+        parsed.append((sx, sy, abs(sx - bx) + abs(sy - by)))
+    lines = list(real)
+    while len(lines) < len(real) * scale:
+        sx, sy, reach = rng.choice(parsed)
+        offset = rng.randint(0, reach // 2)
+        dx = rng.randint(-offset, offset)
+        x, y = sx + dx, sy + rng.choice([-1, 1]) * (offset - abs(dx))
+        inner = rng.randint(1, reach - offset)
+        lines.append(
+            f"Sensor at x={x}, y={y}: closest beacon is at x={x + inner}, y={y}"
+        )
+    rng.shuffle(lines)
+    return lines
+
+
+@generator("2022/23")
+def elves(scale: int, rng: Random) -> List[str]:
+    side, _ = grid_size(73, 73, scale)
+    return [
+        "".join("#" if rng.random() < 0.47 else "." for _ in range(side))
+        for _ in range(side)
+    ]
+
+
+def to_snafu(number: int) -> str:
+    digits: List[str] = []
+    while number:
+        number, digit = divmod(number + 2, 5)
+        digits.append(SNAFU_DIGITS[digit])
+    return "".join(reversed(digits)) or "0"
+
+
+@generator("2022/25")
+def snafu_numbers(scale: int, rng: Random) -> List[str]:
+    return [
+        to_snafu(rng.randint(1, 5 ** rng.randint(1, 19))) for _ in range(120 * scale)
+    ]
@@ -0,0 +1,184 @@
+"""Character grids as NumPy uint8 arrays, for the days that are all maps.
+
+A grid is a contiguous (rows, cols) uint8 array of the input's bytes, so a
+cell compares against b"#"[0] or, after `digits()`, against its number.
+Neighbours are handled a whole grid at a time: `shifted()` moves a grid by
+an offset, filling what comes in over the edge, and `neighbour_count()` /
+`neighbour_reduce()` combine the views for every offset in one pass each,
+like a small convolution. Nothing wraps around the edges.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+Offset = Tuple[int, int]
+
+# (dy, dx) offsets in reading order.
+ADJACENT: Sequence[Offset] = ((-1, 0), (0, -1), (0, 1), (1, 0))
+SURROUNDING: Sequence[Offset] = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+
+def parse(lines: Iterable[str]) -> np.ndarray:
+    """The lines as a rows x cols array of their bytes."""
+    rows = [i.encode() for i in lines]
+    if not rows:
+        return np.zeros((0, 0), dtype=np.uint8)
+    width = len(rows[0])
+    if any(len(i) != width for i in rows):
+        raise ValueError("grid rows differ in length")
+    return (
+        np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), width).copy()
+    )
+
+
+def digits(lines: Iterable[str]) -> np.ndarray:
+    """A grid of single digits, as their values."""
+    return parse(lines) - ord("0")
+
+
+def to_lines(cells: np.ndarray) -> List[str]:
+    return [row.tobytes().decode() for row in np.ascontiguousarray(cells, np.uint8)]
+
+
+def in_bounds(cells: np.ndarray, y: int, x: int) -> bool:
+    return 0 <= y < cells.shape[0] and 0 <= x < cells.shape[1]
+
+
+def neighbours(
+    cells: np.ndarray, y: int, x: int, offsets: Sequence[Offset] = ADJACENT
+) -> Iterator[Tuple[int, int]]:
+    """The (y, x) of each neighbour of one cell that is on the grid."""
+    for dy, dx in offsets:
+        if in_bounds(cells, y + dy, x + dx):
+            yield y + dy, x + dx
+
+
+def _span(size: int, delta: int) -> Tuple[slice, slice]:
+    """(into, from) slices along one axis for a shift of delta."""
+    if abs(delta) >= size:
+        return slice(0, 0), slice(0, 0)
+    return (
+        slice(max(0, -delta), size - max(0, delta)),
+        slice(max(0, delta), size - max(0, -delta)),
+    )
+
+
+def shifted(cells: np.ndarray, dy: int, dx: int, fill: int = 0) -> np.ndarray:
+    """A copy with out[y, x] == cells[y + dy, x + dx], fill off the edge."""
+    out = np.full_like(cells, fill)
+    into_y, from_y = _span(cells.shape[0], dy)
+    into_x, from_x = _span(cells.shape[1], dx)
+    out[into_y, into_x] = cells[from_y, from_x]
+    return out
+
+
+def shifted_views(
+    cells: np.ndarray, offsets: Sequence[Offset], fill: int = 0
+) -> Iterator[np.ndarray]:
+    """shifted() for each offset, as views of one padded copy.
+
+    The views share memory, so read them rather than writing to them.
+    """
+    reach = max((max(abs(dy), abs(dx)) for dy, dx in offsets), default=0)
+    rows, cols = cells.shape
+    # Much quicker than np.pad, which counts on small grids.
+    padded = np.full((rows + 2 * reach, cols + 2 * reach), fill, dtype=cells.dtype)
+    padded[reach : reach + rows, reach : reach + cols] = cells
+    for dy, dx in offsets:
+        yield padded[reach + dy : reach + dy + rows, reach + dx : reach + dx + cols]
+
+
+def neighbour_count(
+    mask: np.ndarray, offsets: Sequence[Offset] = SURROUNDING
+) -> np.ndarray:
+    """How many of each cell's neighbours are set in mask."""
+    count = np.zeros(mask.shape, dtype=np.uint8)
+    for view in shifted_views(mask.astype(np.uint8), offsets):
+        count += view
+    return count
+
+
+def neighbour_reduce(
+    func: np.ufunc, cells: np.ndarray, offsets: Sequence[Offset], fill: int
+) -> np.ndarray:
+    """func (np.minimum, np.logical_or...) over each cell's neighbours."""
+    return reduce(func, shifted_views(cells, offsets, fill))
+
+
+def regions(mask: np.ndarray, offsets: Sequence[Offset] = ADJACENT) -> np.ndarray:
+    """Label the connected parts of mask; 0 for cells outside it.
+
+    Each label is one more than the flat index of some cell of its region.
+    Labels spread as the minimum over neighbours, with each cell jumping to
+    its label's label, until nothing changes.
+    """
+    size = mask.size
+    outside = size + 1
+    flat = np.arange(1, size + 1, dtype=np.int64).reshape(mask.shape)
+    labels = np.where(mask, flat, outside)
+    while True:
+        nearby = neighbour_reduce(np.minimum, labels, offsets, outside)
+        spread = np.where(mask, np.minimum(labels, nearby), outside)
+        spread = np.where(mask, spread.flat[np.minimum(spread, size) - 1], outside)
+        if np.array_equal(spread, labels):
+            return np.where(mask, labels, 0)
+        labels = spread
+
+
+def test_parse() -> None:
+    cells = parse(["#.", ".#"])
+    assert cells.dtype == np.uint8 and cells.flags.c_contiguous
+    assert (cells == ord("#")).tolist() == [[True, False], [False, True]]
+    assert to_lines(cells) == ["#.", ".#"]
+    assert digits(["12", "90"]).tolist() == [[1, 2], [9, 0]]
+    assert parse([]).shape == (0, 0)
+    import pytest
+
+    with pytest.raises(ValueError, match="rows differ in length"):
+        parse(["ab", "c"])
+
+
+def test_shifted() -> None:
+    cells = digits(["123", "456"])
+    assert shifted(cells, 0, 1).tolist() == [[2, 3, 0], [5, 6, 0]]
+    assert shifted(cells, -1, 0, fill=9).tolist() == [[9, 9, 9], [1, 2, 3]]
+    assert shifted(cells, 5, 0).tolist() == [[0, 0, 0], [0, 0, 0]]
+    for (dy, dx), view in zip(SURROUNDING, shifted_views(cells, SURROUNDING, 7)):
+        assert (view == shifted(cells, dy, dx, 7)).all()
+    assert list(neighbours(cells, 0, 0)) == [(0, 1), (1, 0)]
+
+
+def test_neighbour_count() -> None:
+    mask = parse(["#..", ".#.", "..."]) == ord("#")
+    assert neighbour_count(mask).tolist() == [[1, 2, 1], [2, 1, 1], [1, 1, 1]]
+    assert neighbour_count(mask, ADJACENT).tolist() == [
+        [0, 2, 0],
+        [2, 0, 1],
+        [0, 1, 0],
+    ]
+    low = neighbour_reduce(np.minimum, digits(["52", "13"]), ADJACENT, 9)
+    assert low.tolist() == [[1, 3], [3, 1]]
+
+
+def test_regions() -> None:
+    mask = parse(["##.#", "..##", "#..#", "###."]) == ord("#")
+    labels = regions(mask)
+    assert labels[0, 0] == labels[0, 1] != labels[0, 3]
+    assert labels[0, 3] == labels[1, 2] == labels[2, 3]
+    assert labels[2, 0] == labels[3, 2]
+    assert (labels == 0).tolist() == (~mask).tolist()
+    sizes = np.bincount(labels[mask])
+    assert sorted(sizes[sizes > 0].tolist()) == [2, 4, 4]
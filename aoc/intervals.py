@@ -0,0 +1,209 @@
+"""Sets of integers kept as sorted, disjoint, inclusive ranges.
+
+The range days (sections, sensor rows, cuboid edges) all ask the same few
+questions of (low, high) pairs: do two overlap, what is left of one once
+another is cut out, and how much of a line a pile of them covers. The
+single-range helpers answer the first two in constant time; `IntervalSet`
+keeps the union of any number of ranges as two sorted lists of starts and
+ends, so finding where a range goes is a bisect rather than a scan, and
+ranges that overlap or touch are merged as they go in.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+Range = Tuple[int, int]
+
+
+def overlapping(a: Range, b: Range) -> bool:
+    """Whether a and b share at least one integer."""
+    return a[0] <= b[1] and b[0] <= a[1]
+
+
+def covering(a: Range, b: Range) -> bool:
+    """Whether all of b is within a."""
+    return a[0] <= b[0] and b[1] <= a[1]
+
+
+def intersection(a: Range, b: Range) -> Optional[Range]:
+    low, high = max(a[0], b[0]), min(a[1], b[1])
+    return (low, high) if low <= high else None
+
+
+def difference(a: Range, b: Range) -> List[Range]:
+    """The parts of a outside b: none, one or two ranges, lowest first."""
+    if not overlapping(a, b):
+        return [a]
+    parts = []
+    if a[0] < b[0]:
+        parts.append((a[0], b[0] - 1))
+    if b[1] < a[1]:
+        parts.append((b[1] + 1, a[1]))
+    return parts
+
+
+class IntervalSet:
+    """A set of integers, stored as the disjoint ranges that make it up."""
+
+    def __init__(self, ranges: Iterable[Range] = ()) -> None:
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        # Building from a sorted sweep is O(n log n) however they overlap.
+        for low, high in sorted(ranges):
+            if low > high:
+                continue
+            if self.ends and low <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], high)
+            else:
+                self.starts.append(low)
+                self.ends.append(high)
+
+    def __iter__(self) -> Iterator[Range]:
+        return zip(self.starts, self.ends)
+
+    def __len__(self) -> int:
+        """The number of separate ranges (see size for the integers)."""
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    @property
+    def size(self) -> int:
+        """How many integers are in the set."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def add(self, low: int, high: int) -> None:
+        if low > high:
+            return
+        # Ranges ending at low - 1 or later and starting by high + 1 merge.
+        first = bisect_left(self.ends, low - 1)
+        last = bisect_right(self.starts, high + 1)
+        if first < last:
+            low = min(low, self.starts[first])
+            high = max(high, self.ends[last - 1])
+        self.starts[first:last] = [low]
+        self.ends[first:last] = [high]
+
+    def remove(self, low: int, high: int) -> None:
+        if low > high:
+            return
+        first = bisect_left(self.ends, low)
+        last = bisect_right(self.starts, high)
+        if first >= last:
+            return
+        starts, ends = [], []
+        if self.starts[first] < low:
+            starts.append(self.starts[first])
+            ends.append(low - 1)
+        if self.ends[last - 1] > high:
+            starts.append(high + 1)
+            ends.append(self.ends[last - 1])
+        self.starts[first:last] = starts
+        self.ends[first:last] = ends
+
+    def overlaps(self, low: int, high: int) -> bool:
+        """Whether any of low..high is in the set."""
+        if low > high:
+            return False
+        i = bisect_left(self.ends, low)
+        return i < len(self.starts) and self.starts[i] <= high
+
+    def covers(self, low: int, high: int) -> bool:
+        """Whether all of low..high is in the set (never, for an empty range)."""
+        if low > high:
+            return False
+        i = bisect_right(self.starts, low) - 1
+        return i >= 0 and high <= self.ends[i]
+
+    def clip(self, low: int, high: int) -> IntervalSet:
+        """The part of the set within low..high."""
+        clipped = IntervalSet()
+        if low > high:
+            return clipped
+        first = bisect_left(self.ends, low)
+        last = bisect_right(self.starts, high)
+        clipped.starts = self.starts[first:last]
+        clipped.ends = self.ends[first:last]
+        if clipped.starts:
+            clipped.starts[0] = max(clipped.starts[0], low)
+            clipped.ends[-1] = min(clipped.ends[-1], high)
+        return clipped
+
+    def gaps(self, low: int, high: int) -> Iterator[Range]:
+        """The ranges within low..high that are not in the set."""
+        for start, end in self.clip(low, high):
+            if low < start:
+                yield low, start - 1
+            low = end + 1
+        if low <= high:
+            yield low, high
+
+
+def test_range_helpers() -> None:
+    assert overlapping((2, 4), (4, 6)) and not overlapping((2, 3), (4, 5))
+    assert covering((2, 8), (3, 7)) and not covering((3, 7), (2, 8))
+    assert intersection((2, 6), (4, 8)) == (4, 6)
+    assert intersection((2, 3), (5, 6)) is None
+    assert difference((1, 9), (4, 5)) == [(1, 3), (6, 9)]
+    assert difference((1, 9), (0, 5)) == [(6, 9)]
+    assert difference((1, 9), (0, 9)) == []
+    assert difference((1, 3), (5, 9)) == [(1, 3)]
+
+
+def test_add() -> None:
+    ranges = IntervalSet([(10, 12), (1, 3), (5, 5), (2, 4)])
+    assert list(ranges) == [(1, 5), (10, 12)]
+    ranges.add(7, 8)
+    assert list(ranges) == [(1, 5), (7, 8), (10, 12)]
+    ranges.add(6, 9)
+    assert list(ranges) == [(1, 12)]
+    ranges.add(20, 19)
+    assert len(ranges) == 1 and ranges.size == 12
+    assert 12 in ranges and 13 not in ranges and 0 not in ranges
+    assert ranges == IntervalSet([(1, 12)])
+
+
+def test_remove() -> None:
+    ranges = IntervalSet([(1, 10), (20, 30)])
+    ranges.remove(5, 22)
+    assert list(ranges) == [(1, 4), (23, 30)]
+    ranges.remove(11, 19)
+    assert list(ranges) == [(1, 4), (23, 30)]
+    ranges.remove(0, 100)
+    assert not ranges and ranges.size == 0
+
+
+def test_queries() -> None:
+    ranges = IntervalSet([(0, 4), (8, 9), (15, 20)])
+    assert ranges.overlaps(4, 7) and not ranges.overlaps(5, 7)
+    assert ranges.covers(16, 20) and not ranges.covers(8, 10)
+    assert list(ranges.clip(3, 16)) == [(3, 4), (8, 9), (15, 16)]
+    assert list(ranges.clip(5, 7)) == []
+    assert list(ranges.gaps(0, 20)) == [(5, 7), (10, 14)]
+    assert list(ranges.gaps(-2, 25)) == [(-2, -1), (5, 7), (10, 14), (21, 25)]
+    assert list(IntervalSet().gaps(1, 3)) == [(1, 3)]
+
+
+def test_empty_ranges() -> None:
+    ranges = IntervalSet([(1, 10)])
+    ranges.remove(5, 3)
+    assert list(ranges) == [(1, 10)] and ranges.size == 10
+    assert not ranges.clip(5, 3)
+    assert not ranges.overlaps(5, 3)
+    assert not ranges.covers(5, 3)
+    assert list(ranges.gaps(5, 3)) == []
@@ -0,0 +1,192 @@
+"""Read each day's puzzle input once and share it (and its parse) between parts.
+
+A day's input sits next to its module as NN.data (2020, 2021) or NN.txt (2022).
+The file is read in one go and remembered by path until it changes on disk;
+the lines handed out carry the content hash, which `parsed()` uses to hand
+both parts (and every repeat in a benchmark) the same parsed object.
+
+`substitute()` points a day at another input file for a while, which is how
+the benchmarks feed it generated inputs.
+
+`iter_lines()` is the other way in: it reads the file a line at a time and
+caches nothing, for single-pass parts run over inputs too big to hold.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+EXTENSIONS = (".data", ".txt")
+
+T = TypeVar("T")
+
+# path -> ((mtime_ns, size), digest, text)
+_FILES: Dict[str, Tuple[Tuple[int, int], str, str]] = {}
+# (digest, strip) -> lines
+_LINES: Dict[Tuple[str, Optional[Callable[[str], str]]], List[str]] = {}
+# (digest, parser) -> parsed object
+_PARSED: Dict[Tuple[str, Callable[..., Any]], Any] = {}
+# module path without extension -> input used instead of its own
+_SUBSTITUTES: Dict[str, str] = {}
+
+
+class Lines(List[str]):
+    """Input lines that know the content hash of the file they came from."""
+
+    digest: str = ""
+
+
+def input_path(module_file: str) -> Optional[str]:
+    base, _ = os.path.splitext(os.path.abspath(module_file))
+    if base in _SUBSTITUTES:
+        return _SUBSTITUTES[base]
+    for ext in EXTENSIONS:
+        if os.path.exists(base + ext):
+            return base + ext
+    return None
+
+
+@contextmanager
+def substitute(module_file: str, path: str) -> Iterator[None]:
+    """read_lines(module_file) reads path instead, until the block exits."""
+    base, _ = os.path.splitext(os.path.abspath(module_file))
+    _SUBSTITUTES[base] = os.path.abspath(path)
+    try:
+        yield
+    finally:
+        del _SUBSTITUTES[base]
+
+
+def read_file(path: str) -> Tuple[str, str]:
+    """(digest, text) for path, only rereading it if it changed on disk."""
+    stat = os.stat(path)
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILES.get(path)
+    if cached is None or cached[0] != stat_key:
+        with open(path, "rb") as data_file:
+            data = data_file.read()
+        cached = (stat_key, hashlib.sha256(data).hexdigest()[:16], data.decode())
+        _FILES[path] = cached
+    return cached[1], cached[2]
+
+
+def file_digest(path: str) -> str:
+    return read_file(path)[0]
+
+
+def read_lines(
+    module_file: str, strip: Optional[Callable[[str], str]] = str.strip
+) -> Lines:
+    """The stripped lines of a module's input file ([] if it has none).
+
+    Pass strip=str.rstrip to keep indentation, or None for the raw lines.
+    Every call gets its own list, so a part may modify it freely.
+    """
+    path = input_path(module_file)
+    if path is None:
+        return Lines()
+    digest, text = read_file(path)
+    key = (digest, strip)
+    if key not in _LINES:
+        lines = text.splitlines()
+        _LINES[key] = [strip(i) for i in lines] if strip else lines
+    lines = Lines(_LINES[key])
+    lines.digest = digest
+    return lines
+
+
+def iter_lines(
+    module_file: str, strip: Optional[Callable[[str], str]] = str.strip
+) -> Iterator[str]:
+    """read_lines(), one line at a time, never holding the whole file.
+
+    The file is picked when this is called, so a substitute() block only has
+    to cover the call, not the reading.
+    """
+    path = input_path(module_file)
+    if path is None:
+        return iter([])
+    return _stream_lines(path, strip)
+
+
+def _stream_lines(path: str, strip: Optional[Callable[[str], str]]) -> Iterator[str]:
+    with open(path) as data_file:
+        for line in data_file:
+            line = line.rstrip("\r\n")
+            yield strip(line) if strip else line
+
+
+def parsed(inputs: List[str], parser: Callable[[List[str]], T]) -> T:
+    """parser(inputs), shared by every caller with the same input file.
+
+    Only lines from read_lines() are cached (examples are just parsed), and
+    the parsed object is shared, so callers must not modify it.
+    """
+    digest = getattr(inputs, "digest", "")
+    if not digest:
+        return parser(inputs)
+    key = (digest, parser)
+    if key not in _PARSED:
+        _PARSED[key] = parser(inputs)
+    return _PARSED[key]
+
+
+def clear() -> None:
+    _FILES.clear()
+    _LINES.clear()
+    _PARSED.clear()
+
+
+def test_read_lines(tmp_path) -> None:
+    module = tmp_path / "01.py"
+    assert read_lines(str(module)) == []
+    (tmp_path / "01.data").write_text("  a b \nc\n\nd\n")
+    lines = read_lines(str(module))
+    assert lines == ["a b", "c", "", "d"]
+    assert read_lines(str(module), strip=str.rstrip) == ["  a b", "c", "", "d"]
+    assert read_lines(str(module), strip=None)[0] == "  a b "
+    lines.append("changed")
+    assert read_lines(str(module)) == ["a b", "c", "", "d"]
+    assert lines.digest == file_digest(str(tmp_path / "01.data"))
+
+
+def test_substitute(tmp_path) -> None:
+    module = str(tmp_path / "03.py")
+    (tmp_path / "03.txt").write_text("real\n")
+    (tmp_path / "big.txt").write_text("generated\n")
+    with substitute(module, str(tmp_path / "big.txt")):
+        assert read_lines(module) == ["generated"]
+    assert read_lines(module) == ["real"]
+
+
+def test_iter_lines(tmp_path) -> None:
+    module = str(tmp_path / "04.py")
+    assert list(iter_lines(module)) == []
+    (tmp_path / "04.data").write_text("  a b \nc\n\nd\n")
+    lines = iter_lines(module)
+    assert next(lines) == "a b"
+    assert list(lines) == ["c", "", "d"]
+    assert list(iter_lines(module, strip=None)) == read_lines(module, strip=None)
+    (tmp_path / "big.txt").write_text("generated\n")
+    with substitute(module, str(tmp_path / "big.txt")):
+        assert list(iter_lines(module)) == ["generated"]
+
+
+def test_parsed(tmp_path) -> None:
+    calls = []
+
+    def parser(inputs: List[str]) -> int:
+        calls.append(1)
+        return len(inputs)
+
+    (tmp_path / "02.txt").write_text("1\n2\n3\n")
+    module = str(tmp_path / "02.py")
+    assert parsed(read_lines(module), parser) == 3
+    assert parsed(read_lines(module), parser) == 3
+    assert len(calls) == 1
+    assert parsed(["x"], parser) == 1
+    assert parsed(["x"], parser) == 1
+    assert len(calls) == 3
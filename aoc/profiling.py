@@ -0,0 +1,62 @@
+"""cProfile and tracemalloc wrappers for looking inside a slow part."""
+
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+
+def profiled(call: Callable[[], Any], prof_path: str, top: int = 10) -> Tuple[Any, str]:
+    """Run call under cProfile, save the stats and summarise the hottest functions."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(call)
+    os.makedirs(os.path.dirname(prof_path) or ".", exist_ok=True)
+    profiler.dump_stats(prof_path)
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.strip_dirs().sort_stats("tottime").print_stats(top)
+    lines = [i for i in out.getvalue().splitlines() if i.strip()]
+    return result, "\n".join([f"profile saved to {prof_path}"] + lines)
+
+
+def traced(call: Callable[[], Any], top: int = 10) -> Tuple[Any, str]:
+    """Run call under tracemalloc, reporting its peak and biggest allocations.
+
+    The allocations listed are the ones still alive when call returned: its
+    result, and anything cached along the way.
+    """
+    tracemalloc.start()
+    try:
+        result = call()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    lines: List[str] = [f"peak memory {peak / 1024:.1f} KiB"]
+    lines.extend(str(i) for i in snapshot.statistics("lineno")[:top])
+    return result, "\n".join(lines)
+
+
+def _busy(count: int) -> List[int]:
+    return [i * i for i in range(count)]
+
+
+def test_profiled(tmp_path) -> None:
+    prof_path = str(tmp_path / "busy.prof")
+    result, report = profiled(lambda: len(_busy(1000)), prof_path, top=5)
+    assert result == 1000
+    assert os.path.exists(prof_path)
+    assert "_busy" in report
+    pstats.Stats(prof_path)
+
+
+def test_traced() -> None:
+    kept: List[List[int]] = []
+    result, report = traced(lambda: kept.append(_busy(10000)) or 1, top=3)
+    assert result == 1
+    peak = float(report.splitlines()[0].split()[2])
+    assert peak > 10000 * 8 / 1024
+    assert "profiling.py" in report
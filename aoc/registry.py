@@ -0,0 +1,134 @@
+"""Find the days by filename, importing each one only when it's needed.
+
+Nothing here imports a day (or pytest) until load_module() is called, so
+running one day costs one import, not every solution in the repo.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import re
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from aoc import loader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+YEARS = ["2020", "2021", "2022"]
+DAY_FILE = re.compile(r"^(\d\d)\.py$")
+DAY_SPEC = re.compile(r"(\d{4})(?:/(\d{1,2}))?")
+
+
+@dataclass(frozen=True)
+class Day:
+    year: str
+    day: int
+    path: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc{self.year}_{self.day:02d}"
+
+    @property
+    def input_path(self) -> Optional[str]:
+        return loader.input_path(self.path)
+
+
+def input_hash(day: Day) -> str:
+    """Short content hash of a day's puzzle input ("" if it has none)."""
+    if day.input_path is None:
+        return ""
+    return loader.file_digest(day.input_path)
+
+
+def find_days(years: Iterable[str] = YEARS, root: str = ROOT) -> List[Day]:
+    days: List[Day] = []
+    for year in years:
+        year_dir = os.path.join(root, year)
+        if not os.path.isdir(year_dir):
+            continue
+        for filename in sorted(os.listdir(year_dir)):
+            if matched := DAY_FILE.match(filename):
+                days.append(
+                    Day(year, int(matched[1]), os.path.join(year_dir, filename))
+                )
+    return days
+
+
+def test_find_days() -> None:
+    days = find_days()
+    names = [i.name for i in days]
+    assert "2020/05" in names
+    assert "2021/01" in names
+    assert "2022/25" in names
+    assert not [i for i in days if not i.path.endswith(f"{i.day:02d}.py")]
+
+
+def select_days(days: List[Day], selection: Sequence[str]) -> List[Day]:
+    """Filter by "YYYY" or "YYYY/DD" names; no selection keeps every day."""
+    if not selection:
+        return days
+    wanted = {parse_spec(i) for i in selection}
+    return [i for i in days if (i.year, i.day) in wanted or (i.year, None) in wanted]
+
+
+def parse_spec(spec: str) -> Tuple[str, Optional[int]]:
+    """The (year, day) a "YYYY" or "YYYY/DD" names; day is None for a whole year."""
+    matched = DAY_SPEC.fullmatch(spec)
+    if not matched:
+        raise ValueError(f"{spec!r} isn't YYYY or YYYY/DD")
+    return matched[1], int(matched[2]) if matched[2] else None
+
+
+def test_select_days() -> None:
+    days = find_days()
+    assert select_days(days, []) == days
+    assert {i.year for i in select_days(days, ["2021"])} == {"2021"}
+    assert [i.name for i in select_days(days, ["2022/07"])] == ["2022/07"]
+    assert [i.name for i in select_days(days, ["2022/7"])] == ["2022/07"]
+    import pytest
+
+    for spec in ("2020/xx", "20", "2020/", "2020/7/1"):
+        with pytest.raises(ValueError, match="isn't YYYY or YYYY/DD"):
+            select_days(days, [spec])
+
+
+def load_module(day: Day) -> ModuleType:
+    """Import a day by path, since "05.py" can't be imported by name."""
+    if day.module_name in sys.modules:
+        return sys.modules[day.module_name]
+    spec = importlib.util.spec_from_file_location(day.module_name, day.path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[day.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
+
+
+def test_lazy_imports() -> None:
+    import subprocess
+
+    check = (
+        "import sys, aoc.cli, aoc.registry as r; r.load_module(r.find_days()[0]);"
+        "print(sorted(i for i in sys.modules if i.startswith('aoc20')"
+        " or i in ('pytest', 'multiprocessing')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "['aoc2020_01']"
@@ -0,0 +1,397 @@
+"""Time every day's part1/part2 over a process pool."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from aoc import counters
+from aoc.cache import AnswerCache, answer_key
+from aoc.registry import ROOT, Day, find_days, load_module, parse_spec, select_days
+
+PROFILE_DIR = os.path.join(ROOT, ".cache", "profiles")
+
+# Runs a part's call, returning its answer and a report on the run.
+Wrapper = Callable[[Callable[[], Any]], Tuple[Any, str]]
+
+
+@dataclass
+class PartResult:
+    part: int
+    answer: str = ""
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+    report: str = ""
+    counters: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class DayResult:
+    day: Day
+    parts: List[PartResult] = field(default_factory=list)
+
+    @property
+    def elapsed(self) -> float:
+        return sum(i.elapsed for i in self.parts)
+
+
+def describe(exc: BaseException) -> str:
+    return f"{exc.__class__.__name__}: {exc}"
+
+
+def open_day(day: Day) -> ModuleType:
+    """Import a day, keeping any output from its module body quiet."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_module(day)
+
+
+def day_inputs(module: ModuleType, stream: bool = False) -> Iterable[str]:
+    """A day's input lines, as a fresh list or (if it can take them) a stream."""
+    if stream and hasattr(module, "stream_inputs"):
+        return module.stream_inputs()
+    # Some parts modify their inputs, so each call gets a fresh list.
+    return module.get_inputs()
+
+
+def test_day_inputs() -> None:
+    listed = ModuleType("listed")
+    listed.get_inputs = lambda: ["1", "2"]  # type: ignore[attr-defined]
+    assert day_inputs(listed, stream=True) == ["1", "2"]
+    listed.stream_inputs = lambda: iter(["1", "2"])  # type: ignore[attr-defined]
+    assert day_inputs(listed) == ["1", "2"]
+    assert list(day_inputs(listed, stream=True)) == ["1", "2"]
+    assert not isinstance(day_inputs(listed, stream=True), list)
+
+
+def time_part(
+    module: ModuleType,
+    part: int,
+    wrapper: Optional[Wrapper] = None,
+    stream: bool = False,
+) -> Tuple[str, float, str]:
+    """(answer, seconds, report) for one run of a part."""
+    inputs = day_inputs(module, stream)
+    func = getattr(module, f"part{part}")
+    report = ""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        if wrapper is None:
+            answer = func(inputs)
+        else:
+            answer, report = wrapper(lambda: func(inputs))
+        elapsed = time.perf_counter() - start
+    return str(answer), elapsed, report
+
+
+def run_part(
+    module: ModuleType,
+    part: int,
+    wrapper: Optional[Wrapper] = None,
+    stream: bool = False,
+    count: bool = False,
+) -> PartResult:
+    result = PartResult(part)
+    with counters.collecting(count) as counts:
+        try:
+            result.answer, result.elapsed, result.report = time_part(
+                module, part, wrapper, stream
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            result.error = describe(exc)
+    result.counters = dict(counts)
+    return result
+
+
+def part_wrapper(
+    day: Day, part: int, profile_dir: Optional[str], memory: bool, top: int
+) -> Optional[Wrapper]:
+    if profile_dir:
+        from aoc.profiling import profiled
+
+        prof_path = os.path.join(profile_dir, f"{day.year}-{day.day:02d}-{part}.prof")
+        return partial(profiled, prof_path=prof_path, top=top)
+    if memory:
+        from aoc.profiling import traced
+
+        return partial(traced, top=top)
+    return None
+
+
+def run_day(
+    day: Day,
+    profile_dir: Optional[str] = None,
+    memory: bool = False,
+    top: int = 10,
+    stream: bool = False,
+    count: bool = False,
+) -> DayResult:
+    """Worker: run both parts of one day, optionally profiling them."""
+    result = DayResult(day)
+    try:
+        module = open_day(day)
+    except Exception as exc:  # pylint: disable=broad-except
+        # Half-finished days may not even import; report it and move on.
+        error = describe(exc)
+        result.parts = [PartResult(1, error=error), PartResult(2, error=error)]
+        return result
+    for part in (1, 2):
+        wrapper = part_wrapper(day, part, profile_dir, memory, top)
+        result.parts.append(run_part(module, part, wrapper, stream, count))
+    return result
+
+
+T = TypeVar("T")
+
+
+def map_days(
+    worker: Callable[[Day], T], days: List[Day], jobs: Optional[int] = None
+) -> List[T]:
+    """Run worker over days in a process pool, returning results in day order."""
+    if jobs == 1 or len(days) <= 1:
+        # Not worth starting (or even importing) a pool for.
+        return [worker(i) for i in days]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(worker, days))
+
+
+def cached_day(day: Day, cache: AnswerCache) -> Optional[DayResult]:
+    parts = []
+    for part in (1, 2):
+        entry = cache.get(answer_key(day.name, part, day.path, day.input_path))
+        if entry is None:
+            return None
+        parts.append(PartResult(part, entry["answer"], entry["elapsed"], cached=True))
+    return DayResult(day, parts)
+
+
+def run_all(
+    days: List[Day],
+    jobs: Optional[int] = None,
+    cache: Optional[AnswerCache] = None,
+    worker: Callable[[Day], DayResult] = run_day,
+) -> List[DayResult]:
+    """Run every day, only solving those the cache has no answers for."""
+    if cache is None:
+        return map_days(worker, days, jobs=jobs)
+    results = {i: cached_day(i, cache) for i in days}
+    todo = [i for i, result in results.items() if result is None]
+    for result in map_days(worker, todo, jobs=jobs):
+        results[result.day] = result
+        for part in result.parts:
+            if not part.error:
+                key = answer_key(
+                    result.day.name, part.part, result.day.path, result.day.input_path
+                )
+                cache.put(key, part.answer, part.elapsed)
+    cache.save()
+    return [results[i] for i in days]
+
+
+def short_answer(answer: str, width: int = 24) -> str:
+    answer = " / ".join(answer.splitlines())
+    if len(answer) > width:
+        return answer[: width - 3] + "..."
+    return answer
+
+
+def test_short_answer() -> None:
+    assert short_answer("1234") == "1234"
+    assert short_answer("ab\ncd") == "ab / cd"
+    assert short_answer("x" * 30, width=10) == "xxxxxxx..."
+
+
+def format_table(results: List[DayResult]) -> str:
+    rows = [f"{'day':<8} {'part':>4} {'seconds':>9}  answer"]
+    for day_result in results:
+        for part in day_result.parts:
+            answer = part.error if part.error else short_answer(part.answer)
+            if part.cached:
+                answer += "  (cached)"
+            rows.append(
+                f"{day_result.day.name:<8} {part.part:>4} {part.elapsed:>9.3f}  {answer}"
+            )
+    return "\n".join(rows)
+
+
+def test_format_table() -> None:
+    day = Day("2020", 5, "05.py")
+    table = format_table(
+        [
+            DayResult(
+                day, [PartResult(1, "838", 0.5), PartResult(2, error="KeyError: 5")]
+            )
+        ]
+    )
+    lines = table.splitlines()
+    assert len(lines) == 3
+    assert lines[1].startswith("2020/05     1     0.500  838")
+    assert lines[2].endswith("KeyError: 5")
+
+
+def format_counters(results: List[DayResult]) -> str:
+    """The counters each part made, busiest first ("" if there were none)."""
+    rows = []
+    for day_result in results:
+        for part in day_result.parts:
+            counts = sorted(part.counters.items(), key=lambda i: (-i[1], i[0]))
+            if counts:
+                listed = "  ".join(f"{name}={value:,}" for name, value in counts)
+                rows.append(f"{day_result.day.name:<8} {part.part:>4}  {listed}")
+    if not rows:
+        return ""
+    return "\n".join([f"{'day':<8} {'part':>4}  counters"] + rows)
+
+
+def test_format_counters() -> None:
+    day = Day("2022", 11, "11.py")
+    parts = [PartResult(1, "1", counters={"pushed": 12, "Monkey.inspect": 3400})]
+    parts.append(PartResult(2, "2"))
+    lines = format_counters([DayResult(day, parts)]).splitlines()
+    assert lines == [
+        "day      part  counters",
+        "2022/11     1  Monkey.inspect=3,400  pushed=12",
+    ]
+    assert format_counters([DayResult(day, [PartResult(1, "1")])]) == ""
+
+
+def test_run_part_counts() -> None:
+    module = ModuleType("counting")
+    module.get_inputs = lambda: ["a", "b"]  # type: ignore[attr-defined]
+
+    def part1(inputs: List[str]) -> int:
+        counters.count("lines", len(inputs))
+        return len(inputs)
+
+    module.part1 = part1  # type: ignore[attr-defined]
+    assert run_part(module, 1, count=True).counters == {"lines": 2}
+    assert run_part(module, 1).counters == {}
+
+
+def day_spec(text: str) -> str:
+    """argparse type for a "YYYY" or "YYYY/DD" argument."""
+    try:
+        parse_spec(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+    return text
+
+
+def positive_int(text: str) -> int:
+    """argparse type for a count that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def non_negative_int(text: str) -> int:
+    """argparse type for a count that may be 0."""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"can't be negative, not {value}")
+    return value
+
+
+def test_arguments() -> None:
+    import pytest
+
+    parser = argparse.ArgumentParser()
+    add_parser(parser.add_subparsers())
+    assert parser.parse_args(["run", "2020", "2021/1", "-j", "2"]).jobs == 2
+    for bad in (["run", "2020/xx"], ["run", "-j", "0"], ["run", "-j", "x"]):
+        with pytest.raises(SystemExit):
+            parser.parse_args(bad)
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    days = select_days(find_days(), args.days)
+    start = time.perf_counter()
+    profile_dir = args.profile_dir if args.profile else None
+    worker = partial(
+        run_day,
+        profile_dir=profile_dir,
+        memory=args.memory,
+        top=args.top,
+        stream=args.stream,
+        count=args.counters,
+    )
+    # Profiling (or streaming or counting) is the point of the run, so don't
+    # let the cache skip it.
+    probing = args.profile or args.memory or args.stream or args.counters
+    cache = None if args.no_cache or probing else AnswerCache()
+    results = run_all(days, jobs=args.jobs, cache=cache, worker=worker)
+    wall = time.perf_counter() - start
+    print(format_table(results))
+    if counted := format_counters(results):
+        print()
+        print(counted)
+    for day_result in results:
+        for part in day_result.parts:
+            if part.report:
+                print(f"\n== {day_result.day.name} part {part.part} ==")
+                print(part.report)
+    solved = [i for i in results if not i.parts[0].cached]
+    total = sum(i.elapsed for i in solved)
+    print(
+        f"{len(solved)} of {len(results)} days solved: "
+        f"{total:.3f}s of solving in {wall:.3f}s wall time"
+    )
+
+
+def add_parser(commands: Any) -> None:
+    run = commands.add_parser("run", help="run and time every selected day")
+    run.add_argument(
+        "days", nargs="*", type=day_spec, help='"YYYY" or "YYYY/DD" (default: all)'
+    )
+    run.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="worker processes (default: CPUs)",
+    )
+    run.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="solve every day, even if its source and input haven't changed",
+    )
+    probe = run.add_mutually_exclusive_group()
+    probe.add_argument(
+        "--profile",
+        action="store_true",
+        help="run each part under cProfile, saving .prof files and the hottest calls",
+    )
+    probe.add_argument(
+        "--memory",
+        action="store_true",
+        help="run each part under tracemalloc and report its peak memory",
+    )
+    run.add_argument(
+        "--stream",
+        action="store_true",
+        help="feed days that can take it their input a line at a time",
+    )
+    run.add_argument(
+        "--counters",
+        action="store_true",
+        help="collect and list the operation counts days make with aoc.counters",
+    )
+    run.add_argument(
+        "--profile-dir",
+        default=PROFILE_DIR,
+        help="where --profile saves .prof files (default: .cache/profiles)",
+    )
+    run.add_argument(
+        "--top", type=int, default=10, help="functions/allocations listed per part"
+    )
+    run.set_defaults(func=cmd_run)
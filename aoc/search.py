@@ -0,0 +1,201 @@
+"""Searches over integer-encoded states, for the days that are graph problems.
+
+A day describes its puzzle as states packed into ints, a `neighbours`
+function giving the states one move away (with the move's cost, for the
+weighted searches) and a `goal` test. Ints keep the frontier and the seen
+sets small and cheap to hash, and every search reports how much work it
+did (to `aoc.counters` too), so two encodings or heuristics can be compared
+on more than time.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from aoc import counters
+
+State = int
+Steps = Callable[[State], Iterable[State]]
+Moves = Callable[[State], Iterable[Tuple[State, int]]]
+Goal = Callable[[State], bool]
+Heuristic = Callable[[State], int]
+
+
+@dataclass
+class Found:
+    cost: int
+    state: State
+    # States taken off the frontier and put on it.
+    expanded: int = 0
+    pushed: int = 0
+
+    def counted(self, search: str, goal: bool = True) -> Optional[Found]:
+        """Add the work to the search's counters; self if a goal was found."""
+        counters.count(f"{search}.expanded", self.expanded)
+        counters.count(f"{search}.pushed", self.pushed)
+        return self if goal else None
+
+
+def bfs(starts: Iterable[State], neighbours: Steps, goal: Goal) -> Optional[Found]:
+    """The nearest goal state in steps from any start, or None."""
+    frontier = deque((i, 0) for i in starts)
+    seen = {i for i, _ in frontier}
+    found = Found(0, 0, pushed=len(frontier))
+    while frontier:
+        state, steps = frontier.popleft()
+        found.expanded += 1
+        if goal(state):
+            found.cost, found.state = steps, state
+            return found.counted("bfs")
+        for next_state in neighbours(state):
+            if next_state not in seen:
+                seen.add(next_state)
+                frontier.append((next_state, steps + 1))
+                found.pushed += 1
+    return found.counted("bfs", goal=False)
+
+
+def reachable(starts: Iterable[State], neighbours: Steps) -> Set[State]:
+    """Every state that can be got to from the starts, the starts included."""
+    frontier = list(starts)
+    seen = set(frontier)
+    while frontier:
+        for next_state in neighbours(frontier.pop()):
+            if next_state not in seen:
+                seen.add(next_state)
+                frontier.append(next_state)
+    counters.count("reachable.states", len(seen))
+    return seen
+
+
+def astar(
+    starts: Iterable[State],
+    neighbours: Moves,
+    goal: Goal,
+    heuristic: Optional[Heuristic] = None,
+) -> Optional[Found]:
+    """The cheapest goal state from any start, or None.
+
+    heuristic(state) must never overestimate the cost left to a goal; with
+    none this is Dijkstra's algorithm.
+    """
+    guess = heuristic or (lambda _: 0)
+    best: Dict[State, int] = {}
+    frontier: List[Tuple[int, int, State]] = []
+    for state in starts:
+        best[state] = 0
+        frontier.append((guess(state), 0, state))
+    heapq.heapify(frontier)
+    found = Found(0, 0, pushed=len(frontier))
+    while frontier:
+        _, cost, state = heapq.heappop(frontier)
+        if cost > best[state]:
+            continue  # Already expanded more cheaply.
+        found.expanded += 1
+        if goal(state):
+            found.cost, found.state = cost, state
+            return found.counted("astar")
+        for next_state, move_cost in neighbours(state):
+            next_cost = cost + move_cost
+            if next_cost < best.get(next_state, next_cost + 1):
+                best[next_state] = next_cost
+                heapq.heappush(
+                    frontier, (next_cost + guess(next_state), next_cost, next_state)
+                )
+                found.pushed += 1
+    return found.counted("astar", goal=False)
+
+
+def dijkstra(starts: Iterable[State], neighbours: Moves, goal: Goal) -> Optional[Found]:
+    return astar(starts, neighbours, goal)
+
+
+def count_paths(start: State, neighbours: Steps, goal: Goal) -> int:
+    """How many ways there are from start to a goal state.
+
+    The states must not form cycles. Each state's count is worked out once,
+    so paths through the same state are counted rather than walked again.
+    """
+    counts: Dict[State, int] = {}
+    stack: List[Tuple[State, Optional[List[State]]]] = [(start, None)]
+    deepest = 1
+    while stack:
+        state, next_states = stack.pop()
+        if state in counts:
+            continue
+        if goal(state):
+            counts[state] = 1
+        elif next_states is None:
+            next_states = list(neighbours(state))
+            stack.append((state, next_states))
+            stack.extend((i, None) for i in next_states if i not in counts)
+            deepest = max(deepest, len(stack))
+        else:
+            counts[state] = sum(counts[i] for i in next_states)
+    counters.count("count_paths.states", len(counts))
+    counters.peak("count_paths.stack", deepest)
+    return counts[start]
+
+
+# A 4x4 grid of cells 0-15 in reading order, with a wall at 5, 6 and 9.
+WALLS = {5, 6, 9}
+
+
+def grid_steps(cell: State) -> Iterable[State]:
+    y, x = divmod(cell, 4)
+    for j, i in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+        if 0 <= j < 4 and 0 <= i < 4 and j * 4 + i not in WALLS:
+            yield j * 4 + i
+
+
+def test_bfs() -> None:
+    found = bfs([0], grid_steps, lambda i: i == 10)
+    assert found is not None
+    assert (found.cost, found.state) == (6, 10)
+    assert found.expanded <= found.pushed <= 13
+    assert bfs([0, 11], grid_steps, lambda i: i == 10).cost == 1
+    assert bfs([0], grid_steps, lambda i: i == 5) is None
+
+
+def test_reachable() -> None:
+    assert reachable([0], grid_steps) == set(range(16)) - WALLS
+    assert reachable([5], lambda i: []) == {5}
+    left = reachable([3, 7], lambda i: [i - 1] if i % 4 else [])
+    assert left == set(range(8))
+
+
+def test_astar() -> None:
+    def moves(cell: State) -> Iterable[Tuple[State, int]]:
+        # Going down costs 5, so the best way has the fewest steps down.
+        return ((i, 5 if i > cell + 1 else 1) for i in grid_steps(cell))
+
+    def distance(cell: State) -> int:
+        return abs(cell // 4 - 2) + abs(cell % 4 - 2)
+
+    plain = dijkstra([0], moves, lambda i: i == 10)
+    guided = astar([0], moves, lambda i: i == 10, distance)
+    assert plain.cost == guided.cost == 14
+    assert guided.expanded <= plain.expanded
+    assert dijkstra([0], moves, lambda i: i == 6) is None
+
+
+def test_count_paths() -> None:
+    # Only moving right or down: 4 cells across, 3 down from 0 to 15.
+    def onward(cell: State) -> Iterable[State]:
+        return (i for i in (cell + 1, cell + 4) if i < 16 and (i % 4 or i == cell + 4))
+
+    assert count_paths(0, onward, lambda i: i == 15) == 20
+    assert count_paths(0, onward, lambda i: i == 0) == 1
+
+
+def test_counters() -> None:
+    with counters.collecting() as counts:
+        found = bfs([0], grid_steps, lambda i: i == 10)
+        bfs([0], grid_steps, lambda i: i == 5)
+    # The failed search expands all 13 cells it can reach.
+    assert counts["bfs.expanded"] == found.expanded + 13
+    assert counts["bfs.pushed"] >= found.pushed
+    assert "astar.pushed" not in counts
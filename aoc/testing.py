@@ -0,0 +1,18 @@
+"""Test helpers that keep pytest out of the days' production imports."""
+
+import sys
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def fixture(func: F) -> F:
+    """pytest.fixture when running under pytest, otherwise the plain function.
+
+    pytest is always imported before it collects a day, so the fixtures are
+    registered as usual; the runner never pays for importing pytest.
+    """
+    pytest = sys.modules.get("pytest")
+    if pytest is None:
+        return func
+    return pytest.fixture(func)
@@ -0,0 +1,159 @@
+"""A tiny virtual machine for the days whose input is a program.
+
+The handheld console (2020/08) and the CRT's CPU (2022/10) are the same
+machine: one register, adding to it, jumping and doing nothing, with each
+instruction taking some number of cycles. A day describes its assembly as
+an instruction set mapping each mnemonic to one of those operations and its
+cost. `Program.compile()` decodes the lines once into parallel lists of
+opcodes, operands and costs, so running is one loop over ints, however many
+cycles the program takes.
+
+`run()` stops when the program runs off its end, when it is about to run an
+instruction a second time (if asked to look for loops) or at a cycle limit.
+An observer, if given, is called with every cycle and the register's value
+during it, which is how a day watches a program without the machine
+knowing what it is looking for.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+NOP, ACC, JMP = range(3)
+
+# Mnemonic to (operation, cycles).
+InstructionSet = Dict[str, Tuple[int, int]]
+Observer = Callable[[int, int], None]
+
+
+class Exit(Enum):
+    HALTED = "halted"  # Jumped or stepped to just past the last instruction.
+    LOOPED = "looped"  # About to run an instruction it had already run.
+    OUT_OF_BOUNDS = "out of bounds"  # Jumped anywhere else off the program.
+    LIMIT = "limit"  # Got to max_cycles.
+
+
+@dataclass
+class Program:
+    ops: List[int]
+    args: List[int]
+    costs: List[int]
+
+    @classmethod
+    def compile(cls, lines: Iterable[str], instructions: InstructionSet) -> Program:
+        program = cls([], [], [])
+        for number, line in enumerate(lines):
+            name, *operand = line.split()
+            if name not in instructions:
+                raise ValueError(f"line {number + 1}: unknown instruction {name!r}")
+            op, cost = instructions[name]
+            program.ops.append(op)
+            program.args.append(int(operand[0]) if operand else 0)
+            program.costs.append(cost)
+        return program
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+
+@dataclass
+class Run:
+    exit: Exit
+    acc: int
+    ip: int
+    steps: int
+    cycles: int
+    # 1 for each instruction that ran at least once.
+    seen: bytearray = field(repr=False)
+
+
+def run(
+    program: Program,
+    acc: int = 0,
+    observer: Optional[Observer] = None,
+    detect_loops: bool = True,
+    max_cycles: Optional[int] = None,
+    start: int = 0,
+) -> Run:
+    """Run program from instruction start (the first) with the register at acc.
+
+    max_cycles stops it before it starts an instruction after that cycle, so
+    the last one it runs may finish a cycle or so beyond it.
+    """
+    ops, args, costs = program.ops, program.args, program.costs
+    size = len(ops)
+    limit = -1 if max_cycles is None else max_cycles
+    seen = bytearray(size)
+    ip, steps, cycles = start, 0, 0
+    exit_ = Exit.HALTED
+    while 0 <= ip < size:
+        if detect_loops and seen[ip]:
+            exit_ = Exit.LOOPED
+            break
+        if cycles >= limit >= 0:
+            exit_ = Exit.LIMIT
+            break
+        cost = costs[ip]
+        seen[ip] = 1
+        if observer is not None:
+            for cycle in range(cycles + 1, cycles + cost + 1):
+                observer(cycle, acc)
+        cycles += cost
+        steps += 1
+        op = ops[ip]
+        if op == JMP:
+            ip += args[ip]
+        else:
+            if op == ACC:
+                acc += args[ip]
+            ip += 1
+    if exit_ is Exit.HALTED and ip != size:
+        exit_ = Exit.OUT_OF_BOUNDS
+    return Run(exit_, acc, ip, steps, cycles, seen)
+
+
+BASIC: InstructionSet = {"nop": (NOP, 1), "acc": (ACC, 1), "jmp": (JMP, 1)}
+
+
+def test_compile() -> None:
+    program = Program.compile(["nop +0", "acc -3", "jmp +2"], BASIC)
+    assert (program.ops, program.args, program.costs) == (
+        [NOP, ACC, JMP],
+        [0, -3, 2],
+        [1, 1, 1],
+    )
+    assert len(Program.compile(["noop"], {"noop": (NOP, 1)})) == 1
+    import pytest
+
+    with pytest.raises(ValueError, match="line 1: unknown instruction 'hcf'"):
+        Program.compile(["hcf"], BASIC)
+
+
+def test_run() -> None:
+    program = Program.compile(["acc +2", "jmp +2", "acc +100", "acc -1"], BASIC)
+    done = run(program)
+    assert (done.exit, done.acc, done.steps, done.cycles) == (Exit.HALTED, 1, 3, 3)
+    assert list(done.seen) == [1, 1, 0, 1]
+    looped = run(Program.compile(["acc +1", "jmp -1"], BASIC))
+    assert (looped.exit, looped.acc, looped.ip) == (Exit.LOOPED, 1, 0)
+    stopped = run(
+        Program.compile(["acc +1", "jmp -1"], BASIC), detect_loops=False, max_cycles=9
+    )
+    assert (stopped.exit, stopped.acc, stopped.cycles) == (Exit.LIMIT, 5, 9)
+    assert run(Program.compile(["jmp -1"], BASIC)).exit is Exit.OUT_OF_BOUNDS
+    later = run(program, acc=10, start=3)
+    assert (later.exit, later.acc, later.steps) == (Exit.HALTED, 9, 1)
+
+
+def test_observer() -> None:
+    slow = {"noop": (NOP, 1), "addx": (ACC, 2)}
+    program = Program.compile(["noop", "addx 3", "addx -5"], slow)
+    during: List[Tuple[int, int]] = []
+    done = run(program, acc=1, observer=lambda *i: during.append(i))
+    assert during == [(1, 1), (2, 1), (3, 1), (4, 4), (5, 4)]
+    assert (done.acc, done.cycles) == (-1, 5)
+    during.clear()
+    part = run(program, acc=1, observer=lambda *i: during.append(i), max_cycles=2)
+    assert (part.exit, part.cycles, during[-1]) == (Exit.LIMIT, 3, (3, 1))
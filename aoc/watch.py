@@ -0,0 +1,220 @@
+"""Re-run days as their source or input changes, for while a day is being written.
+
+`watch` polls the modification times of the selected days' modules and
+inputs, and hands each day that changed to one long-lived worker process.
+The worker keeps the interpreter, the aoc package and anything the days
+import (NumPy...) loaded between runs, and only drops and re-imports the
+changed day, so a save costs that day's run rather than a fresh `python
+NN.py` and its tests. A day that takes longer than the timeout, or kills
+the worker, is reported as failing and only costs a new worker.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from aoc import loader
+from aoc.registry import Day, find_days, select_days
+from aoc.runner import (
+    DayResult,
+    PartResult,
+    day_spec,
+    describe,
+    format_table,
+    run_day,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# (mtime_ns, size) of a day's module and of its input (None if it has none).
+Stamp = Tuple[Tuple[int, int], Optional[Tuple[int, int]]]
+
+
+def file_stamp(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def snapshot(days: Sequence[Day]) -> Dict[Day, Stamp]:
+    stamps: Dict[Day, Stamp] = {}
+    for day in days:
+        source = file_stamp(day.path)
+        if source is not None:
+            stamps[day] = (source, file_stamp(day.input_path))
+    return stamps
+
+
+def changed_days(before: Dict[Day, Stamp], after: Dict[Day, Stamp]) -> List[Day]:
+    """Days that are new in after or whose files differ, in day order."""
+    days = [i for i, stamp in after.items() if before.get(i) != stamp]
+    return sorted(days, key=lambda i: (i.year, i.day))
+
+
+def rerun_day(day: Day) -> DayResult:
+    """Worker: forget the day's module and cached input, then run it afresh."""
+    sys.modules.pop(day.module_name, None)
+    loader.clear()
+    return run_day(day)
+
+
+def stop_worker(pool: ProcessPoolExecutor) -> None:
+    """Shut a pool down without waiting on a worker that may never finish."""
+    # The pool has no way to stop a running task, so end its processes.
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def rerun_in(
+    pool: ProcessPoolExecutor, day: Day, timeout: Optional[float]
+) -> Tuple[DayResult, ProcessPoolExecutor]:
+    """rerun_day() in the pool's worker, and the pool to use next time.
+
+    If the day runs past timeout seconds or breaks the worker, every part is
+    reported as failing and the pool is replaced.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import TimeoutError as FutureTimeout
+    from concurrent.futures.process import BrokenProcessPool
+
+    try:
+        return pool.submit(rerun_day, day).result(timeout=timeout), pool
+    except (BrokenProcessPool, FutureTimeout) as exc:
+        error = describe(exc) if str(exc) else f"no answer after {timeout}s"
+        stop_worker(pool)
+        failed = [PartResult(i, error=error) for i in (1, 2)]
+        return DayResult(day, failed), ProcessPoolExecutor(max_workers=1)
+
+
+def watch(
+    selection: Sequence[str],
+    interval: float = 0.5,
+    rounds: Optional[int] = None,
+    timeout: Optional[float] = 60,
+) -> None:
+    """Poll for changes every interval seconds (for rounds polls, or forever)."""
+    # Imported here so other commands don't pay for multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    stamps = snapshot(select_days(find_days(), selection))
+    print(f"watching {len(stamps)} days; Ctrl-C to stop", flush=True)
+    pool = ProcessPoolExecutor(max_workers=1)
+    try:
+        while rounds is None or rounds > 0:
+            if rounds is not None:
+                rounds -= 1
+            time.sleep(interval)
+            # Looked for again each time, so new days are picked up.
+            latest = snapshot(select_days(find_days(), selection))
+            for day in changed_days(stamps, latest):
+                result, pool = rerun_in(pool, day, timeout)
+                print(time.strftime("%H:%M:%S"), day.name)
+                print(format_table([result]), flush=True)
+            stamps = latest
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_worker(pool)
+
+
+DAY_SOURCE = """
+from aoc.loader import read_lines
+
+def get_inputs():
+    return read_lines(__file__)
+
+def part1(inputs):
+    return sum(int(i) for i in inputs) * {factor}
+
+def part2(inputs):
+    return len(inputs)
+"""
+
+
+def test_changed_days(tmp_path) -> None:
+    year = tmp_path / "2020"
+    year.mkdir()
+    (year / "01.py").write_text(DAY_SOURCE.format(factor=1))
+    (year / "01.data").write_text("1\n2\n")
+    days = find_days(["2020"], root=str(tmp_path))
+    before = snapshot(days)
+    assert changed_days(before, snapshot(days)) == []
+    (year / "01.data").write_text("1\n2\n3\n")
+    assert changed_days(before, snapshot(days)) == days
+    assert changed_days({}, before) == days
+
+
+def test_rerun_day(tmp_path) -> None:
+    year = tmp_path / "2020"
+    year.mkdir()
+    (year / "01.py").write_text(DAY_SOURCE.format(factor=1))
+    (year / "01.data").write_text("1\n2\n")
+    day = find_days(["2020"], root=str(tmp_path))[0]
+    assert [i.answer for i in rerun_day(day).parts] == ["3", "2"]
+    (year / "01.py").write_text(DAY_SOURCE.format(factor=10))
+    (year / "01.data").write_text("1\n2\n3\n")
+    assert [i.answer for i in rerun_day(day).parts] == ["60", "3"]
+    sys.modules.pop(day.module_name, None)
+
+
+def test_rerun_in(tmp_path) -> None:
+    year = tmp_path / "2020"
+    year.mkdir()
+    (year / "01.py").write_text(
+        DAY_SOURCE.format(factor="__import__('time').sleep(60)")
+    )
+    (year / "01.data").write_text("1\n")
+    (year / "02.py").write_text(DAY_SOURCE.format(factor=1))
+    (year / "02.data").write_text("1\n2\n")
+    hangs, works = find_days(["2020"], root=str(tmp_path))
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(max_workers=1)
+    try:
+        result, fresh = rerun_in(pool, hangs, timeout=1)
+        assert fresh is not pool
+        assert [i.part for i in result.parts] == [1, 2]
+        assert all(i.error == "no answer after 1s" for i in result.parts)
+        result, pool = rerun_in(fresh, works, timeout=30)
+        assert [i.answer for i in result.parts] == ["3", "2"]
+    finally:
+        stop_worker(pool)
+
+
+def cmd_watch(args: argparse.Namespace) -> None:
+    watch(args.days, args.interval, timeout=args.timeout)
+
+
+def add_parser(commands: Any) -> None:
+    parser = commands.add_parser(
+        "watch", help="re-run days whenever their source or input changes"
+    )
+    parser.add_argument(
+        "days", nargs="*", type=day_spec, help='"YYYY" or "YYYY/DD" (default: all)'
+    )
+    parser.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=0.5,
+        help="seconds between looks for changes (default: 0.5)",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=60,
+        help="seconds to give a day before restarting the worker (default: 60)",
+    )
+    parser.set_defaults(func=cmd_watch)